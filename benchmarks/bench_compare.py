@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Comparison Benchmark
+Times the single-pass comparison core (utils/comparison.py) against the previous compare_data
+implementation on synthetic entities with thousands of hits per source, and checks that both
+produce the same result.
+
+Usage:
+    python benchmarks/bench_compare.py --hits 5000 --sources 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.comparison import compare_entity
+from utils.search_record import SearchRecord
+
+SOURCES = ["col", "rights", "mex", "watch", "soe", "pep", "sanction", "icij"]
+
+
+def reference_compare_data(entity_name, baseline_data, current_data):
+    """compare_data as it was before utils/comparison.py: per-source dicts, three copies of the name composition"""
+    comparison_result = {
+        "entity_name": entity_name,
+        "test_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "sources": {}
+    }
+
+    # Get all unique sources from both datasets
+    all_sources = set(baseline_data.keys()) | set(current_data.keys())
+
+    for source in all_sources:
+        baseline_records = baseline_data.get(source, [])
+        current_records = current_data.get(source, [])
+
+        # Create lookup dictionaries by recid
+        baseline_by_id = {record["recid"]: record for record in baseline_records}
+        current_by_id = {record["recid"]: record for record in current_records}
+
+        matches = []
+        missing_records = []
+        new_records = []
+
+        # Find matches and missing records
+        for recid, baseline_record in baseline_by_id.items():
+            if recid in current_by_id:
+                current_record = current_by_id[recid]
+
+                # Compare records for changes
+                changes = {}
+                for key in ["Full_Name", "Other_Names", "First_Name", "Last_Name"]:
+                    if baseline_record.get(key) != current_record.get(key):
+                        changes[key] = {
+                            "old": baseline_record.get(key),
+                            "new": current_record.get(key)
+                        }
+
+                # Construct full name from first and last name if Full_Name is empty
+                full_name = baseline_record.get("Full_Name", "")
+                if not full_name:
+                    first_name = baseline_record.get("First_Name", "")
+                    last_name = baseline_record.get("Last_Name", "")
+                    if first_name or last_name:
+                        full_name = f"{first_name} {last_name}".strip()
+
+                # Construct other names including AltScript
+                other_names_parts = []
+                if baseline_record.get("Other_Names"):
+                    other_names_parts.append(baseline_record.get("Other_Names"))
+                if baseline_record.get("otherNames"):
+                    other_names_parts.append(baseline_record.get("otherNames"))
+                if baseline_record.get("AltScript"):
+                    other_names_parts.append(baseline_record.get("AltScript"))
+                other_names = "; ".join(filter(None, other_names_parts))
+
+                matches.append({
+                    "recid": recid,
+                    "ID": baseline_record.get("ID", ""),
+                    "Full_Name": full_name,
+                    "Other_Names": other_names,
+                    "First_Name": baseline_record.get("First_Name", ""),
+                    "Last_Name": baseline_record.get("Last_Name", ""),
+                    "AltScript": baseline_record.get("AltScript", ""),
+                    "status": "exact_match" if not changes else "modified",
+                    "changes": changes
+                })
+            else:
+                # Record missing in current
+                # Construct full name from first and last name if Full_Name is empty
+                full_name = baseline_record.get("Full_Name", "")
+                if not full_name:
+                    first_name = baseline_record.get("First_Name", "")
+                    last_name = baseline_record.get("Last_Name", "")
+                    if first_name or last_name:
+                        full_name = f"{first_name} {last_name}".strip()
+
+                # Construct other names including AltScript
+                other_names_parts = []
+                if baseline_record.get("Other_Names"):
+                    other_names_parts.append(baseline_record.get("Other_Names"))
+                if baseline_record.get("otherNames"):
+                    other_names_parts.append(baseline_record.get("otherNames"))
+                if baseline_record.get("AltScript"):
+                    other_names_parts.append(baseline_record.get("AltScript"))
+                other_names = "; ".join(filter(None, other_names_parts))
+
+                missing_records.append({
+                    "recid": recid,
+                    "ID": baseline_record.get("ID", ""),
+                    "Full_Name": full_name,
+                    "Other_Names": other_names,
+                    "First_Name": baseline_record.get("First_Name", ""),
+                    "Last_Name": baseline_record.get("Last_Name", ""),
+                    "AltScript": baseline_record.get("AltScript", "")
+                })
+
+        # Find new records
+        for recid, current_record in current_by_id.items():
+            if recid not in baseline_by_id:
+                # Construct full name from first and last name if Full_Name is empty
+                full_name = current_record.get("Full_Name", "")
+                if not full_name:
+                    first_name = current_record.get("First_Name", "")
+                    last_name = current_record.get("Last_Name", "")
+                    if first_name or last_name:
+                        full_name = f"{first_name} {last_name}".strip()
+
+                # Construct other names including AltScript
+                other_names_parts = []
+                if current_record.get("Other_Names"):
+                    other_names_parts.append(current_record.get("Other_Names"))
+                if current_record.get("otherNames"):
+                    other_names_parts.append(current_record.get("otherNames"))
+                if current_record.get("AltScript"):
+                    other_names_parts.append(current_record.get("AltScript"))
+                other_names = "; ".join(filter(None, other_names_parts))
+
+                new_records.append({
+                    "recid": recid,
+                    "ID": current_record.get("ID", ""),
+                    "Full_Name": full_name,
+                    "Other_Names": other_names,
+                    "First_Name": current_record.get("First_Name", ""),
+                    "Last_Name": current_record.get("Last_Name", ""),
+                    "AltScript": current_record.get("AltScript", "")
+                })
+
+        comparison_result["sources"][source] = {
+            "baseline_count": len(baseline_records),
+            "current_count": len(current_records),
+            "matches": matches,
+            "missing_records": missing_records,
+            "new_records": new_records,
+            "summary": {
+                "exact_matches": len([m for m in matches if m["status"] == "exact_match"]),
+                "modified_records": len([m for m in matches if m["status"] == "modified"]),
+                "missing_records": len(missing_records),
+                "new_records": len(new_records)
+            }
+        }
+
+    return comparison_result
+
+
+def make_record(rnd, recid):
+    """Build a normalized record; some use the First/Last name fallback or carry other names"""
+    if rnd.random() < 0.8:
+        return SearchRecord(recid=recid, ID=str(recid), Full_Name=f"NAME {recid}",
+                            Other_Names="ALIAS" if rnd.random() < 0.3 else "", RecType="PEP")
+    return SearchRecord(recid=recid, ID=str(recid), First_Name=f"FIRST {recid}", Last_Name="LAST", RecType="PEP")
+
+
+def make_entity(hits, sources, overlap, modified, seed):
+    """Build baseline and current data where `overlap` of the baseline recids are also current"""
+    rnd = random.Random(seed)
+    baseline_data, current_data = {}, {}
+    for source in SOURCES[:sources]:
+        recids = rnd.sample(range(1, hits * 10), hits)
+        baseline = [make_record(rnd, recid) for recid in recids]
+        current = []
+        for record in baseline:
+            if rnd.random() < overlap:
+                current.append(make_record(rnd, record.recid) if rnd.random() < modified else record)
+        current += [make_record(rnd, hits * 10 + i) for i in range(hits - len(current))]
+        rnd.shuffle(current)
+        baseline_data[source], current_data[source] = baseline, current
+    return baseline_data, current_data
+
+
+def time_best(func, repeat):
+    """Best wall time of repeat runs, and the last result"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the single-pass comparison core with the previous compare_data")
+    parser.add_argument("--hits", type=int, default=5000, help="Records per source on each side")
+    parser.add_argument("--sources", type=int, default=len(SOURCES), help="Number of sources")
+    parser.add_argument("--overlap", type=float, default=0.9, help="Share of baseline records also in current")
+    parser.add_argument("--modified", type=float, default=0.1, help="Share of matched records with changed names")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per implementation (best is reported)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the synthetic data")
+    args = parser.parse_args()
+
+    baseline_data, current_data = make_entity(args.hits, args.sources, args.overlap, args.modified, args.seed)
+    print(f"🔬 {args.sources} sources x {args.hits} records per side")
+
+    reference_seconds, reference = time_best(
+        lambda: reference_compare_data("term", baseline_data, current_data), args.repeat)
+    single_pass_seconds, result = time_best(lambda: compare_entity("term", baseline_data, current_data), args.repeat)
+
+    summary = {source: result["sources"][source]["summary"] for source in result["sources"]}
+    print("\n📈 Results:")
+    print(f"  Matches per source: {summary[SOURCES[0]]}")
+    print(f"  Previous compare_data: {reference_seconds * 1000:.1f} ms")
+    print(f"  Single-pass core:      {single_pass_seconds * 1000:.1f} ms")
+    print(f"  Speedup: {reference_seconds / single_pass_seconds:.2f}x")
+    print(f"  Identical result: {'✅' if reference['sources'] == result['sources'] else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+CPU Stage Benchmark
+Measures entities per second for the parse + normalize + compare work of synthetic entities
+run in the pipeline threads (one GIL) and in the CpuStage worker processes, and the size of
+the packed results compared with pickling the records and comparison results.
+
+Usage:
+    python benchmarks/bench_cpu_stage.py --entities 200 --hits 500 --workers 1,2,4,8,16
+"""
+
+import argparse
+import json
+import marshal
+import os
+import pickle
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "testcases"))
+from utils.cpu_stage import CpuStage, unpack_source_data
+from utils.json_backend import JsonBackend
+from utils.schema_router import SchemaRouter
+from bench_json_backend import make_response
+import excel_driven_regression_test as harness_module
+
+SOURCES = ["col", "rights", "mex", "watch", "soe", "pep", "sanction", "icij"]
+
+
+def make_baseline(body, overlap, seed):
+    """Build the raw GDC response of an entity from `overlap` of the hits in its search response"""
+    rnd = random.Random(seed)
+    preview = {source: [] for source in SOURCES}
+    for hit in json.loads(body)["results"]:
+        if rnd.random() < overlap:
+            record = dict(hit["_source"])
+            if rnd.random() < 0.1:
+                record["Full_Name"] += " JR"
+            preview[SOURCES[rnd.randrange(len(SOURCES))]].append(record)
+    return json.dumps({"Args": [{"nameSearch": {"Preview": preview}}]})
+
+
+def run_threads(harness, entities):
+    """Parse, normalize and compare every entity in this process"""
+    for name, gdc_response, body in entities:
+        baseline_data = harness.parse_gdc_response(harness.json_backend.loads(gdc_response), name)
+        current_data = harness.transform_opensearch_response(harness.json_backend.decode_response(body))
+        harness.comparison_passed(harness.compare_data(name, baseline_data, current_data))
+
+
+def run_processes(cpu_stage, entities, threads):
+    """Hand every entity to the worker processes from `threads` compare threads, as the pipeline does"""
+    def process(entity):
+        name, gdc_response, body = entity
+        result = cpu_stage.result(cpu_stage.submit(harness_module.process_entity_cpu, (name, gdc_response, None, body, None)))
+        return unpack_source_data(result[0]), unpack_source_data(result[1]), result[2]
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(process, entities))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare in-thread and multiprocess parse + normalize + compare")
+    parser.add_argument("--entities", type=int, default=200, help="Synthetic entities")
+    parser.add_argument("--hits", type=int, default=500, help="Hits per search response")
+    parser.add_argument("--extra-fields", type=int, default=10, help="Unused _source fields per hit")
+    parser.add_argument("--overlap", type=float, default=0.9, help="Share of hits also in the baseline")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker process counts")
+    parser.add_argument("--json-backend", default="auto", help="auto, msgspec, orjson or json")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the synthetic data")
+    args = parser.parse_args()
+
+    entities = []
+    for i in range(args.entities):
+        body = make_response(args.hits, args.extra_fields, args.seed + i)
+        entities.append((f"term {i}", make_baseline(body, args.overlap, args.seed + i), body))
+
+    harness = harness_module.ExcelDrivenRegressionTest.__new__(harness_module.ExcelDrivenRegressionTest)
+    harness.json_backend = JsonBackend(args.json_backend)
+    harness.schema_router = SchemaRouter()
+    harness_module.configure_logging("warning")
+    print(f"🔬 {args.entities} entities x {args.hits} hits, {harness.json_backend.name} decoder, {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    run_threads(harness, entities)
+    thread_seconds = time.perf_counter() - start
+    print(f"\n{'Mode':<14} {'Entities/s':>12} {'Speedup':>9} {'Sent/entity':>13} {'Received/entity':>17}")
+    print(f"{'threads':<14} {args.entities / thread_seconds:>12.1f} {1:>8.2f}x {'-':>13} {'-':>17}")
+
+    for workers in [int(value) for value in args.workers.split(",")]:
+        with CpuStage(workers, initializer=harness_module.init_cpu_worker,
+                      initargs=(harness.json_backend.name, harness.schema_router, "warning", "text", None)) as cpu_stage:
+            start = time.perf_counter()
+            results = run_processes(cpu_stage, entities, workers)
+            seconds = time.perf_counter() - start
+            stats = cpu_stage.get_stats()
+        print(f"{f'{workers} processes':<14} {args.entities / seconds:>12.1f} {thread_seconds / seconds:>8.2f}x "
+              f"{stats['bytes_sent'] / args.entities / 1024:>10.1f} KB {stats['bytes_received'] / args.entities / 1024:>14.1f} KB")
+
+    # The parent still decodes and unpacks every result under the GIL, which bounds the speedup
+    name, gdc_response, body = entities[0]
+    task = harness.process_entity_cpu(name, gdc_response, None, body, None)
+    packed = marshal.dumps(task)
+    start = time.perf_counter()
+    for _ in range(20):
+        result = marshal.loads(packed)
+        unpack_source_data(result[0]), unpack_source_data(result[1])
+    unpack_seconds = (time.perf_counter() - start) / 20
+    print(f"\nParent-side decode + unpack: {unpack_seconds * 1000:.2f} ms per entity "
+          f"(in-thread work {thread_seconds / args.entities * 1000:.2f} ms), "
+          f"speedup ceiling ~{thread_seconds / args.entities / unpack_seconds:.0f}x")
+
+    # What the same results would cost as pickled records and comparison results
+    baseline_data, current_data, _ = results[0]
+    comparison_result = harness.compare_data(name, baseline_data, current_data)
+    print(f"Pickled records + comparison result of one entity: "
+          f"{len(pickle.dumps((baseline_data, current_data, comparison_result))) / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Excel Writer Benchmark
+Compares wall time and peak RSS of the Excel report backends (openpyxl, xlsxwriter with
+constant_memory, split workbooks written in parallel processes) on synthetic data.
+
+Each configuration runs in its own subprocess so peak RSS is not shared between runs;
+the split configurations include the RSS of their worker processes.
+
+Usage:
+    python benchmarks/bench_excel_writers.py --terms 10000 --records 5
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CONFIGURATIONS = [
+    ("openpyxl", 1, 1),
+    ("xlsxwriter", 1, 1),
+    ("openpyxl", 4, 4),
+    ("xlsxwriter", 4, 4),
+]
+
+
+def peak_rss_mb(who):
+    """Peak resident set size in MB (ru_maxrss is KB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_one(args):
+    """Write one report configuration and print its measurements as JSON"""
+    from utils.report_generator import ReportGenerator
+    from bench_unified_report import make_comparison_data
+
+    report_generator = ReportGenerator(args.output, excel_engine=args.engine,
+                                       excel_workbooks=args.workbooks, excel_workers=args.workers)
+    df = report_generator.build_unified_dataframe(make_comparison_data(args.terms, args.records, 0.7, args.seed))
+    df = df.sort_values(["Test Key", "OpenSearch Schema", "OpenSearch ID"])
+    baseline_mb = peak_rss_mb(resource.RUSAGE_SELF)
+
+    filename = os.path.join(args.output, f"bench_{args.engine}_{args.workbooks}x{args.workers}.xlsx")
+    start = time.perf_counter()
+    report_generator.write_excel_report(df, filename)
+    seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        "rows": len(df),
+        "engine": report_generator.excel_engine,
+        "seconds": seconds,
+        "baseline_mb": baseline_mb,
+        "peak_mb": peak_rss_mb(resource.RUSAGE_SELF),
+        "worker_peak_mb": peak_rss_mb(resource.RUSAGE_CHILDREN)
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Excel report backends on synthetic data")
+    parser.add_argument("--terms", type=int, default=10000, help="Number of search terms (one sheet each)")
+    parser.add_argument("--records", type=int, default=5, help="Maximum OpenSearch records per term and source")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the synthetic data")
+    parser.add_argument("--output", default=None, help="Directory for the generated workbooks (default: temp dir)")
+    parser.add_argument("--run-one", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--engine", default="openpyxl", help=argparse.SUPPRESS)
+    parser.add_argument("--workbooks", type=int, default=1, help=argparse.SUPPRESS)
+    parser.add_argument("--workers", type=int, default=1, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    args.output = args.output or tempfile.mkdtemp(prefix="bench_excel_")
+    os.makedirs(args.output, exist_ok=True)
+
+    if args.run_one:
+        run_one(args)
+        return
+
+    print(f"🔬 Writing {args.terms} synthetic terms (one sheet each) with each backend, CPUs: {os.cpu_count()}")
+    print(f"\n{'Backend':<14} {'Workbooks':>9} {'Workers':>8} {'Wall':>9} {'Data RSS':>10} {'Peak RSS':>10} {'Workers RSS':>12}")
+    for engine, workbooks, workers in CONFIGURATIONS:
+        command = [sys.executable, os.path.abspath(__file__), "--run-one", "--engine", engine,
+                   "--workbooks", str(workbooks), "--workers", str(workers), "--terms", str(args.terms),
+                   "--records", str(args.records), "--seed", str(args.seed), "--output", args.output]
+        completed = subprocess.run(command, capture_output=True, text=True)
+        if completed.returncode != 0:
+            print(f"{engine:<14} failed: {completed.stderr.strip().splitlines()[-1]}")
+            continue
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        workers_rss = f"{result['worker_peak_mb']:.0f} MB" if workers > 1 else "-"
+        print(f"{result['engine']:<14} {workbooks:>9} {workers:>8} {result['seconds']:>8.2f}s "
+              f"{result['baseline_mb']:>7.0f} MB {result['peak_mb']:>7.0f} MB {workers_rss:>12}")
+    print(f"\n📁 Workbooks written to {args.output}")
+    print("   Data RSS is the peak before writing (synthetic data loaded); Workers RSS is the largest worker process")
+
+
+if __name__ == "__main__":
+    main()
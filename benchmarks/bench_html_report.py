@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+HTML Report Benchmark
+Compares the server-rendered HTML report with the virtualized report (JSON payload,
+plain or gzip+base64) on synthetic data: generation time, file size, and the number
+of elements and parse time of the static markup as a proxy for browser open cost.
+
+Browser open time itself cannot be measured from Python; open the generated files
+in a browser (DevTools > Performance) for that.
+
+Usage:
+    python benchmarks/bench_html_report.py --terms 2000 --records 40
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from html.parser import HTMLParser
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.html_report_generator import HTMLReportGenerator
+from utils.report_generator import ReportGenerator
+from bench_unified_report import make_comparison_data
+
+
+class ElementCounter(HTMLParser):
+    """Count start tags, i.e. the DOM elements a browser creates from the static markup"""
+
+    def __init__(self):
+        super().__init__()
+        self.elements = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.elements += 1
+
+
+def measure(label, generator, df, filename):
+    """Generate one report and print its size, generation time and markup cost"""
+    start = time.perf_counter()
+    generator.generate_unified_comparison_report(df, filename)
+    generate_seconds = time.perf_counter() - start
+
+    with open(filename, encoding="utf-8") as f:
+        markup = f.read()
+    counter = ElementCounter()
+    start = time.perf_counter()
+    counter.feed(markup)
+    parse_seconds = time.perf_counter() - start
+
+    size_mb = os.path.getsize(filename) / (1024 * 1024)
+    print(f"  {label:<24} {generate_seconds:8.2f} s {size_mb:10.2f} MB {counter.elements:12d} {parse_seconds:10.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the server-rendered and virtualized HTML reports")
+    parser.add_argument("--terms", type=int, default=2000, help="Number of search terms")
+    parser.add_argument("--records", type=int, default=40, help="Maximum OpenSearch records per term and source")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the synthetic data")
+    parser.add_argument("--output", default=None, help="Directory for the generated reports (default: temp dir)")
+    args = parser.parse_args()
+
+    output_directory = args.output or tempfile.mkdtemp(prefix="bench_html_")
+    os.makedirs(output_directory, exist_ok=True)
+
+    print(f"🔬 Building {args.terms} synthetic terms (up to {args.records} records per source)")
+    report_generator = ReportGenerator(output_directory)
+    df = report_generator.build_unified_dataframe(make_comparison_data(args.terms, args.records, 0.7, args.seed))
+    df = df.sort_values(["Test Key", "OpenSearch Schema", "OpenSearch ID"])
+    print(f"  Unified rows: {len(df)}")
+
+    print("\n📈 Results:")
+    print(f"  {'Renderer':<24} {'Generate':>10} {'File size':>13} {'Elements':>12} {'Parse':>12}")
+    measure("single page", HTMLReportGenerator("single"), df, os.path.join(output_directory, "single.html"))
+    measure("virtual (JSON)", HTMLReportGenerator("virtual", compress_payload=False), df,
+            os.path.join(output_directory, "virtual_json.html"))
+    measure("virtual (gzip+base64)", HTMLReportGenerator("virtual"), df,
+            os.path.join(output_directory, "virtual_gzip.html"))
+    print(f"\n📁 Reports written to {output_directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+HTTP Session Benchmark
+Measures the per-request handshake latency removed by the pooled SearchApiClient
+compared with calling requests.post for every entity.
+
+Usage:
+    python benchmarks/bench_http_session.py --requests 50 --query "national bank of dubai"
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import config
+from utils.http_client import SearchApiClient
+
+
+def time_requests(send, count):
+    """Call send() count times and return the latencies in milliseconds"""
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        try:
+            send()
+        except requests.exceptions.RequestException as e:
+            print(f"  Request failed: {e}")
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def summarize(label, latencies):
+    """Print mean and p50/p90 for a list of latencies"""
+    if not latencies:
+        print(f"  {label}: no successful requests")
+        return 0.0
+    ordered = sorted(latencies)
+    p90 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))]
+    mean = statistics.mean(latencies)
+    print(f"  {label}: mean {mean:.1f} ms, p50 {statistics.median(latencies):.1f} ms, p90 {p90:.1f} ms")
+    return mean
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare unpooled requests.post against the pooled API client")
+    parser.add_argument("--url", default=None, help="Search endpoint (defaults to config)")
+    parser.add_argument("--requests", type=int, default=20, help="Requests per mode")
+    parser.add_argument("--query", default="Test Entity", help="Search term to send")
+    parser.add_argument("--http2", action="store_true", help="Use HTTP/2 for the pooled client")
+    args = parser.parse_args()
+
+    config.load_from_file(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.json"))
+    api_config = dict(config.api_config)
+    if args.url:
+        api_config["url"] = args.url
+    api_config["http2"] = args.http2 or api_config.get("http2", False)
+
+    payload = config.get_search_payload(args.query, "E")
+    headers = config.get_api_headers()
+
+    print(f"🔬 Benchmarking {args.requests} requests against {api_config['url']}")
+
+    unpooled = time_requests(
+        lambda: requests.post(api_config["url"], json=payload, headers=headers,
+                              timeout=api_config["timeout"]).raise_for_status(),
+        args.requests
+    )
+
+    client = SearchApiClient(api_config, headers)
+    pooled = time_requests(lambda: client.post(payload), args.requests)
+    stats = client.get_stats()
+    client.close()
+
+    print("\n📈 Results:")
+    unpooled_mean = summarize("requests.post (new connection each call)", unpooled)
+    pooled_mean = summarize("SearchApiClient (keep-alive pool)", pooled)
+    print(f"  Connections opened by pooled client: {stats['connections_opened']} for {stats['requests']} requests")
+    if unpooled and pooled:
+        print(f"  Handshake latency removed per request: {unpooled_mean - pooled_mean:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+JSON Backend Benchmark
+Measures decode + normalize cost per 1,000 hits of a synthetic search response for every
+installed JsonBackend: generic decoding followed by the dict-based normalize_api_record walk,
+and (msgspec) typed decoding straight into SearchHit structs.
+
+Usage:
+    python benchmarks/bench_json_backend.py --hits 1000 --extra-fields 30
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "testcases"))
+from utils.json_backend import JsonBackend, msgspec, orjson
+from utils.schema_router import SchemaRouter
+from utils.stub_server import STUB_INDICES
+from excel_driven_regression_test import ExcelDrivenRegressionTest
+
+
+def make_response(hits, extra_fields, seed):
+    """Build a search response body whose hits carry extra_fields fields normalization never reads"""
+    rnd = random.Random(seed)
+    results = []
+    for i in range(hits):
+        index_name, id_prefix = STUB_INDICES[rnd.choice(list(STUB_INDICES))]
+        record_id = f"{id_prefix}{rnd.randint(0, 99999999):08d}"
+        source = {
+            "recid": rnd.randint(1, 9999999),
+            "ID": record_id,
+            "First_Name": f"FIRST{i}",
+            "Last_Name": f"LAST{i}",
+            "Full_Name": f"FIRST{i} LAST{i}",
+            "Other_Names": "ALIAS ONE; ALIAS TWO",
+            "AltScript": "",
+            "RecType": "ICIJ" if "icij" in index_name else "PEP"
+        }
+        for field in range(extra_fields):
+            source[f"Field_{field}"] = (
+                [{"Address": f"{rnd.randint(1, 999)} Main St", "Country": "AE"}] if field % 5 == 0
+                else f"value {rnd.randint(0, 10 ** 6)} of field {field}"
+            )
+        results.append({"_index": index_name, "_id": record_id, "_score": rnd.random() * 20, "_source": source})
+    return json.dumps({"results": results}).encode("utf-8")
+
+
+def time_best(func, repeat):
+    """Best wall time of repeat runs, and the last result"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare JSON backends on decode + normalize of a search response")
+    parser.add_argument("--hits", type=int, default=1000, help="Hits in the synthetic response")
+    parser.add_argument("--extra-fields", type=int, default=30, help="Unused _source fields per hit")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per mode (best is reported)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the synthetic data")
+    args = parser.parse_args()
+
+    body = make_response(args.hits, args.extra_fields, args.seed)
+    # transform_opensearch_response and the normalizers use no instance state
+    harness = ExcelDrivenRegressionTest.__new__(ExcelDrivenRegressionTest)
+    harness.schema_router = SchemaRouter()
+
+    modes = [("json", JsonBackend("json"), False)]
+    if orjson is not None:
+        modes.append(("orjson", JsonBackend("orjson"), False))
+    if msgspec is not None:
+        modes.append(("msgspec", JsonBackend("msgspec"), False))
+        modes.append(("msgspec typed", JsonBackend("msgspec"), True))
+
+    print(f"🔬 {args.hits} hits with {args.extra_fields} unused fields each ({len(body) / 1024:.0f} KB)")
+    print(f"\n{'Backend':<14} {'Decode':>12} {'Normalize':>12} {'Total':>12}   per 1,000 hits")
+    reference = None
+    for label, backend, typed in modes:
+        decode_seconds, decoded = time_best(lambda: backend.decode_response(body, typed=typed), args.repeat)
+        normalize_seconds, transformed = time_best(lambda: harness.transform_opensearch_response(decoded), args.repeat)
+        total_seconds, _ = time_best(
+            lambda: harness.transform_opensearch_response(backend.decode_response(body, typed=typed)), args.repeat
+        )
+        scale = 1000 / args.hits * 1000
+        identical = reference is None or transformed == reference
+        reference = reference or transformed
+        print(f"{label:<14} {decode_seconds * scale:>9.2f} ms {normalize_seconds * scale:>9.2f} ms "
+              f"{total_seconds * scale:>9.2f} ms   {'✅' if identical else '❌ differs from json'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Benchmark
+Runs concurrent workers against a local server that admits a fixed number of requests per
+second and answers the rest with 429 + Retry-After, like an API Gateway usage plan.
+Compares the old fixed-delay retry loop with the shared RateLimiter (token bucket, AIMD
+concurrency, jittered exponential backoff).
+
+Usage:
+    python benchmarks/bench_rate_limiter.py --server-rps 40 --workers 16 --requests 200
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_client import SearchApiClient
+from utils.rate_limiter import RateLimiter, retry_after_seconds
+
+
+class ThrottlingServer:
+    """Local endpoint with a server-side token bucket; over-limit requests get 429 + Retry-After: 1"""
+
+    def __init__(self, rate_per_second, latency_ms):
+        self.rate_per_second = rate_per_second
+        self.latency = latency_ms / 1000
+        self.tokens = float(rate_per_second)
+        self.refilled_at = time.monotonic()
+        self.accepted = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/search"
+
+    def admit(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate_per_second, self.tokens + (now - self.refilled_at) * self.rate_per_second)
+            self.refilled_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self.accepted += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def reset(self):
+        with self.lock:
+            self.tokens = float(self.rate_per_second)
+            self.refilled_at = time.monotonic()
+            self.accepted = 0
+            self.rejected = 0
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections open between requests like the real API (Content-Length is always sent);
+            # without Nagle, the separately written headers and body do not wait on a delayed ACK
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if server.admit():
+                    time.sleep(server.latency)
+                    body, status = b'{"results": []}', 200
+                else:
+                    body, status = b'{"message": "Too Many Requests"}', 429
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if status == 429:
+                    self.send_header("Retry-After", "1")
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+def run_mode(server, args, rate_limiter):
+    """Send args.requests requests from args.workers threads, retrying each until it succeeds"""
+    client = SearchApiClient({"url": server.url, "timeout": 30}, {"Content-Type": "application/json"},
+                             pool_size=args.workers, rate_limiter=rate_limiter)
+    failures = []
+
+    def send(number):
+        for attempt in range(args.max_retries):
+            try:
+                client.post({"query": f"term {number}"})
+                return
+            except requests.exceptions.RequestException as e:
+                if rate_limiter is None:
+                    time.sleep(args.retry_delay)
+                else:
+                    time.sleep(rate_limiter.backoff_delay(attempt, retry_after_seconds(getattr(e, "response", None))))
+        failures.append(number)
+
+    server.reset()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        list(executor.map(send, range(args.requests)))
+    seconds = time.perf_counter() - start
+    client.close()
+    return seconds, server.accepted, server.rejected, len(failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare fixed-delay retries with the adaptive rate limiter")
+    parser.add_argument("--server-rps", type=float, default=40, help="Requests per second the server admits")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Server latency of an admitted request")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent client threads")
+    parser.add_argument("--requests", type=int, default=200, help="Requests to complete per mode")
+    parser.add_argument("--retry-delay", type=float, default=1.0, help="Fixed retry delay / backoff base in seconds")
+    parser.add_argument("--max-retries", type=int, default=8, help="Attempts per request before giving up")
+    args = parser.parse_args()
+
+    server = ThrottlingServer(args.server_rps, args.latency_ms)
+    modes = [
+        ("fixed delay", None),
+        ("AIMD only", RateLimiter(max_concurrency=args.workers, backoff_base=args.retry_delay)),
+        ("bucket + AIMD", RateLimiter(rate_per_second=args.server_rps * 0.95, max_concurrency=args.workers,
+                                      backoff_base=args.retry_delay))
+    ]
+
+    print(f"🔬 {args.requests} requests from {args.workers} workers against a server admitting {args.server_rps:g} req/s")
+    print(f"\n{'Mode':<14} {'Wall':>8} {'Throughput':>12} {'429s':>6} {'Failed':>7} {'Final limit':>12}")
+    for label, rate_limiter in modes:
+        seconds, accepted, rejected, failed = run_mode(server, args, rate_limiter)
+        limit = f"{rate_limiter.concurrency_limit:.1f}" if rate_limiter is not None else "-"
+        print(f"{label:<14} {seconds:>7.2f}s {accepted / seconds:>8.1f} r/s {rejected:>6} {failed:>7} {limit:>12}")
+    server.httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
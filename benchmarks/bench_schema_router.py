@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Schema Router Benchmark
+Checks SchemaRouter against a corpus of index names with their expected schema, lists the
+names the previous substring chain routed differently, and times both on a stream of hits.
+Exits with status 1 if any corpus name routes to the wrong schema.
+
+Usage:
+    python benchmarks/bench_schema_router.py --hits 200000
+    python benchmarks/bench_schema_router.py --corpus index_names.tsv
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.schema_router import SchemaRouter
+
+# (index name or alias, expected schema) - the stub indices, rollover / versioned / dated
+# variants of them, aliases, and names the substring chain could only route by branch order
+CORPUS = [
+    ("gdc-pep", "pep"), ("gdc-watch", "watch"), ("gdc-soe", "soe"), ("gdc-rights", "rights"),
+    ("gdc-icij", "icij"), ("gdc-sanction", "sanction"), ("gdc-mex", "mex"), ("gdc-col", "col"),
+    ("gdc-media", "media"), ("gdc-ofac", "ofac"),
+    ("GDC-PEP", "pep"), ("gdc-pep-000001", "pep"), ("gdc-pep-v2", "pep"), ("gdc_pep_2024.06.01", "pep"),
+    ("gdc-watch-000003", "watch"), ("gdc-watch-v3-reindex", "watch"), ("gdc-sanctions", "sanction"),
+    ("gdc_sanctions_v2", "sanction"), ("gdc-icij-offshore-leaks", "icij"), ("gdc-mex-sat69b", "mex"),
+    ("gdc-rights-human", "rights"), ("gdc-media-adverse-2024", "media"), ("gdc-ofac-sdn", "ofac"),
+    ("gdc-col-v1", "col"), ("peps", "pep"), ("sanctions-lists", "sanction"),
+    # One schema token, but an earlier branch's keyword is also inside the name
+    ("gdc-soe-watchlist", "soe"), ("gdc-mex-pepfar", "mex"),
+    ("gdc-rights-watchdog", "rights"), ("gdc-media-icijleaks", "media"), ("gdc-col-sanctioned", "col"),
+    ("gdc-soe-complex", "soe"), ("gdc-ofac-peppol", "ofac"),
+    # No single schema token: the first keyword contained in the name, as before
+    ("gdc-col-peps-xref", "pep"), ("gdcpep", "pep"), ("watchlist-main", "watch"), ("soeindex", "soe"),
+    ("colombia-entities", "col"),
+]
+
+
+def reference_source_from_indicators(index_name, record_id):
+    """source_from_indicators as it was before SchemaRouter: a substring chain and startswith fallbacks"""
+    if index_name is not None:
+        index_name = index_name.lower()
+        if "pep" in index_name:
+            return "pep"
+        elif "watch" in index_name:
+            return "watch"
+        elif "sanction" in index_name:
+            return "sanction"
+        elif "icij" in index_name:
+            return "icij"
+        elif "mex" in index_name:
+            return "mex"
+        elif "soe" in index_name:
+            return "soe"
+        elif "rights" in index_name:
+            return "rights"
+        elif "col" in index_name:
+            return "col"
+        elif "media" in index_name:
+            return "media"
+        elif "ofac" in index_name:
+            return "ofac"
+    if record_id.startswith("101"):
+        return "pep"
+    elif record_id.startswith("202"):
+        return "watch"
+    elif record_id.startswith("901"):
+        return "soe"
+    elif record_id.startswith("307"):
+        return "rights"
+    elif record_id.startswith("801"):
+        return "icij"
+    return "watch"
+
+
+def load_corpus(path):
+    """Read 'index name<TAB>expected schema' lines"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [tuple(line.rstrip("\n").split("\t")[:2]) for line in f if line.strip() and not line.startswith("#")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time SchemaRouter against the previous substring chain")
+    parser.add_argument("--corpus", help="TSV file of index names and expected schemas (default: built-in corpus)")
+    parser.add_argument("--hits", type=int, default=200000, help="Hits in the timed stream")
+    parser.add_argument("--indices", type=int, default=40, help="Distinct index names in the timed stream")
+    parser.add_argument("--no-index-share", type=float, default=0.1, help="Share of hits without _index (ID fallback)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the timed stream")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else CORPUS
+    router = SchemaRouter()
+
+    print(f"🔬 Routing {len(corpus)} index names")
+    wrong = 0
+    for index_name, expected in corpus:
+        schema, rule = router.describe(index_name)
+        previous = reference_source_from_indicators(index_name, "")
+        if schema != expected:
+            wrong += 1
+            print(f"  ❌ {index_name}: {schema} by {rule}, expected {expected}")
+        elif previous != expected:
+            print(f"  🔀 {index_name}: {schema} by {rule} (previously {previous})")
+    print(f"  {len(corpus) - wrong}/{len(corpus)} routed as expected")
+
+    rnd = random.Random(args.seed)
+    names = [index_name for index_name, _ in corpus]
+    indices = [names[i % len(names)] for i in range(args.indices)]
+    prefixes = list(router.id_prefix_routes) + ["999"]
+    hits = [(None if rnd.random() < args.no_index_share else rnd.choice(indices),
+             f"{rnd.choice(prefixes)}{rnd.randint(0, 99999999):08d}") for _ in range(args.hits)]
+
+    start = time.perf_counter()
+    previous = [reference_source_from_indicators(index_name, record_id) for index_name, record_id in hits]
+    previous_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    routed = [router.route(index_name, record_id) for index_name, record_id in hits]
+    router_seconds = time.perf_counter() - start
+
+    agree = sum(a == b for a, b in zip(previous, routed))
+    print(f"\n📈 {args.hits} hits over {len(set(indices))} index names:")
+    print(f"  Substring chain: {previous_seconds / args.hits * 1e9:.0f} ns per hit")
+    print(f"  SchemaRouter:    {router_seconds / args.hits * 1e9:.0f} ns per hit ({previous_seconds / router_seconds:.2f}x)")
+    print(f"  Same schema for {agree / args.hits:.1%} of hits; memo {router.get_stats()}")
+    sys.exit(1 if wrong else 0)
+
+
+if __name__ == "__main__":
+    main()
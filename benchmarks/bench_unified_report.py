@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Unified Report Benchmark
+Measures how long ReportGenerator takes to build the unified comparison table with the
+per-record Python loops and with the columnar path, on synthetic comparison data.
+
+Usage:
+    python benchmarks/bench_unified_report.py --terms 5000 --records 40
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.report_generator import ReportGenerator, UNIFIED_COLUMNS
+
+SOURCES = ["watch", "pep", "sanction", "icij", "soe", "col"]
+
+
+def make_record(rnd, record_id):
+    """Build a normalized record; a few use the fallback name fields like ICIJ and person records"""
+    record = {"ID": record_id, "recid": rnd.randint(1, 10 ** 6), "Other_Names": "", "AltScript": ""}
+    kind = rnd.random()
+    if kind < 0.85:
+        record["Full_Name"] = f"NAME {record_id}"
+    elif kind < 0.95:
+        record.update(Full_Name="", Entity_Name=f"ENTITY {record_id}")
+    else:
+        record.update(Full_Name="", First_Name=f"FIRST {record_id}", Last_Name="LAST")
+    return record
+
+
+def make_comparison_data(terms, records_per_source, overlap, seed):
+    """Build comparison items where roughly `overlap` of the OpenSearch IDs are also in legacy"""
+    rnd = random.Random(seed)
+    comparison_data = []
+    for term in range(terms):
+        opensearch_results, legacy_results = {}, {}
+        for source in rnd.sample(SOURCES, rnd.randint(1, len(SOURCES))):
+            ids = [str(100000 + rnd.randint(0, records_per_source * 4)) for _ in range(rnd.randint(0, records_per_source))]
+            opensearch_results[source] = [make_record(rnd, record_id) for record_id in ids]
+            legacy_ids = [record_id for record_id in ids if rnd.random() < overlap]
+            legacy_ids += [str(900000 + rnd.randint(0, 50)) for _ in range(rnd.randint(0, 3))]
+            legacy_results[source] = [make_record(rnd, record_id) for record_id in legacy_ids]
+        comparison_data.append({
+            "search_term": f"Search Term {term}",
+            "entity_type": rnd.choice("EP"),
+            "opensearch_results": opensearch_results,
+            "legacy_results": legacy_results
+        })
+    return comparison_data
+
+
+def time_best(func, repeat):
+    """Return (best wall time in seconds, last result) over `repeat` runs"""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the loop-based and columnar unified comparison builders")
+    parser.add_argument("--terms", type=int, default=2000, help="Number of search terms")
+    parser.add_argument("--records", type=int, default=40, help="Maximum OpenSearch records per term and source")
+    parser.add_argument("--overlap", type=float, default=0.7, help="Share of OpenSearch IDs also returned by legacy")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode (best is reported)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the synthetic data")
+    args = parser.parse_args()
+
+    print(f"🔬 Building {args.terms} synthetic terms (up to {args.records} records per source)")
+    comparison_data = make_comparison_data(args.terms, args.records, args.overlap, args.seed)
+
+    report_generator = ReportGenerator(tempfile.mkdtemp(prefix="bench_unified_"))
+
+    def loops():
+        rows = []
+        for comparison_item in comparison_data:
+            rows.extend(report_generator.build_unified_rows(comparison_item))
+        return pd.DataFrame(rows, columns=UNIFIED_COLUMNS)
+
+    loop_seconds, loop_df = time_best(loops, args.repeat)
+    columnar_seconds, columnar_df = time_best(lambda: report_generator.build_unified_dataframe(comparison_data), args.repeat)
+
+    # Row order differs before the report's sort, so compare sorted contents
+    def normalize(df):
+        return df.sort_values(UNIFIED_COLUMNS).astype(str).values.tolist()
+
+    print("\n📈 Results:")
+    print(f"  Unified rows: {len(loop_df)}")
+    print(f"  Per-record loops: {loop_seconds:.3f} s")
+    print(f"  Columnar path:    {columnar_seconds:.3f} s")
+    print(f"  Speedup: {loop_seconds / columnar_seconds:.2f}x")
+    print(f"  Identical rows: {'✅' if normalize(loop_df) == normalize(columnar_df) else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,13 @@ Reads entity data from Excel file and performs regression testing for each entit
 Generates a single unified comparison report between OpenSearch and GDC legacy data.
 """
 
+import argparse
+import contextlib
 import requests
 import json
-import pandas as pd
-from datetime import datetime
+import logging
+import openpyxl
 import os
-import hashlib
 import sys
 import time
 import re
@@ -19,6 +20,26 @@ import re
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import config
 from utils.report_generator import ReportGenerator
+from utils.http_client import SearchApiClient
+from utils.rate_limiter import RateLimiter, retry_after_seconds
+from utils.timing_recorder import TimingRecorder, milliseconds
+from utils.json_backend import JsonBackend, UNSET, is_typed_response
+from utils.search_record import SearchRecord, IcijRecord
+from utils.comparison import compare_entity
+from utils.cpu_stage import CpuStage, pack_source_data, unpack_source_data
+from utils.schema_router import SchemaRouter
+from utils.log import configure_logging, get_logger
+from utils.response_cache import ResponseCache
+from utils.baseline_cache import BaselineCache
+from utils.fingerprint_store import FingerprintStore
+from utils.checkpoint_log import CheckpointLog
+from utils.pipeline import Pipeline
+
+# Per-entity progress and debug detail; run summaries are printed
+log = get_logger("regression")
+
+# Error a CPU worker returns when transform_opensearch_response fails (returns None)
+TRANSFORM_FAILED = "transform failed"
 
 def clean_json_string(json_str):
     """
@@ -48,15 +69,37 @@ def clean_json_string(json_str):
         
         return json_str
     except Exception as e:
-        print(f"Error cleaning JSON string: {e}")
+        log.warning("Error cleaning JSON string: %s", e)
         return json_str
 
 class ExcelDrivenRegressionTest:
-    def __init__(self, excel_path=None):
+    def __init__(self, excel_path=None, cache_mode=None, changed_only=None, resume=None,
+                 log_level=None, log_format=None, log_file=None):
         # Load configuration from parent directory
         config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.json")
         config.load_from_file(config_path)
         
+        # Command line cache mode (--cache/--offline/--refresh) overrides the config file
+        if cache_mode:
+            config.cache_config["enabled"] = True
+            config.cache_config["mode"] = cache_mode
+        
+        # --changed-only overrides test.changed_only
+        if changed_only:
+            config.test_config["changed_only"] = True
+        
+        # --resume overrides test.resume
+        if resume:
+            config.test_config["resume"] = True
+        
+        # --log-level/--quiet, --log-json and --log-file override the test.log_* settings
+        if log_level:
+            config.test_config["log_level"] = log_level
+        if log_format:
+            config.test_config["log_format"] = log_format
+        if log_file:
+            config.test_config["log_file"] = log_file
+        
         # Use provided path or config default
         self.excel_path = excel_path or config.excel_file_path
         
@@ -64,64 +107,277 @@ class ExcelDrivenRegressionTest:
         if not config.validate():
             raise ValueError("Configuration validation failed. Please check your settings.")
         
+        configure_logging(
+            config.test_config["log_level"],
+            config.test_config["log_format"],
+            config.test_config["log_file"] or None
+        )
+        
         # Results storage for unified comparison
         self.unified_comparison_data = []
         
         # Track entities with corrupted JSON
         self.skipped_entities = []
         
+        # Entity counts for the streaming Excel reader (expected count comes from the sheet dimensions)
+        self.loaded_entity_count = 0
+        self.expected_entity_count = None
+        self.baseline_cache = None
+        self.baseline_cache_warm = False
+        
+        # Incremental report writer (only used when report.incremental is enabled)
+        self.report_writer = None
+        
+        # Worker processes for parsing, normalization and comparison (only used when test.cpu_workers > 0)
+        self.cpu_stage = None
+        
         # Initialize report generator
-        self.report_generator = ReportGenerator(config.results_directory)
+        self.report_generator = ReportGenerator(
+            config.results_directory,
+            columnar=config.report_config["columnar"],
+            html_mode=config.report_config["html_mode"],
+            html_shard_rows=config.report_config["html_shard_rows"],
+            html_compress_payload=config.report_config["html_compress_payload"],
+            parquet_directory=config.report_config["parquet_directory"] or None,
+            excel_engine=config.report_config["excel_engine"],
+            excel_workbooks=config.report_config["excel_workbooks"],
+            excel_workers=config.report_config["excel_workers"]
+        )
+        
+        # Shared throttle for all API calls: token bucket, AIMD concurrency and retry backoff
+        self.rate_limiter = RateLimiter(
+            rate_per_second=config.api_config["rate_limit_rps"],
+            burst=config.api_config["rate_limit_burst"],
+            max_concurrency=config.test_config["max_workers"],
+            adaptive=config.api_config["adaptive_concurrency"],
+            backoff_base=config.test_config["retry_delay"],
+            backoff_max=config.test_config["max_retry_delay"]
+        )
+        
+        # Shared keep-alive API client (headers are computed once per run)
+        self.api_client = SearchApiClient(
+            config.api_config,
+            config.get_api_headers(),
+            pool_size=max(config.api_config["pool_size"], config.test_config["max_workers"]),
+            rate_limiter=self.rate_limiter
+        )
+        
+        # JSON decoder for API responses and GDC baselines (msgspec/orjson when installed)
+        self.json_backend = JsonBackend(config.test_config["json_backend"])
+        
+        # Index name / ID prefix -> schema routing, compiled once from test.index_routes and test.id_prefix_routes
+        self.schema_router = SchemaRouter.from_config(config.test_config)
+        
+        # On-disk cache of raw API responses keyed by URL + payload
+        self.response_cache = ResponseCache(
+            config.cache_config["directory"],
+            ttl_seconds=config.cache_config["ttl_seconds"],
+            max_size_mb=config.cache_config["max_size_mb"],
+            mode=config.cache_config["mode"],
+            enabled=config.cache_config["enabled"]
+        )
+        
+        # Per-entity fingerprints of the previous run (used by changed-only runs)
+        self.fingerprint_store = FingerprintStore(
+            config.cache_config["fingerprint_path"],
+            enabled=config.cache_config["fingerprint_enabled"]
+        )
+        
+        # Append-only log of the entities completed in this run (used by --resume)
+        self.checkpoint_log = CheckpointLog(
+            config.cache_config["checkpoint_path"],
+            self.excel_path,
+            enabled=config.cache_config["checkpoint_enabled"]
+        )
+        
+        # Entities whose fetch failed are neither checkpointed nor fingerprinted, so they are tested again
+        self.failed_fetches = set()
+        
+        # Per-entity latency measurements and report phase durations
+        self.timings = TimingRecorder()
     
     def load_entities_from_excel(self):
         """
         Load entity data from Excel file
         """
+        baseline_cache = self.open_baseline_cache()
+        entities = list(self.iter_entities_from_excel(baseline_cache))
+        self.close_baseline_cache(baseline_cache)
+        print(f"Loaded {len(entities)} entities from Excel file")
+        return entities
+    
+    def iter_entities_from_excel(self, baseline_cache=None):
+        """
+        Stream entity data from the Excel file one row at a time.
+        Uses openpyxl read-only mode, so rows are parsed lazily and the workbook is
+        never held in memory as a whole - fetching can start with the first row.
+        Baselines are parsed inline when a baseline cache is given; otherwise the
+        caller parses them (see parse_unit).
+        """
+        self.loaded_entity_count = 0
+        self.expected_entity_count = None
+        
         try:
-            df = pd.read_excel(self.excel_path, sheet_name='Sheet1')
+            workbook = openpyxl.load_workbook(self.excel_path, read_only=True, data_only=True)
+        except Exception as e:
+            log.error("Error loading Excel file: %s", e)
+            return
+        
+        try:
+            sheet = workbook['Sheet1']
+            if sheet.max_row:
+                self.expected_entity_count = sheet.max_row - 1
             
-            # Clean the data - remove NaN rows
-            df = df.dropna(subset=['Name', 'Type'])
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = {name: position for position, name in enumerate(header) if name is not None}
+            name_col = columns['Name']
+            type_col = columns['Type']
+            response_col = columns.get('Current GDC respose')
             
-            entities = []
-            for index, row in df.iterrows():
+            for index, row in enumerate(rows):
+                name = row[name_col] if name_col < len(row) else None
+                entity_type = row[type_col] if type_col < len(row) else None
+                
+                # Clean the data - skip rows without a Name or Type
+                if name is None or entity_type is None:
+                    continue
+                
+                raw_response = row[response_col] if response_col is not None and response_col < len(row) else None
                 entity = {
-                    "name": row['Name'],
-                    "type": row['Type'],  # E for Entity, P for Person
-                    "current_gdc_response": row.get('Current GDC respose', ''),
+                    "name": name,
+                    "type": entity_type,  # E for Entity, P for Person
+                    "current_gdc_response": raw_response if raw_response is not None else '',
                     "row_index": index
                 }
                 
-                # Parse the current GDC response if it's not "No Hits"
-                if entity["current_gdc_response"] and entity["current_gdc_response"] != "No Hits":
-                    try:
-                        if isinstance(entity["current_gdc_response"], str):
-                            # Check if JSON looks corrupted (common patterns)
-                            if any(pattern in entity["current_gdc_response"] for pattern in [
-                                "Invalid \\uXXXX escape", "Unterminated string", "Expecting value"
-                            ]):
-                                print(f"Skipping {entity['name']} - corrupted JSON detected")
-                                self.skipped_entities.append(entity['name'])
-                                entity["baseline_data"] = {}
-                            else:
-                                gdc_data = json.loads(entity["current_gdc_response"])
-                                entity["baseline_data"] = self.parse_gdc_response(gdc_data, entity["name"])
-                        else:
-                            entity["baseline_data"] = {}
-                    except (json.JSONDecodeError, Exception) as e:
-                        print(f"Error parsing GDC response for {entity['name']}: {e}")
+                if baseline_cache is not None:
+                    self.load_entity_baseline(entity, baseline_cache)
+                
+                self.loaded_entity_count += 1
+                yield entity
+                
+        except Exception as e:
+            log.error("Error loading Excel file: %s", e)
+        finally:
+            workbook.close()
+    
+    def open_baseline_cache(self):
+        """
+        Open the cache of parsed baselines from previous runs, keyed by the Excel mtime and row hash
+        """
+        baseline_cache = BaselineCache(
+            config.cache_config["baseline_path"],
+            self.excel_path,
+            enabled=config.cache_config["baseline_enabled"]
+        )
+        self.baseline_cache_warm = baseline_cache.excel_unchanged
+        return baseline_cache
+    
+    def close_baseline_cache(self, baseline_cache):
+        """
+        Persist the baseline cache and report how many rows were reused
+        """
+        baseline_cache.save()
+        if baseline_cache.enabled:
+            print(f"Baseline cache: {baseline_cache.hits} rows reused, {baseline_cache.misses} rows parsed"
+                  f"{' (Excel file unchanged)' if self.baseline_cache_warm else ''}")
+    
+    def load_entity_baseline(self, entity, baseline_cache, defer=False):
+        """
+        Set entity["baseline_data"], reusing the cached parse when the row's raw GDC response is unchanged.
+        With defer, a row that needs parsing keeps baseline_data None and is parsed by a CPU worker process.
+        """
+        row_hash = baseline_cache.row_hash(entity["current_gdc_response"])
+        cached = baseline_cache.get(row_hash)
+        if cached is not None:
+            entity["baseline_data"], skipped = cached
+            if skipped:
+                log.warning("Skipping %s - corrupted JSON detected", entity['name'], extra={"entity": entity['name']})
+                self.skipped_entities.append(entity['name'])
+            return
+        
+        skipped = self.parse_entity_baseline(entity, defer=defer)
+        if entity["baseline_data"] is not None:
+            baseline_cache.put(row_hash, entity["baseline_data"], skipped)
+    
+    def fingerprint_entity(self, entity):
+        """
+        Set entity["fingerprint"] to the (baseline hash, payload hash) of the entity and
+        entity["previous_item"] to a unified comparison item that can be reused unchanged:
+        the checkpointed item when resuming, or in changed-only mode the stored item
+        when both hashes are unchanged and the entity passed last run
+        (entity["previous_passed"] is whether that item's comparison passed).
+        Returns True if the entity does not need to be tested again.
+        """
+        baseline_hash = BaselineCache.row_hash(entity["current_gdc_response"])
+        payload_hash = self.fingerprint_store.hash_value({
+            "url": config.api_config["url"],
+            "payload": config.get_search_payload(entity["name"], entity["type"])
+        })
+        entity["fingerprint"] = (baseline_hash, payload_hash)
+        
+        completed = self.checkpoint_log.get_completed_item(
+            entity["name"], entity["type"], baseline_hash, payload_hash
+        )
+        if completed is not None:
+            entity["previous_item"], entity["previous_passed"] = completed
+            entity["previous_item_source"] = "checkpoint"
+            return True
+        
+        if not config.test_config["changed_only"]:
+            return False
+        entity["previous_item"] = self.fingerprint_store.get_previous_item(
+            entity["name"], entity["type"], baseline_hash, payload_hash
+        )
+        entity["previous_passed"] = True
+        entity["previous_item_source"] = "last passing run"
+        return entity["previous_item"] is not None
+    
+    def comparison_passed(self, comparison_result):
+        """
+        An entity passes when no source has missing, new or modified records
+        """
+        return all(
+            not (source["summary"]["missing_records"] or source["summary"]["new_records"]
+                 or source["summary"]["modified_records"])
+            for source in comparison_result["sources"].values()
+        )
+    
+    def parse_entity_baseline(self, entity, defer=False):
+        """
+        Parse the entity's current GDC response into entity["baseline_data"].
+        With defer, a response that needs JSON parsing is left to a CPU worker process (baseline_data None).
+        Returns True if the row was skipped as corrupted JSON.
+        """
+        # Parse the current GDC response if it's not "No Hits"
+        if entity["current_gdc_response"] and entity["current_gdc_response"] != "No Hits":
+            try:
+                if isinstance(entity["current_gdc_response"], str):
+                    # Check if JSON looks corrupted (common patterns)
+                    if any(pattern in entity["current_gdc_response"] for pattern in [
+                        "Invalid \\uXXXX escape", "Unterminated string", "Expecting value"
+                    ]):
+                        log.warning("Skipping %s - corrupted JSON detected", entity['name'], extra={"entity": entity['name']})
+                        self.skipped_entities.append(entity['name'])
                         entity["baseline_data"] = {}
+                        return True
+                    elif defer:
+                        entity["baseline_data"] = None
+                    else:
+                        gdc_data = self.json_backend.loads(entity["current_gdc_response"])
+                        entity["baseline_data"] = self.parse_gdc_response(gdc_data, entity["name"])
                 else:
                     entity["baseline_data"] = {}
-                
-                entities.append(entity)
-            
-            print(f"Loaded {len(entities)} entities from Excel file")
-            return entities
-            
-        except Exception as e:
-            print(f"Error loading Excel file: {e}")
-            return []
+            except (json.JSONDecodeError, Exception) as e:
+                log.warning("Error parsing GDC response for %s: %s", entity['name'], e, extra={"entity": entity['name']})
+                entity["baseline_data"] = {}
+        else:
+            entity["baseline_data"] = {}
+        
+        return False
     
     def parse_gdc_response(self, gdc_data, entity_name=""):
         """
@@ -146,11 +402,11 @@ class ExcelDrivenRegressionTest:
             if isinstance(gdc_data, str):
                 try:
                     # First attempt: Standard JSON parsing
-                    gdc_data = json.loads(gdc_data)
-                except json.JSONDecodeError as e:
-                    print(f"JSON parsing error for {entity_name}: {e}")
+                    gdc_data = self.json_backend.loads(gdc_data)
+                except ValueError as e:
+                    log.warning("JSON parsing error for %s: %s", entity_name, e, extra={"entity": entity_name})
                     # Skip entities with malformed JSON completely
-                    print(f"Skipping {entity_name} due to corrupted JSON data")
+                    log.warning("Skipping %s due to corrupted JSON data", entity_name, extra={"entity": entity_name})
                     return baseline_data
             
             # Navigate through the GDC response structure
@@ -179,18 +435,18 @@ class ExcelDrivenRegressionTest:
                                         else:
                                             full_name = record.get("Entity_Name", "")
                                     
-                                    normalized_record = {
-                                        "recid": record.get("recid", 0),
-                                        "ID": record.get("ID", ""),
-                                        "First_Name": record.get("First_Name", ""),
-                                        "Last_Name": record.get("Last_Name", ""),
-                                        "Full_Name": full_name,
-                                        "Other_Names": record.get("Other_Names", ""),
-                                        "AltScript": record.get("AltScript", ""),
-                                        "RecType": "ICIJ",  # Special handling for ICIJ
-                                        "Entity_Name": record.get("Entity_Name", ""),  # ICIJ specific field
-                                        "Entity_Type": record.get("Entity_Type", "")   # ICIJ specific field
-                                    }
+                                    normalized_record = IcijRecord(
+                                        recid=record.get("recid", 0),
+                                        ID=record.get("ID", ""),
+                                        First_Name=record.get("First_Name", ""),
+                                        Last_Name=record.get("Last_Name", ""),
+                                        Full_Name=full_name,
+                                        Other_Names=record.get("Other_Names", ""),
+                                        AltScript=record.get("AltScript", ""),
+                                        RecType="ICIJ",  # Special handling for ICIJ
+                                        Entity_Name=record.get("Entity_Name", ""),  # ICIJ specific field
+                                        Entity_Type=record.get("Entity_Type", "")   # ICIJ specific field
+                                    )
                                 else:
                                     # Construct full name if not present
                                     full_name = record.get("Full_Name", "")
@@ -201,87 +457,246 @@ class ExcelDrivenRegressionTest:
                                             full_name = f"{first_name} {last_name}".strip()
                                     
                                     # Standard record structure for other sources
-                                normalized_record = {
-                                    "recid": record.get("recid", 0),
-                                    "ID": record.get("ID", ""),
-                                    "First_Name": record.get("First_Name", ""),
-                                    "Last_Name": record.get("Last_Name", ""),
-                                        "Full_Name": full_name,
-                                    "Other_Names": record.get("Other_Names", ""),
-                                    "AltScript": record.get("AltScript", ""),
-                                    "RecType": record.get("RecType", "")
-                                }
+                                normalized_record = SearchRecord(
+                                    recid=record.get("recid", 0),
+                                    ID=record.get("ID", ""),
+                                    First_Name=record.get("First_Name", ""),
+                                    Last_Name=record.get("Last_Name", ""),
+                                        Full_Name=full_name,
+                                    Other_Names=record.get("Other_Names", ""),
+                                    AltScript=record.get("AltScript", ""),
+                                    RecType=record.get("RecType", "")
+                                )
                                 baseline_data[source.lower()].append(normalized_record)
             
         except Exception as e:
-            print(f"Error parsing GDC response for {entity_name}: {e}")
+            log.warning("Error parsing GDC response for %s: %s", entity_name, e, extra={"entity": entity_name})
             # Continue processing other entities even if one fails
         
         return baseline_data
     
-    def fetch_current_data(self, entity_name, entity_type):
+    def fetch_current_data(self, entity_name, entity_type, defer_transform=False):
         """
-        Fetch current data from OpenSearch API with retry logic
+        Fetch current data from OpenSearch API with retry logic.
+        With defer_transform, a response fetched from the API is returned as its raw body,
+        to be decoded and normalized by a CPU worker process.
         """
         max_retries = config.test_config["max_retries"]
-        retry_delay = config.test_config["retry_delay"]
+        fetch_start = time.perf_counter()
         
         # Generate payload using config with correct schemas based on entity type
         payload = config.get_search_payload(entity_name, entity_type)
         
-        # Get headers with authentication
-        headers = config.get_api_headers()
+        # Replay the stored response if this exact request was cached
+        cached_result = self.response_cache.get(config.api_config["url"], payload)
+        if cached_result is not None:
+            log.info("Using cached OpenSearch response for %s (Type: %s)", entity_name, entity_type,
+                     extra={"entity": entity_name, "entity_type": entity_type})
+            transform_start = time.perf_counter()
+            current_data = self.transform_opensearch_response(cached_result)
+            self.record_fetch_timing(entity_name, entity_type, fetch_start, attempts=0, cached=True,
+                                     transform_seconds=time.perf_counter() - transform_start)
+            return current_data
+        
+        if self.response_cache.offline:
+            log.warning("Offline mode: no cached response for %s. Returning empty data...", entity_name,
+                        extra={"entity": entity_name, "entity_type": entity_type})
+            self.failed_fetches.add(CheckpointLog.entity_key(entity_name, entity_type))
+            self.record_fetch_timing(entity_name, entity_type, fetch_start, attempts=0)
+            return self.empty_source_data()
         
         for attempt in range(max_retries):
             try:
-                print(f"Calling OpenSearch API for {entity_name} (Type: {entity_type})... (Attempt {attempt + 1}/{max_retries})")
-                print(f"Payload: {payload}")
-            
-                response = requests.post(
-                    config.api_config["url"],
-                    json=payload,
-                    headers=headers,
-                    timeout=config.api_config["timeout"]
-                )
-                response.raise_for_status()
+                log.info("Calling OpenSearch API for %s (Type: %s)... (Attempt %d/%d)",
+                         entity_name, entity_type, attempt + 1, max_retries,
+                         extra={"entity": entity_name, "entity_type": entity_type, "attempt": attempt + 1})
+                log.debug("Payload: %s", payload)
             
-                api_result = response.json()
-                print(f"API Response received successfully")
+                response = self.api_client.post(payload)
+                
+                if defer_transform:
+                    self.record_fetch_timing(entity_name, entity_type, fetch_start, attempts=attempt + 1,
+                                             request_timing=self.api_client.last_request_timing())
+                    return response.content
+            
+                # Without a response cache to fill, decode straight into the fields normalization reads
+                api_result = self.json_backend.decode_response(response.content, typed=not self.response_cache.enabled)
+                log.debug("API Response received successfully")
+                self.response_cache.put(config.api_config["url"], payload, api_result)
             
             # Transform API response to match our expected format
-                return self.transform_opensearch_response(api_result)
+                transform_start = time.perf_counter()
+                current_data = self.transform_opensearch_response(api_result)
+                self.record_fetch_timing(entity_name, entity_type, fetch_start, attempts=attempt + 1,
+                                         request_timing=self.api_client.last_request_timing(),
+                                         transform_seconds=time.perf_counter() - transform_start)
+                return current_data
             
-            except requests.exceptions.RequestException as e:
-                print(f"Error calling OpenSearch API (Attempt {attempt + 1}): {e}")
+            except (requests.exceptions.RequestException, ValueError) as e:
+                log.warning("Error calling OpenSearch API (Attempt %d): %s", attempt + 1, e,
+                            extra={"entity": entity_name, "entity_type": entity_type, "attempt": attempt + 1})
                 if attempt < max_retries - 1:
-                    print(f"Retrying in {retry_delay} seconds...")
+                    # Exponential backoff with jitter, never shorter than the service's Retry-After
+                    retry_delay = self.rate_limiter.backoff_delay(attempt, retry_after_seconds(getattr(e, "response", None)))
+                    log.info("Retrying in %.2f seconds...", retry_delay)
                     time.sleep(retry_delay)
                     continue
                 else:
-                    print("All retry attempts failed. Returning empty data...")
+                    log.error("All retry attempts failed. Returning empty data...")
                     break
         
         # Return empty data structure if all API calls fail
+        self.failed_fetches.add(CheckpointLog.entity_key(entity_name, entity_type))
+        self.record_fetch_timing(entity_name, entity_type, fetch_start, attempts=max_retries,
+                                 request_timing=self.api_client.last_request_timing())
+        return self.empty_source_data()
+    
+    def record_fetch_timing(self, entity_name, entity_type, fetch_start, attempts=None, cached=False,
+                            request_timing=None, transform_seconds=None, batch_size=1):
+        """
+        Record the fetch measurements of an entity: total fetch time (retries and transform included),
+        connect/TTFB/request time and response size of the last request, and transform time
+        """
+        request_timing = request_timing or {}
+        self.timings.update(
+            entity_name, entity_type,
+            cached=cached,
+            attempts=attempts,
+            batch_size=batch_size if request_timing else None,
+            connect_ms=milliseconds(request_timing.get("connect_seconds")),
+            ttfb_ms=milliseconds(request_timing.get("ttfb_seconds")),
+            request_ms=milliseconds(request_timing.get("request_seconds")),
+            response_bytes=request_timing.get("response_bytes"),
+            transform_ms=milliseconds(transform_seconds),
+            fetch_ms=milliseconds(time.perf_counter() - fetch_start)
+        )
+    
+    def fetch_current_data_batch(self, entities):
+        """
+        Fetch current data for several entities with one batched API request.
+        Cached entities are served from disk and only the rest are sent in the batch.
+        The combined response is split back into one transformed result per entity,
+        in the same order as the given entities.
+        """
+        fetch_start = time.perf_counter()
+        
+        # Look up each entity under its single-query key, so batch and single runs share the cache
+        payloads = [config.get_search_payload(entity['name'], entity['type']) for entity in entities]
+        api_results = [self.response_cache.get(config.api_config["url"], payload) for payload in payloads]
+        missing = [i for i, api_result in enumerate(api_results) if api_result is None]
+        
+        if len(missing) < len(entities):
+            log.info("Using cached OpenSearch responses for %d of %d entities", len(entities) - len(missing), len(entities))
+        
+        request_timing = None
+        if missing and self.response_cache.offline:
+            log.warning("Offline mode: no cached response for %d entities. Returning empty data for them...", len(missing))
+        elif missing:
+            fetched = self.post_batch_with_retry([entities[i] for i in missing])
+            request_timing = self.api_client.last_request_timing()
+            if fetched is not None:
+                for i, api_result in zip(missing, fetched):
+                    api_results[i] = api_result
+                    self.response_cache.put(config.api_config["url"], payloads[i], api_result)
+        
+        for entity, api_result in zip(entities, api_results):
+            if api_result is None:
+                self.failed_fetches.add(CheckpointLog.entity_key(entity['name'], entity['type']))
+        
+        # Batched entities share the request's timings; Batch Size tells how many shared it
+        missing_positions = set(missing)
+        current_data_list = []
+        for position, (entity, api_result) in enumerate(zip(entities, api_results)):
+            transform_start = time.perf_counter()
+            current_data_list.append(
+                self.transform_opensearch_response(api_result) if api_result is not None else self.empty_source_data()
+            )
+            cached = position not in missing_positions
+            self.record_fetch_timing(entity['name'], entity['type'], fetch_start, cached=cached,
+                                     request_timing=None if cached else request_timing,
+                                     transform_seconds=time.perf_counter() - transform_start,
+                                     batch_size=len(missing))
+        return current_data_list
+    
+    def post_batch_with_retry(self, entities):
+        """
+        Send one batched search request with retry logic.
+        Returns the list of raw per-entity API responses, or None if all attempts fail.
+        """
+        max_retries = config.test_config["max_retries"]
+        
+        payload = config.get_batch_search_payload([(entity['name'], entity['type']) for entity in entities])
+        
+        for attempt in range(max_retries):
+            try:
+                log.info("Calling OpenSearch API for batch of %d entities... (Attempt %d/%d)",
+                         len(entities), attempt + 1, max_retries, extra={"attempt": attempt + 1})
+                
+                response = self.api_client.post(payload, url=config.get_batch_url())
+                
+                api_results = self.split_batch_response(
+                    self.json_backend.decode_batch_response(response.content, typed=not self.response_cache.enabled),
+                    len(entities)
+                )
+                log.debug("Batch API Response received successfully")
+                
+                return api_results
+            
+            except (requests.exceptions.RequestException, ValueError) as e:
+                log.warning("Error calling OpenSearch batch API (Attempt %d): %s", attempt + 1, e, extra={"attempt": attempt + 1})
+                if attempt < max_retries - 1:
+                    # Exponential backoff with jitter, never shorter than the service's Retry-After
+                    retry_delay = self.rate_limiter.backoff_delay(attempt, retry_after_seconds(getattr(e, "response", None)))
+                    log.info("Retrying in %.2f seconds...", retry_delay)
+                    time.sleep(retry_delay)
+                    continue
+                else:
+                    log.error("All retry attempts failed. Returning empty data...")
+                    break
+        
+        return None
+    
+    def split_batch_response(self, api_response, expected_count):
+        """
+        Split a batched API response into per-query responses.
+        Accepts {"responses": [...]} (msearch-style) or a bare list.
+        """
+        responses = api_response.get("responses") if isinstance(api_response, dict) else api_response
+        
+        if not isinstance(responses, list) or len(responses) != expected_count:
+            raise ValueError(f"Batch response does not contain {expected_count} results")
+        
+        return responses
+    
+    def empty_source_data(self):
+        """
+        Empty per-source structure used when the API call fails
+        """
         return {
             "col": [],
             "rights": [],
             "mex": [],
-                "watch": [],
+            "watch": [],
             "soe": [],
-                "pep": [],
-                "sanction": [],
+            "pep": [],
+            "sanction": [],
             "icij": [],
-                "media": [],
-                "ofac": []
-            }
+            "media": [],
+            "ofac": []
+        }
     
     def transform_opensearch_response(self, api_response):
         """
         Transform OpenSearch API response to match our expected format
         """
+        if is_typed_response(api_response):
+            return self.transform_typed_response(api_response)
         
         try:
-            print(f"Raw API response keys: {list(api_response.keys()) if isinstance(api_response, dict) else type(api_response)}")
+            # Debug detail is only built when debug logging is on
+            debug = log.isEnabledFor(logging.DEBUG)
+            if debug:
+                log.debug("Raw API response keys: %s", list(api_response.keys()) if isinstance(api_response, dict) else type(api_response))
             
             # Initialize transformed data structure (excluding OFAC as requested)
             transformed_data = {
@@ -310,12 +725,11 @@ class ExcelDrivenRegressionTest:
                     results = api_response["hits"]
                 
                 if results and isinstance(results, list):
-                    print(f"Processing results structure: {type(results)}")
-                    
-                    # Debug: Print sample data structure
-                    if len(results) > 0:
+                    # Debug: log sample data structure
+                    if debug:
+                        log.debug("Processing results structure: %s", type(results))
                         sample_record = results[0]
-                        print(f"Sample _source fields: {list(sample_record.get('_source', {}).keys()) if '_source' in sample_record else 'No _source field'}")
+                        log.debug("Sample _source fields: %s", list(sample_record.get('_source', {}).keys()) if '_source' in sample_record else 'No _source field')
                     
                     for record in results:
                         normalized_record = self.normalize_api_record(record)
@@ -324,18 +738,19 @@ class ExcelDrivenRegressionTest:
                             if source in transformed_data:
                                 transformed_data[source].append(normalized_record)
                 
-                # Print summary of transformed data
-                for source, records in transformed_data.items():
-                    if records:
-                        print(f"  {source.upper()}: {len(records)} records")
+                # Log summary of transformed data
+                if debug:
+                    for source, records in transformed_data.items():
+                        if records:
+                            log.debug("  %s: %d records", source.upper(), len(records))
                 
                 return transformed_data
             
-            print("No valid results structure found in API response")
+            log.warning("No valid results structure found in API response")
             return transformed_data
             
         except Exception as e:
-            print(f"Error transforming API response: {e}")
+            log.error("Error transforming API response: %s", e)
             return None
     
     def normalize_api_record(self, record):
@@ -389,32 +804,127 @@ class ExcelDrivenRegressionTest:
                             source_data.get("First_Name", "") or 
                             source_data.get("Last_Name", ""))
                 
-                return {
-                    "recid": recid,
-                    "ID": source_data.get("ID", ""),
-                    "First_Name": source_data.get("First_Name", ""),
-                    "Last_Name": source_data.get("Last_Name", ""),
-                    "Full_Name": icij_name,  # Use the best available name
-                    "Other_Names": source_data.get("Other_Names", source_data.get("otherNames", "")),
-                    "AltScript": source_data.get("AltScript", ""),
-                    "RecType": "ICIJ",  # Special handling for ICIJ
-                    "Entity_Name": source_data.get("Entity_Name", ""),  # ICIJ specific field
-                    "Entity_Type": source_data.get("Entity_Type", "")   # ICIJ specific field
-                }
+                return IcijRecord(
+                    recid=recid,
+                    ID=source_data.get("ID", ""),
+                    First_Name=source_data.get("First_Name", ""),
+                    Last_Name=source_data.get("Last_Name", ""),
+                    Full_Name=icij_name,  # Use the best available name
+                    Other_Names=source_data.get("Other_Names", source_data.get("otherNames", "")),
+                    AltScript=source_data.get("AltScript", ""),
+                    RecType="ICIJ",  # Special handling for ICIJ
+                    Entity_Name=source_data.get("Entity_Name", ""),  # ICIJ specific field
+                    Entity_Type=source_data.get("Entity_Type", "")   # ICIJ specific field
+                )
             else:
-                return {
-                "recid": recid,
-                "ID": source_data.get("ID", ""),
-                "First_Name": source_data.get("First_Name", ""),
-                "Last_Name": source_data.get("Last_Name", ""),
-                "Full_Name": full_name,
-                "Other_Names": source_data.get("Other_Names", source_data.get("otherNames", "")),
-                "AltScript": source_data.get("AltScript", ""),
-                "RecType": source_data.get("RecType", "")
-        }
+                return SearchRecord(
+                recid=recid,
+                ID=source_data.get("ID", ""),
+                First_Name=source_data.get("First_Name", ""),
+                Last_Name=source_data.get("Last_Name", ""),
+                Full_Name=full_name,
+                Other_Names=source_data.get("Other_Names", source_data.get("otherNames", "")),
+                AltScript=source_data.get("AltScript", ""),
+                RecType=source_data.get("RecType", "")
+        )
             
         except Exception as e:
-            print(f"Error normalizing record: {e}")
+            log.warning("Error normalizing record: %s", e)
+            return None
+    
+    def transform_typed_response(self, api_response):
+        """
+        Transform a SearchResponse decoded by JsonBackend; gives the same result as
+        transform_opensearch_response on the equivalent dict, without walking every _source field
+        """
+        try:
+            transformed_data = self.empty_source_data()
+            del transformed_data["ofac"]
+            
+            # Same precedence as the dict path: the first hit list present wins
+            results = next((hits for hits in (api_response.results, api_response.data, api_response.hits)
+                            if hits is not UNSET), None)
+            
+            for hit in results or ():
+                normalized_record = self.normalize_search_hit(hit)
+                if normalized_record:
+                    source_data = hit if hit.source is UNSET else hit.source
+                    source = self.source_from_indicators(hit.index, "" if source_data.ID is UNSET else source_data.ID)
+                    if source in transformed_data:
+                        transformed_data[source].append(normalized_record)
+            
+            if log.isEnabledFor(logging.DEBUG):
+                for source, records in transformed_data.items():
+                    if records:
+                        log.debug("  %s: %d records", source.upper(), len(records))
+            
+            return transformed_data
+            
+        except Exception as e:
+            log.error("Error transforming API response: %s", e)
+            return None
+    
+    def normalize_search_hit(self, hit):
+        """
+        Typed counterpart of normalize_api_record for a SearchHit decoded by JsonBackend
+        """
+        try:
+            source_data = hit if hit.source is UNSET else hit.source
+            
+            recid = None
+            if source_data.recid is not UNSET:
+                recid = source_data.recid
+            elif source_data.record_id is not UNSET:
+                recid = source_data.record_id
+            elif hit.id is not UNSET:
+                recid = hash(hit.id) % 10000000
+            
+            if not recid and (source_data.RecType == "ICIJ" or "icij" in str(source_data.index).lower()):
+                if source_data.ID is not UNSET:
+                    try:
+                        recid = int(source_data.ID) % 10000000
+                    except (ValueError, TypeError):
+                        recid = hash(str(source_data.ID)) % 10000000
+                else:
+                    recid = hash(repr(source_data)) % 10000000
+            
+            if not recid:
+                return None
+            
+            full_name = source_data.Full_Name
+            if not full_name and (source_data.First_Name or source_data.Last_Name):
+                full_name = f"{source_data.First_Name} {source_data.Last_Name}".strip()
+            
+            record_id = "" if source_data.ID is UNSET else source_data.ID
+            other_names = source_data.otherNames if source_data.Other_Names is UNSET else source_data.Other_Names
+            
+            if source_data.RecType == "ICIJ" or "icij" in str(hit.index).lower():
+                return IcijRecord(
+                    recid=recid,
+                    ID=record_id,
+                    First_Name=source_data.First_Name,
+                    Last_Name=source_data.Last_Name,
+                    Full_Name=(source_data.name or source_data.Entity_Name or source_data.Full_Name or
+                               full_name or source_data.First_Name or source_data.Last_Name),
+                    Other_Names=other_names,
+                    AltScript=source_data.AltScript,
+                    RecType="ICIJ",
+                    Entity_Name=source_data.Entity_Name,
+                    Entity_Type=source_data.Entity_Type
+                )
+            return SearchRecord(
+                recid=recid,
+                ID=record_id,
+                First_Name=source_data.First_Name,
+                Last_Name=source_data.Last_Name,
+                Full_Name=full_name,
+                Other_Names=other_names,
+                AltScript=source_data.AltScript,
+                RecType=source_data.RecType
+            )
+            
+        except Exception as e:
+            log.warning("Error normalizing record: %s", e)
             return None
     
     def determine_record_source(self, record):
@@ -424,190 +934,20 @@ class ExcelDrivenRegressionTest:
         # Check _source field first
         source_data = record.get("_source", record)
         
-        # Try to determine source from various indicators
-        if "_index" in record:
-            index_name = record["_index"].lower()
-            if "pep" in index_name:
-                return "pep"
-            elif "watch" in index_name:
-                return "watch"
-            elif "sanction" in index_name:
-                return "sanction"
-            elif "icij" in index_name:
-                return "icij"
-            elif "mex" in index_name:
-                return "mex"
-            elif "soe" in index_name:
-                return "soe"
-            elif "rights" in index_name:
-                return "rights"
-            elif "col" in index_name:
-                return "col"
-            elif "media" in index_name:
-                return "media"
-            elif "ofac" in index_name:
-                return "ofac"
-        
-        # Fallback: try to determine from ID pattern or other fields
-        record_id = source_data.get("ID", "")
-        if record_id.startswith("101"):
-            return "pep"
-        elif record_id.startswith("202"):
-            return "watch"
-        elif record_id.startswith("901"):
-            return "soe"
-        elif record_id.startswith("307"):
-            return "rights"
-        elif record_id.startswith("801"):
-            return "icij"
-        
-        # Default fallback
-        return "watch"
+        return self.source_from_indicators(record["_index"] if "_index" in record else None,
+                                           source_data.get("ID", ""))
+    
+    def source_from_indicators(self, index_name, record_id):
+        """
+        Determine the source/schema from the record's index name, falling back to its ID prefix
+        """
+        return self.schema_router.route(index_name, record_id)
     
     def compare_data(self, entity_name, baseline_data, current_data):
         """
         Compare baseline data with current API data
         """
-        comparison_result = {
-            "entity_name": entity_name,
-            "test_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "sources": {}
-        }
-        
-        # Get all unique sources from both datasets
-        all_sources = set(baseline_data.keys()) | set(current_data.keys())
-        
-        for source in all_sources:
-            baseline_records = baseline_data.get(source, [])
-            current_records = current_data.get(source, [])
-            
-            # Create lookup dictionaries by recid
-            baseline_by_id = {record["recid"]: record for record in baseline_records}
-            current_by_id = {record["recid"]: record for record in current_records}
-            
-            matches = []
-            missing_records = []
-            new_records = []
-            
-            # Find matches and missing records
-            for recid, baseline_record in baseline_by_id.items():
-                if recid in current_by_id:
-                    current_record = current_by_id[recid]
-                    
-                    # Compare records for changes
-                    changes = {}
-                    for key in ["Full_Name", "Other_Names", "First_Name", "Last_Name"]:
-                        if baseline_record.get(key) != current_record.get(key):
-                            changes[key] = {
-                                "old": baseline_record.get(key),
-                                "new": current_record.get(key)
-                            }
-                    
-                    # Construct full name from first and last name if Full_Name is empty
-                    full_name = baseline_record.get("Full_Name", "")
-                    if not full_name:
-                        first_name = baseline_record.get("First_Name", "")
-                        last_name = baseline_record.get("Last_Name", "")
-                        if first_name or last_name:
-                            full_name = f"{first_name} {last_name}".strip()
-                    
-                    # Construct other names including AltScript
-                    other_names_parts = []
-                    if baseline_record.get("Other_Names"):
-                        other_names_parts.append(baseline_record.get("Other_Names"))
-                    if baseline_record.get("otherNames"):
-                        other_names_parts.append(baseline_record.get("otherNames"))
-                    if baseline_record.get("AltScript"):
-                        other_names_parts.append(baseline_record.get("AltScript"))
-                    other_names = "; ".join(filter(None, other_names_parts))
-                    
-                    matches.append({
-                        "recid": recid,
-                        "ID": baseline_record.get("ID", ""),
-                        "Full_Name": full_name,
-                        "Other_Names": other_names,
-                        "First_Name": baseline_record.get("First_Name", ""),
-                        "Last_Name": baseline_record.get("Last_Name", ""),
-                        "AltScript": baseline_record.get("AltScript", ""),
-                        "status": "exact_match" if not changes else "modified",
-                        "changes": changes
-                    })
-                else:
-                    # Record missing in current
-                    # Construct full name from first and last name if Full_Name is empty
-                    full_name = baseline_record.get("Full_Name", "")
-                    if not full_name:
-                        first_name = baseline_record.get("First_Name", "")
-                        last_name = baseline_record.get("Last_Name", "")
-                        if first_name or last_name:
-                            full_name = f"{first_name} {last_name}".strip()
-                    
-                    # Construct other names including AltScript
-                    other_names_parts = []
-                    if baseline_record.get("Other_Names"):
-                        other_names_parts.append(baseline_record.get("Other_Names"))
-                    if baseline_record.get("otherNames"):
-                        other_names_parts.append(baseline_record.get("otherNames"))
-                    if baseline_record.get("AltScript"):
-                        other_names_parts.append(baseline_record.get("AltScript"))
-                    other_names = "; ".join(filter(None, other_names_parts))
-                    
-                    missing_records.append({
-                        "recid": recid,
-                        "ID": baseline_record.get("ID", ""),
-                        "Full_Name": full_name,
-                        "Other_Names": other_names,
-                        "First_Name": baseline_record.get("First_Name", ""),
-                        "Last_Name": baseline_record.get("Last_Name", ""),
-                        "AltScript": baseline_record.get("AltScript", "")
-                    })
-            
-            # Find new records
-            for recid, current_record in current_by_id.items():
-                if recid not in baseline_by_id:
-                    # Construct full name from first and last name if Full_Name is empty
-                    full_name = current_record.get("Full_Name", "")
-                    if not full_name:
-                        first_name = current_record.get("First_Name", "")
-                        last_name = current_record.get("Last_Name", "")
-                        if first_name or last_name:
-                            full_name = f"{first_name} {last_name}".strip()
-                    
-                    # Construct other names including AltScript
-                    other_names_parts = []
-                    if current_record.get("Other_Names"):
-                        other_names_parts.append(current_record.get("Other_Names"))
-                    if current_record.get("otherNames"):
-                        other_names_parts.append(current_record.get("otherNames"))
-                    if current_record.get("AltScript"):
-                        other_names_parts.append(current_record.get("AltScript"))
-                    other_names = "; ".join(filter(None, other_names_parts))
-                    
-                    new_records.append({
-                        "recid": recid,
-                        "ID": current_record.get("ID", ""),
-                        "Full_Name": full_name,
-                        "Other_Names": other_names,
-                        "First_Name": current_record.get("First_Name", ""),
-                        "Last_Name": current_record.get("Last_Name", ""),
-                        "AltScript": current_record.get("AltScript", "")
-                    })
-            
-            comparison_result["sources"][source] = {
-                "baseline_count": len(baseline_records),
-                "current_count": len(current_records),
-                "matches": matches,
-                "missing_records": missing_records,
-                "new_records": new_records,
-                "summary": {
-                    "exact_matches": len([m for m in matches if m["status"] == "exact_match"]),
-                    "modified_records": len([m for m in matches if m["status"] == "modified"]),
-                    "missing_records": len(missing_records),
-                    "new_records": len(new_records)
-                }
-            }
-        
-        return comparison_result
+        return compare_entity(entity_name, baseline_data, current_data)
     
     def generate_unified_comparison_report(self):
         """
@@ -616,21 +956,247 @@ class ExcelDrivenRegressionTest:
         # Use the reusable report generator
         excel_filename, html_filename = self.report_generator.generate_unified_comparison_report(
             self.unified_comparison_data,
-            "unified_opensearch_vs_legacy_comparison"
+            "unified_opensearch_vs_legacy_comparison",
+            create_excel_sheets=config.report_config["include_excel"],
+            create_html_report=config.report_config["include_html"],
+            create_parquet=config.report_config["include_parquet"],
+            timings=self.timings
         )
         
-        # Report skipped entities due to corrupted JSON
+        self.print_skipped_entities()
+        
+        return excel_filename, html_filename
+    
+    def print_skipped_entities(self):
+        """
+        Report skipped entities due to corrupted JSON
+        """
         if self.skipped_entities:
             print(f"\n⚠️  Skipped Entities (Corrupted JSON): {len(self.skipped_entities)}")
             for entity in self.skipped_entities[:10]:  # Show first 10
                 print(f"    - {entity}")
             if len(self.skipped_entities) > 10:
                 print(f"    ... and {len(self.skipped_entities) - 10} more")
+    
+    
+    
+    
+    def iter_work_units(self, entities, batch_size=1):
+        """
+        Group a stream of entities into (position, [entities]) work units of up to batch_size
+        """
+        unit = []
+        position = 1
+        for i, entity in enumerate(entities, 1):
+            unit.append(entity)
+            if len(unit) >= batch_size:
+                yield position, unit
+                unit = []
+                position = i + 1
+        if unit:
+            yield position, unit
+    
+    def parse_unit(self, work_unit):
+        """
+        Pipeline stage: parse the legacy GDC baseline of every entity in a work unit
+        """
+        _, entities = work_unit
+        for entity in entities:
+            # Unchanged entities that passed last run reuse their previous result unparsed
+            if self.fingerprint_entity(entity):
+                self.baseline_cache.keep(entity["fingerprint"][0])
+                continue
+            self.load_entity_baseline(entity, self.baseline_cache, defer=self.cpu_stage is not None)
+        return work_unit
+    
+    def fetch_unit(self, work_unit):
+        """
+        Pipeline stage: fetch current OpenSearch data for a work unit
+        (one batched request in batch mode, otherwise one request per entity)
+        """
+        position, entities = work_unit
+        total = self.expected_entity_count
         
-        return excel_filename, html_filename
+        if config.test_config["batch_mode"]:
+            to_fetch = [entity for entity in entities if entity.get("previous_item") is None]
+            log.info("[%d-%d/%s] Processing batch: %s", position, position + len(entities) - 1, total,
+                     ', '.join(str(entity['name']) for entity in to_fetch))
+            fetched = iter(self.fetch_current_data_batch(to_fetch) if to_fetch else [])
+            return position, entities, [None if entity.get("previous_item") is not None else next(fetched)
+                                        for entity in entities]
+        
+        # Without a response cache to fill, CPU worker processes decode and normalize the raw bodies
+        defer_transform = self.cpu_stage is not None and not self.response_cache.enabled
+        current_data_list = []
+        for offset, entity in enumerate(entities):
+            if entity.get("previous_item") is not None:
+                log.info("[%d/%s] Reusing result from %s: %s (Type: %s)", position + offset, total,
+                         entity['previous_item_source'], entity['name'], entity['type'],
+                         extra={"entity": entity['name'], "entity_type": entity['type']})
+                current_data_list.append(None)
+                continue
+            log.info("[%d/%s] Processing: %s (Type: %s)", position + offset, total, entity['name'], entity['type'],
+                     extra={"entity": entity['name'], "entity_type": entity['type']})
+            current_data_list.append(self.fetch_current_data(entity['name'], entity['type'], defer_transform))
+        return position, entities, current_data_list
+    
+    def compare_unit(self, fetched_unit):
+        """
+        Pipeline stage: compare fetched data and build the unified comparison items of a work unit
+        """
+        _, entities, current_data_list = fetched_unit
+        if self.cpu_stage is not None:
+            # Hand every entity of the unit to the worker processes before waiting for any of them
+            cpu_tasks = [self.submit_cpu_task(entity, current_data) for entity, current_data in zip(entities, current_data_list)]
+            return [self.complete_entity(entity, current_data, cpu_task)
+                    for entity, current_data, cpu_task in zip(entities, current_data_list, cpu_tasks)]
+        return [self.complete_entity(entity, current_data) for entity, current_data in zip(entities, current_data_list)]
     
+    def submit_cpu_task(self, entity, current_data):
+        """
+        Start the parse, normalize and compare work of an entity in a CPU worker process.
+        Baselines and responses the parent has not parsed yet are sent raw, everything else as packed rows.
+        Returns the pending task, or None if the entity needs no comparison.
+        """
+        if entity.get("previous_item") is not None or current_data is None:
+            return None
+        baseline_deferred = entity["baseline_data"] is None
+        response_deferred = isinstance(current_data, bytes)
+        return self.cpu_stage.submit(process_entity_cpu, (
+            entity["name"],
+            entity["current_gdc_response"] if baseline_deferred else None,
+            None if baseline_deferred else pack_source_data(entity["baseline_data"]),
+            current_data if response_deferred else None,
+            None if response_deferred else pack_source_data(current_data)
+        ))
     
+    def finish_cpu_task(self, entity, current_data, cpu_task):
+        """
+        Collect the result of submit_cpu_task: sets entity["baseline_data"] if the worker parsed it
+        and records the worker's timings. Returns (current data, whether the comparison passed, compare seconds);
+        a response body the worker could not decode is fetched and compared again in this process, and
+        current data is None if the response could not be transformed (as on the in-thread path).
+        """
+        baseline_rows, current_rows, passed, transform_seconds, compare_seconds, error = self.cpu_stage.result(cpu_task)
+        if baseline_rows is not None:
+            entity["baseline_data"] = unpack_source_data(baseline_rows)
+            self.baseline_cache.put(entity["fingerprint"][0], entity["baseline_data"])
+        if error == TRANSFORM_FAILED:
+            return None, None, None
+        if error is not None:
+            log.warning("Error decoding OpenSearch response for %s: %s. Fetching again...", entity['name'], error,
+                        extra={"entity": entity['name'], "entity_type": entity['type']})
+            current_data = self.fetch_current_data(entity['name'], entity['type'])
+            if current_data is None:
+                return None, None, None
+            compare_start = time.perf_counter()
+            passed = self.comparison_passed(self.compare_data(entity['name'], entity['baseline_data'], current_data))
+            return current_data, passed, time.perf_counter() - compare_start
+        if current_rows is not None:
+            current_data = unpack_source_data(current_rows)
+            self.timings.update(entity['name'], entity['type'], transform_ms=milliseconds(transform_seconds))
+        return current_data, passed, compare_seconds
     
+    def process_entity_cpu(self, entity_name, gdc_response, baseline_rows, response_body, current_rows):
+        """
+        CPU worker task: parse the raw baseline (gdc_response) or unpack baseline_rows, decode and normalize
+        the raw response_body or unpack current_rows, and compare them.
+        Returns (baseline rows if parsed here, current rows if normalized here, whether the comparison passed,
+        transform seconds, compare seconds, decoding error message, TRANSFORM_FAILED or None).
+        """
+        if gdc_response is not None:
+            try:
+                baseline_data = self.parse_gdc_response(self.json_backend.loads(gdc_response), entity_name)
+            except Exception as e:
+                log.warning("Error parsing GDC response for %s: %s", entity_name, e, extra={"entity": entity_name})
+                baseline_data = {}
+            baseline_rows = pack_source_data(baseline_data)
+        else:
+            baseline_data = unpack_source_data(baseline_rows)
+            baseline_rows = None
+        
+        transform_seconds = None
+        if response_body is not None:
+            transform_start = time.perf_counter()
+            try:
+                current_data = self.transform_opensearch_response(self.json_backend.decode_response(response_body))
+            except ValueError as e:
+                return baseline_rows, None, None, None, None, str(e)
+            if current_data is None:
+                return baseline_rows, None, None, None, None, TRANSFORM_FAILED
+            transform_seconds = time.perf_counter() - transform_start
+            current_rows = pack_source_data(current_data)
+        else:
+            current_data = unpack_source_data(current_rows)
+            current_rows = None
+        
+        compare_start = time.perf_counter()
+        passed = self.comparison_passed(self.compare_data(entity_name, baseline_data, current_data))
+        return baseline_rows, current_rows, passed, transform_seconds, time.perf_counter() - compare_start, None
+    
+    def complete_entity(self, entity, current_data, cpu_task=None):
+        """
+        Compare fetched data for an entity and build its unified comparison item
+        (cpu_task: the entity's pending submit_cpu_task, if a worker process compared it)
+        """
+        if entity.get("previous_item") is not None:
+            if entity["previous_item_source"] == "checkpoint":
+                # The interrupted run never saved its fingerprints; without this the store would drop the entity
+                self.fingerprint_store.record(entity["previous_item"], *entity["fingerprint"], entity["previous_passed"])
+            else:
+                self.checkpoint_log.append(entity["previous_item"], *entity["fingerprint"], entity["previous_passed"])
+            return entity["previous_item"]
+        
+        if current_data is None:
+            log.warning("Failed to fetch current data for %s. Skipping.", entity['name'], extra={"entity": entity['name']})
+            return None
+        
+        # Compare data
+        if cpu_task is not None:
+            current_data, passed, compare_seconds = self.finish_cpu_task(entity, current_data, cpu_task)
+            if current_data is None:
+                log.warning("Failed to fetch current data for %s. Skipping.", entity['name'], extra={"entity": entity['name']})
+                return None
+        else:
+            compare_start = time.perf_counter()
+            passed = self.comparison_passed(self.compare_data(entity['name'], entity['baseline_data'], current_data))
+            compare_seconds = time.perf_counter() - compare_start
+        
+        opensearch_hits = sum(len(source) for source in current_data.values())
+        legacy_hits = sum(len(source) for source in entity['baseline_data'].values())
+        self.timings.update(entity['name'], entity['type'], compare_ms=milliseconds(compare_seconds),
+                            opensearch_hits=opensearch_hits, legacy_hits=legacy_hits)
+        
+        # Print simple summary
+        log.info("✅ Processed %s - OpenSearch: %d records, Legacy: %d records", entity['name'], opensearch_hits, legacy_hits,
+                 extra={"entity": entity['name'], "entity_type": entity['type'],
+                        "opensearch_hits": opensearch_hits, "legacy_hits": legacy_hits})
+        
+        unified_item = {
+            'search_term': entity['name'],
+            'entity_type': entity['type'],
+            'opensearch_results': current_data,
+            'legacy_results': entity['baseline_data']
+        }
+        if CheckpointLog.entity_key(entity['name'], entity['type']) not in self.failed_fetches:
+            baseline_hash, payload_hash = entity['fingerprint']
+            self.fingerprint_store.record(unified_item, baseline_hash, payload_hash, passed)
+            self.checkpoint_log.append(unified_item, baseline_hash, payload_hash, passed)
+        
+        return unified_item
+    
+    def emit_unit(self, unit_items):
+        """
+        Report stage: write the unified comparison items of a finished work unit
+        to the incremental report, or store them for the end-of-run report
+        """
+        for unified_item in unit_items:
+            if unified_item is None:
+                continue
+            if self.report_writer is not None:
+                self.report_writer.add_item(unified_item)
+            else:
+                self.unified_comparison_data.append(unified_item)
     
     def run_all_tests(self):
         """
@@ -639,49 +1205,175 @@ class ExcelDrivenRegressionTest:
         print("Excel-Driven Regression Testing Framework - Unified Comparison")
         print("=" * 80)
         
-        # Load entities from Excel
-        entities = self.load_entities_from_excel()
+        # A resumed run reuses the entities logged before the interruption
+        resumed_count = self.checkpoint_log.start(resume=config.test_config["resume"])
+        if resumed_count:
+            print(f"⏯️  Resuming: {resumed_count} entities completed before the interruption will not be tested again")
+        
+        # Stream entities from Excel - fetching starts before the whole workbook is parsed
+        self.baseline_cache = self.open_baseline_cache()
+        entities = self.iter_entities_from_excel()
+        
+        # Split entities into work units (batches of test.batch_size in batch mode)
+        batch_size = max(config.test_config["batch_size"], 1) if config.test_config["batch_mode"] else 1
+        units = self.iter_work_units(entities, batch_size)
+        if batch_size > 1:
+            print(f"Batch mode: requests of up to {batch_size} entities")
         
-        if not entities:
+        # Excel parsing -> HTTP fetching -> compare_data -> report emission
+        stages = [
+            ("parse", self.parse_unit, config.test_config["parse_workers"]),
+            ("fetch", self.fetch_unit, config.test_config["max_workers"]),
+            ("compare", self.compare_unit, config.test_config["compare_workers"])
+        ]
+        
+        # Incremental mode writes each entity's report rows as soon as it completes
+        if config.report_config["incremental"]:
+            self.report_writer = self.report_generator.open_incremental_report(
+                "unified_opensearch_vs_legacy_comparison",
+                create_excel_sheets=config.report_config["include_excel"],
+                create_html_report=config.report_config["include_html"],
+                timings=self.timings
+            )
+            print(f"Writing report incrementally to {self.report_writer.html_filename or self.report_writer.excel_filename}")
+            if config.report_config["include_parquet"]:
+                print("ℹ️  Parquet history is only written for buffered reports (incremental mode is on)")
+        
+        # Parsing, normalization and comparison run in worker processes, fed by the compare stage threads
+        cpu_workers = config.test_config["cpu_workers"]
+        if cpu_workers > 0:
+            self.cpu_stage = CpuStage(
+                cpu_workers,
+                initializer=init_cpu_worker,
+                initargs=(self.json_backend.name, self.schema_router, config.test_config["log_level"], config.test_config["log_format"],
+                          config.test_config["log_file"] or None)
+            )
+            stages[-1] = ("compare", self.compare_unit, max(config.test_config["compare_workers"], cpu_workers))
+            print(f"CPU stage: parsing, normalization and comparison in {cpu_workers} worker processes")
+        
+        # The incremental report is finalized even if the run fails or is interrupted
+        pipeline = None
+        with self.report_writer or contextlib.nullcontext(), self.cpu_stage or contextlib.nullcontext():
+            if config.test_config["pipeline"] or config.test_config["max_workers"] > 1 or cpu_workers > 0:
+                pipeline = Pipeline(
+                    stages,
+                    queue_size=config.test_config["queue_size"],
+                    max_in_flight=config.test_config["max_in_flight"]
+                )
+                print("Running as a pipeline: " + ", ".join(f"{name} x{workers}" for name, _, workers in pipeline.stages))
+                results = pipeline.run(units)
+            else:
+                results = (self.compare_unit(self.fetch_unit(self.parse_unit(unit))) for unit in units)
+            
+            # Results arrive in Excel row order regardless of which worker finished first
+            for unit_items in results:
+                self.emit_unit(unit_items)
+        
+        self.close_baseline_cache(self.baseline_cache)
+        self.fingerprint_store.save()
+        self.checkpoint_log.close()
+        print(f"\nLoaded {self.loaded_entity_count} entities from Excel file")
+        if not self.loaded_entity_count:
             print("No entities found in Excel file. Exiting.")
             return
         
-        all_results = []
+        if config.test_config["changed_only"]:
+            if self.fingerprint_store.enabled:
+                fingerprint_stats = self.fingerprint_store.get_stats()
+                print(f"🔁 Changed-only: {fingerprint_stats['reused']} unchanged entities reused, "
+                      f"{fingerprint_stats['retested']} tested, {fingerprint_stats['results_changed']} results changed since last run")
+            else:
+                print("⚠️  Warning: Changed-only mode needs the fingerprint store (cache.fingerprint_enabled), every entity was tested")
+        
+        if config.test_config["resume"] and self.checkpoint_log.enabled:
+            print(f"⏯️  Resume: {self.checkpoint_log.resumed} entities rebuilt from the checkpoint, {self.checkpoint_log.written} completed in this run")
+        
+        if pipeline is not None:
+            for name, stats in pipeline.get_stats().items():
+                print(f"⚙️  Stage {name}: {stats['items']} units, {stats['busy_seconds']:.2f}s busy across {stats['workers']} workers")
+        
+        if self.cpu_stage is not None:
+            cpu_stats = self.cpu_stage.get_stats()
+            print(f"🧮 CPU stage: {cpu_stats['tasks']} entities, {cpu_stats['busy_seconds']:.2f}s busy across {cpu_stats['workers']} processes, "
+                  f"{cpu_stats['bytes_sent'] / 1024:.0f} KB sent, {cpu_stats['bytes_received'] / 1024:.0f} KB received")
+        
+        # Report connection reuse for the pooled API client
+        api_stats = self.api_client.get_stats()
+        print(f"\n🔌 API requests: {api_stats['requests']}, connections opened: {api_stats['connections_opened']}, "
+              f"avg request time: {api_stats['avg_request_ms']:.1f} ms")
+        self.api_client.close()
+        
+        if self.rate_limiter.enabled:
+            limiter_stats = self.rate_limiter.get_stats()
+            print(f"🚦 Rate limiter: {limiter_stats['throttled']} throttled (429), {limiter_stats['errors']} errors, "
+                  f"concurrency limit {limiter_stats['concurrency_limit']:.1f} (min {limiter_stats['min_concurrency_limit']:.1f}), "
+                  f"{limiter_stats['wait_seconds']:.2f}s waiting")
+        
+        if self.response_cache.enabled:
+            cache_stats = self.response_cache.get_stats()
+            print(f"💾 Response cache ({cache_stats['mode']}): {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                  f"{cache_stats['stores']} stored, {cache_stats['size_mb']:.1f} MB on disk")
         
-        for i, entity in enumerate(entities, 1):
-            print(f"\n[{i}/{len(entities)}] Processing: {entity['name']} (Type: {entity['type']})")
-            
-            # Fetch current data from API
-            current_data = self.fetch_current_data(entity['name'], entity['type'])
-            
-            if current_data is None:
-                print(f"Failed to fetch current data for {entity['name']}. Skipping.")
-                continue
-            
-            # Compare data
-            comparison_result = self.compare_data(entity['name'], entity['baseline_data'], current_data)
-            
-            # Store data for unified comparison
-            self.unified_comparison_data.append({
-                'search_term': entity['name'],
-                'entity_type': entity['type'],
-                'opensearch_results': current_data,
-                'legacy_results': entity['baseline_data']
-            })
-            
-            # Print simple summary
-            print(f"✅ Processed {entity['name']} - OpenSearch: {len([r for source in current_data.values() for r in source])} records, Legacy: {len([r for source in entity['baseline_data'].values() for r in source])} records")
-            
         # Generate unified comparison report
         print(f"\n{'='*80}")
-        print("Generating unified comparison report...")
-        excel_file, html_file = self.generate_unified_comparison_report()
-        if excel_file and html_file:
-            print(f"✅ Reports generated successfully!")
+        if self.report_writer is not None:
+            self.print_skipped_entities()
+            print(f"✅ Reports written incrementally!")
+        else:
+            print("Generating unified comparison report...")
+            excel_file, html_file = self.generate_unified_comparison_report()
+            if excel_file and html_file:
+                print(f"✅ Reports generated successfully!")
+        self.timings.print_summary()
         print("All tests completed!")
     
 
+# Harness of a CPU worker process (test.cpu_workers); it only runs the parse, normalize and compare methods
+_cpu_worker = None
+
+
+def init_cpu_worker(json_backend, schema_router, log_level, log_format, log_file):
+    """
+    CPU worker process initializer: set up logging and a harness without the run state
+    """
+    global _cpu_worker
+    configure_logging(log_level, log_format, log_file)
+    _cpu_worker = ExcelDrivenRegressionTest.__new__(ExcelDrivenRegressionTest)
+    _cpu_worker.json_backend = JsonBackend(json_backend)
+    _cpu_worker.schema_router = schema_router
+
+
+def process_entity_cpu(*task):
+    """
+    CPU worker task submitted by submit_cpu_task (see ExcelDrivenRegressionTest.process_entity_cpu)
+    """
+    return _cpu_worker.process_entity_cpu(*task)
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Excel-Driven Regression Testing Framework - Unified Comparison")
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument("--cache", dest="cache_mode", action="store_const", const="normal",
+                             help="Reuse cached API responses within the TTL and cache new ones")
+    cache_group.add_argument("--offline", dest="cache_mode", action="store_const", const="offline",
+                             help="Replay cached API responses only, never call the API")
+    cache_group.add_argument("--refresh", dest="cache_mode", action="store_const", const="refresh",
+                             help="Call the API for every entity and overwrite cached responses")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="Only test entities whose baseline or search payload changed, or that failed last run")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted run: skip entities in the checkpoint log and rebuild the report from it")
+    log_group = parser.add_mutually_exclusive_group()
+    log_group.add_argument("--log-level", choices=["debug", "info", "warning", "error"],
+                           help="Per-entity log level (debug adds payloads and response structure)")
+    log_group.add_argument("--quiet", dest="log_level", action="store_const", const="quiet",
+                           help="Only log warnings and errors; run summaries are still printed")
+    parser.add_argument("--log-json", dest="log_format", action="store_const", const="json",
+                        help="Write log records as JSON lines (to stderr, or to --log-file)")
+    parser.add_argument("--log-file", help="Write log records to this file instead of the console")
+    args = parser.parse_args()
+    
     # Run the Excel-driven regression test framework
-    framework = ExcelDrivenRegressionTest()
+    framework = ExcelDrivenRegressionTest(cache_mode=args.cache_mode, changed_only=args.changed_only, resume=args.resume,
+                                          log_level=args.log_level, log_format=args.log_format, log_file=args.log_file)
     framework.run_all_tests()
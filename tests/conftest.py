@@ -0,0 +1,82 @@
+"""
+Shared pytest setup: make the framework packages and the benchmark reference implementations
+importable, and provide a regression run against the local search API stub
+"""
+
+import os
+import sys
+
+import openpyxl
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+sys.path.insert(0, os.path.join(ROOT, "testcases"))
+
+from config import config
+from utils.stub_server import StubSearchServer
+from excel_driven_regression_test import ExcelDrivenRegressionTest
+
+
+def write_terms_workbook(path, rows):
+    """
+    Write an input workbook like Test terms.xlsx
+
+    Args:
+        path: Path of the .xlsx file
+        rows: (name, type, current GDC response) tuples
+    """
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Sheet1"
+    sheet.append(["Name", "Type", "Current GDC respose"])
+    for row in rows:
+        sheet.append(list(row))
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def stub_server():
+    """Search API stub with synthetic results, on a free port"""
+    stub = StubSearchServer(hits_per_query=5, latency_jitter_ms=5).start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def run_config(tmp_path, monkeypatch, stub_server):
+    """
+    Point the global config at the stub and at files under tmp_path (config.json is not read);
+    the test may change any setting with monkeypatch.setitem before creating the harness
+    """
+    monkeypatch.setattr(config, "load_from_file", lambda *args, **kwargs: None)
+    monkeypatch.setattr(config, "results_directory", str(tmp_path / "results"))
+    monkeypatch.setitem(config.api_config, "url", stub_server.url)
+    monkeypatch.setitem(config.api_config, "api_key", "test-key")
+    cache_dir = tmp_path / ".cache"
+    for key, path in [("directory", cache_dir / "responses"), ("baseline_path", cache_dir / "baselines.bin"),
+                      ("fingerprint_path", cache_dir / "fingerprints.json"),
+                      ("checkpoint_path", cache_dir / "checkpoint.jsonl")]:
+        monkeypatch.setitem(config.cache_config, key, str(path))
+    for section in (config.api_config, config.test_config, config.cache_config, config.report_config):
+        for key, value in list(section.items()):
+            monkeypatch.setitem(section, key, value)
+    monkeypatch.setitem(config.test_config, "log_level", "warning")
+    monkeypatch.setitem(config.test_config, "retry_delay", 0.01)
+    return config
+
+
+@pytest.fixture
+def run_harness(run_config, monkeypatch):
+    """Run the regression test on an input workbook, with test section settings overridden for this run"""
+    def run(excel_path, **test_settings):
+        monkeypatch.setattr(config, "excel_file_path", excel_path)
+        for key, value in test_settings.items():
+            monkeypatch.setitem(config.test_config, key, value)
+        harness = ExcelDrivenRegressionTest(excel_path)
+        harness.run_all_tests()
+        return harness
+
+    return run
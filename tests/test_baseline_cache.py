@@ -0,0 +1,100 @@
+"""
+BaselineCache reuse, invalidation by row hash and Excel file, and keep()
+"""
+
+import json
+import os
+
+from conftest import write_terms_workbook
+from utils.baseline_cache import BaselineCache
+from utils.search_record import SearchRecord
+
+BASELINE = {"pep": [SearchRecord(recid=1, ID="101", Full_Name="JOHN DOE")], "watch": []}
+
+
+def gdc_response(*names):
+    preview = {"pep": [{"recid": i + 1, "ID": f"101{i}", "Full_Name": name} for i, name in enumerate(names)]}
+    return json.dumps({"Args": [{"nameSearch": {"Preview": preview}}]})
+
+
+def make_cache(tmp_path, excel_name="terms.xlsx", **kwargs):
+    excel_path = tmp_path / excel_name
+    if not excel_path.exists():
+        excel_path.write_bytes(b"")
+    return BaselineCache(str(tmp_path / "baselines.bin"), str(excel_path), **kwargs)
+
+
+def test_saved_rows_are_reused(tmp_path):
+    cache = make_cache(tmp_path)
+    row_hash = BaselineCache.row_hash("raw response")
+    assert cache.get(row_hash) is None
+    cache.put(row_hash, BASELINE, skipped=False)
+    cache.save()
+
+    warm = make_cache(tmp_path)
+    assert warm.excel_unchanged
+    assert warm.get(row_hash) == (BASELINE, False)
+    assert warm.get(BaselineCache.row_hash("other response")) is None
+    assert (warm.hits, warm.misses) == (1, 1)
+
+
+def test_changed_excel_file_keeps_rows_with_the_same_hash(tmp_path):
+    cache = make_cache(tmp_path)
+    row_hash = BaselineCache.row_hash("raw response")
+    cache.put(row_hash, BASELINE)
+    cache.save()
+
+    excel_path = tmp_path / "terms.xlsx"
+    os.utime(excel_path, (os.path.getmtime(excel_path) + 10,) * 2)
+    warm = make_cache(tmp_path)
+    assert not warm.excel_unchanged
+    assert warm.get(row_hash) == (BASELINE, False)
+
+
+def test_cache_of_another_excel_file_is_ignored(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put(BaselineCache.row_hash("raw response"), BASELINE)
+    cache.save()
+    assert make_cache(tmp_path, "other.xlsx").get(BaselineCache.row_hash("raw response")) is None
+
+
+def test_save_drops_rows_not_used_or_kept(tmp_path):
+    cache = make_cache(tmp_path)
+    used, kept, stale = (BaselineCache.row_hash(value) for value in ("used", "kept", "stale"))
+    for row_hash in (used, kept, stale):
+        cache.put(row_hash, BASELINE)
+    cache.save()
+
+    warm = make_cache(tmp_path)
+    warm.get(used)
+    warm.keep(kept)
+    warm.save()
+
+    reloaded = make_cache(tmp_path)
+    assert reloaded.get(used) is not None
+    assert reloaded.get(kept) is not None
+    assert reloaded.get(stale) is None
+
+
+def test_unreadable_or_disabled_cache(tmp_path):
+    (tmp_path / "baselines.bin").write_bytes(b"not a cache")
+    cache = make_cache(tmp_path)
+    assert cache.get(BaselineCache.row_hash("raw response")) is None
+    cache.put(BaselineCache.row_hash("raw response"), BASELINE)
+    cache.save()
+    assert make_cache(tmp_path).get(BaselineCache.row_hash("raw response")) == (BASELINE, False)
+
+    disabled = make_cache(tmp_path, enabled=False)
+    assert disabled.get(BaselineCache.row_hash("raw response")) is None
+
+
+def test_warm_run_parses_only_changed_rows(tmp_path, run_harness, capsys):
+    rows = [("alpha", "P", gdc_response("ALPHA")), ("beta", "E", gdc_response("BETA")), ("gamma", "P", "No Hits")]
+    cold = run_harness(write_terms_workbook(tmp_path / "terms.xlsx", rows))
+    assert "Baseline cache: 0 rows reused, 3 rows parsed" in capsys.readouterr().out
+
+    rows[1] = ("beta", "E", gdc_response("BETA", "BETA LTD"))
+    warm = run_harness(write_terms_workbook(tmp_path / "terms.xlsx", rows))
+    assert "Baseline cache: 2 rows reused, 1 rows parsed" in capsys.readouterr().out
+    assert warm.unified_comparison_data[0] == cold.unified_comparison_data[0]
+    assert [record["Full_Name"] for record in warm.unified_comparison_data[1]["legacy_results"]["pep"]] == ["BETA", "BETA LTD"]
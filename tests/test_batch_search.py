@@ -0,0 +1,53 @@
+"""
+Batched multi-query search: payload, response splitting and the cache shared with single requests
+"""
+
+import pytest
+
+from config import config
+from conftest import write_terms_workbook
+from excel_driven_regression_test import ExcelDrivenRegressionTest
+
+TERMS = [(f"term {i}", "P" if i % 2 else "E", "") for i in range(7)]
+
+
+def test_batch_payload_packs_single_payloads():
+    payload = config.get_batch_search_payload([("a", "P"), ("b", "E")])
+    assert payload == {"queries": [config.get_search_payload("a", "P"), config.get_search_payload("b", "E")]}
+
+
+def test_split_batch_response():
+    harness = ExcelDrivenRegressionTest.__new__(ExcelDrivenRegressionTest)
+    assert harness.split_batch_response({"responses": [{"results": []}, {"data": []}]}, 2) == [{"results": []}, {"data": []}]
+    assert harness.split_batch_response([{"results": []}], 1) == [{"results": []}]
+    with pytest.raises(ValueError):
+        harness.split_batch_response({"responses": [{"results": []}]}, 2)
+    with pytest.raises(ValueError):
+        harness.split_batch_response({"message": "error"}, 1)
+
+
+def test_batches_are_split_back_per_entity(tmp_path, run_harness, stub_server):
+    excel_path = write_terms_workbook(tmp_path / "terms.xlsx", TERMS)
+    harness = run_harness(excel_path, batch_mode=True, batch_size=3)
+
+    assert stub_server.get_stats()["requests"] == 3
+    assert stub_server.get_stats()["queries"] == len(TERMS)
+    assert [item["search_term"] for item in harness.unified_comparison_data] == [name for name, _, _ in TERMS]
+    for item in harness.unified_comparison_data:
+        expected = harness.transform_opensearch_response(
+            stub_server.search(config.get_search_payload(item["search_term"], item["entity_type"])))
+        assert item["opensearch_results"] == expected
+
+
+def test_batch_sends_only_uncached_entities(tmp_path, run_harness, run_config, monkeypatch, stub_server):
+    monkeypatch.setitem(run_config.cache_config, "enabled", True)
+    excel_path = write_terms_workbook(tmp_path / "terms.xlsx", TERMS[:4])
+    single = run_harness(excel_path)
+    assert stub_server.get_stats()["requests"] == 4
+
+    # Single-query cache entries serve the batch run; only the new entities are sent, in one request
+    excel_path = write_terms_workbook(tmp_path / "more_terms.xlsx", TERMS)
+    batched = run_harness(excel_path, batch_mode=True, batch_size=10)
+    assert stub_server.get_stats()["requests"] == 5
+    assert stub_server.get_stats()["queries"] == 4 + 3
+    assert batched.unified_comparison_data[:4] == single.unified_comparison_data
@@ -0,0 +1,123 @@
+"""
+CheckpointLog resume, including a log whose last line was cut short by a crash
+"""
+
+import json
+import os
+
+import pytest
+
+from conftest import write_terms_workbook
+from utils.checkpoint_log import CheckpointLog
+
+
+def make_item(term):
+    return {"search_term": term, "entity_type": "P", "opensearch_results": {}, "legacy_results": {}}
+
+
+def write_log(path, excel_path, terms):
+    log = CheckpointLog(str(path), excel_path)
+    log.start()
+    for term in terms:
+        log.append(make_item(term), f"b-{term}", f"p-{term}", passed=term != "b")
+    log.close()
+
+
+def test_resume_loads_completed_entities(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    write_log(path, "terms.xlsx", ["a", "b"])
+
+    log = CheckpointLog(str(path), "terms.xlsx")
+    assert log.start(resume=True) == 2
+    assert log.get_completed_item("a", "P", "b-a", "p-a") == (make_item("a"), True)
+    assert log.get_completed_item("b", "P", "b-b", "p-b") == (make_item("b"), False)
+    assert log.get_completed_item("b", "P", "changed", "p-b") is None
+    assert log.get_completed_item("c", "P", "b-c", "p-c") is None
+    assert log.resumed == 2
+    log.close()
+
+
+def test_truncated_trailing_line_is_dropped(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    write_log(path, "terms.xlsx", ["a", "b"])
+    complete = path.read_bytes()
+    with open(path, "ab") as f:
+        f.write(b'{"term": "c", "type": "P", "baseline_ha')
+
+    log = CheckpointLog(str(path), "terms.xlsx")
+    assert log.start(resume=True) == 2
+    assert log.get_completed_item("c", "P", "b-c", "p-c") is None
+    # The partial line is cut off, so the next entity starts on a line of its own
+    assert path.read_bytes() == complete
+    log.append(make_item("c"), "b-c", "p-c", passed=True)
+    log.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line).get("term") for line in lines] == [None, "a", "b", "c"]
+    resumed = CheckpointLog(str(path), "terms.xlsx")
+    assert resumed.start(resume=True) == 3
+    resumed.close()
+
+
+def test_line_without_newline_is_incomplete(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    write_log(path, "terms.xlsx", ["a", "b"])
+    # A crash right before the newline leaves valid JSON that was never completed
+    path.write_bytes(path.read_bytes()[:-1])
+
+    log = CheckpointLog(str(path), "terms.xlsx")
+    assert log.start(resume=True) == 1
+    log.close()
+
+
+def test_log_of_another_run_is_replaced(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    write_log(path, "terms.xlsx", ["a"])
+
+    log = CheckpointLog(str(path), "other.xlsx")
+    assert log.start(resume=True) == 0
+    log.close()
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_disabled_log_writes_nothing(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    log = CheckpointLog(str(path), "terms.xlsx", enabled=False)
+    assert log.start() == 0
+    log.append(make_item("a"), "b", "p", passed=True)
+    log.close()
+    assert not path.exists()
+
+
+def test_line_without_outcome_counts_as_failed(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    write_log(path, "terms.xlsx", [])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"term": "a", "type": "P", "baseline_hash": "b", "payload_hash": "p",
+                            "item": make_item("a")}) + "\n")
+
+    log = CheckpointLog(str(path), "terms.xlsx")
+    assert log.start(resume=True) == 1
+    assert log.get_completed_item("a", "P", "b", "p") == (make_item("a"), False)
+    log.close()
+
+
+@pytest.mark.parametrize("fingerprints_saved", [True, False])
+def test_changed_only_run_after_resume_reuses_resumed_entities(tmp_path, run_harness, run_config, stub_server,
+                                                               fingerprints_saved):
+    # No hits on either side: every entity passes
+    stub_server.hits_per_query = 0
+    excel_path = write_terms_workbook(tmp_path / "terms.xlsx", [(f"term {i}", "E", "") for i in range(5)])
+    first = run_harness(excel_path)
+    if not fingerprints_saved:
+        # As if the first run had been killed before it saved its fingerprints
+        os.remove(run_config.cache_config["fingerprint_path"])
+
+    resumed = run_harness(excel_path, resume=True)
+    assert resumed.checkpoint_log.resumed == 5
+    assert resumed.api_client.get_stats()["requests"] == 0
+
+    changed_only = run_harness(excel_path, resume=False, changed_only=True)
+    assert changed_only.fingerprint_store.get_stats()["reused"] == 5
+    assert changed_only.api_client.get_stats()["requests"] == 0
+    assert changed_only.unified_comparison_data == first.unified_comparison_data
@@ -0,0 +1,47 @@
+"""
+compare_entity must produce the same per-source result as the compare_data it replaced
+"""
+
+import pytest
+
+from bench_compare import SOURCES, make_entity, reference_compare_data
+from utils.comparison import compare_entity
+from utils.search_record import SearchRecord
+
+
+@pytest.mark.parametrize("overlap, modified, seed", [(0.9, 0.1, 1), (0.5, 0.5, 2), (0.0, 0.0, 3), (1.0, 0.0, 4)])
+def test_matches_reference_on_synthetic_entities(overlap, modified, seed):
+    baseline_data, current_data = make_entity(200, len(SOURCES), overlap, modified, seed)
+    result = compare_entity("term", baseline_data, current_data)
+    assert result["entity_name"] == "term"
+    assert result["sources"] == reference_compare_data("term", baseline_data, current_data)["sources"]
+
+
+def test_matches_reference_on_raw_dict_records():
+    # Raw GDC records are dicts that may carry otherNames / AltScript or lack name fields
+    baseline_data = {
+        "pep": [
+            {"recid": 1, "ID": "1", "Full_Name": "", "First_Name": "ANA", "Last_Name": "RUIZ", "otherNames": "A RUIZ"},
+            {"recid": 2, "ID": "2", "Full_Name": "JOHN DOE", "AltScript": "ДЖОН"},
+            {"recid": 3, "ID": "3"},
+        ],
+        "icij": [{"recid": 9, "ID": "9", "Full_Name": "OFFSHORE LTD"}],
+    }
+    current_data = {
+        "pep": [
+            SearchRecord(recid=1, ID="1", First_Name="ANA", Last_Name="RUIZ"),
+            SearchRecord(recid=2, ID="2", Full_Name="JOHN DOE JR"),
+            SearchRecord(recid=4, ID="4", Other_Names="NEW ALIAS"),
+        ],
+        "watch": [SearchRecord(recid=7, ID="7", Full_Name="WATCHED")],
+    }
+    result = compare_entity("term", baseline_data, current_data)
+    assert result["sources"] == reference_compare_data("term", baseline_data, current_data)["sources"]
+    assert set(result["sources"]) == {"pep", "icij", "watch"}
+    assert result["sources"]["pep"]["summary"] == {
+        "exact_matches": 0, "modified_records": 2, "missing_records": 1, "new_records": 1
+    }
+
+
+def test_empty_entity():
+    assert compare_entity("term", {}, {})["sources"] == {}
@@ -0,0 +1,35 @@
+"""
+Concurrent run_all_tests: results match a sequential run and stay in Excel row order
+"""
+
+import pytest
+
+from conftest import write_terms_workbook
+
+TERMS = [(f"term {i}", "P" if i % 2 else "E", "") for i in range(40)]
+
+
+@pytest.mark.parametrize("settings", [
+    {"max_workers": 8},
+    {"max_workers": 8, "max_in_flight": 3},
+    {"max_workers": 4, "batch_mode": True, "batch_size": 3},
+])
+def test_concurrent_run_matches_sequential_run(tmp_path, run_harness, settings):
+    excel_path = write_terms_workbook(tmp_path / "terms.xlsx", TERMS)
+    sequential = run_harness(excel_path, max_workers=1)
+    concurrent = run_harness(excel_path, **settings)
+
+    assert [item["search_term"] for item in concurrent.unified_comparison_data] == [name for name, _, _ in TERMS]
+    assert concurrent.unified_comparison_data == sequential.unified_comparison_data
+    assert concurrent.api_client.get_stats()["requests"] == (14 if settings.get("batch_mode") else len(TERMS))
+
+
+def test_failed_fetch_keeps_its_row(tmp_path, run_harness, stub_server):
+    # Every request fails: each entity still gets its (empty) result, in row order
+    stub_server.error_rate = 1
+    excel_path = write_terms_workbook(tmp_path / "terms.xlsx", TERMS[:6])
+    harness = run_harness(excel_path, max_workers=4, max_retries=1)
+
+    assert [item["search_term"] for item in harness.unified_comparison_data] == [name for name, _, _ in TERMS[:6]]
+    assert all(not any(item["opensearch_results"].values()) for item in harness.unified_comparison_data)
+    assert len(harness.failed_fetches) == 6
@@ -0,0 +1,117 @@
+"""
+CPU stage: packed rows round-trip through marshal, worker tasks match the in-thread path,
+and an entity whose response fails to transform in a worker is skipped
+"""
+
+import json
+import marshal
+import multiprocessing
+
+import pytest
+
+from bench_cpu_stage import make_baseline
+from bench_json_backend import make_response
+from conftest import write_terms_workbook
+from excel_driven_regression_test import TRANSFORM_FAILED, ExcelDrivenRegressionTest
+from utils.cpu_stage import CpuStage, pack_source_data, unpack_source_data
+from utils.json_backend import JsonBackend
+from utils.schema_router import SchemaRouter
+from utils.search_record import IcijRecord, SearchRecord
+
+TERMS = [(f"term {i}", "P" if i % 2 else "E", "") for i in range(8)]
+
+
+@pytest.fixture
+def worker():
+    # The state init_cpu_worker gives a worker process
+    worker = ExcelDrivenRegressionTest.__new__(ExcelDrivenRegressionTest)
+    worker.json_backend = JsonBackend("auto")
+    worker.schema_router = SchemaRouter()
+    return worker
+
+
+def test_pack_unpack_round_trip():
+    source_data = {
+        "pep": [SearchRecord(recid=1, ID="1011", Full_Name="JOHN DOE", RecType="PEP"),
+                {"recid": 2, "ID": "1012", "Full_Name": "RAW DICT"}],
+        "icij": [IcijRecord(recid=3, ID="8011", Entity_Name="ACME", Entity_Type="Company")],
+        "watch": []
+    }
+
+    restored = unpack_source_data(marshal.loads(marshal.dumps(pack_source_data(source_data))))
+
+    assert restored == source_data
+    assert list(restored) == list(source_data)
+    assert [type(record) for record in restored["pep"] + restored["icij"]] == [SearchRecord, dict, IcijRecord]
+
+
+@pytest.mark.parametrize("raw", [True, False], ids=["raw", "packed"])
+def test_worker_task_matches_the_in_thread_path(worker, raw):
+    body = make_response(50, 5, seed=1)
+    gdc_response = make_baseline(body, overlap=0.5, seed=1)
+    baseline_data = worker.parse_gdc_response(worker.json_backend.loads(gdc_response), "term")
+    current_data = worker.transform_opensearch_response(worker.json_backend.decode_response(body))
+
+    if raw:
+        task = ("term", gdc_response, None, body, None)
+    else:
+        task = ("term", None, pack_source_data(baseline_data), None, pack_source_data(current_data))
+    result = worker.process_entity_cpu(*task)
+
+    baseline_rows, current_rows, passed, transform_seconds, compare_seconds, error = result
+    assert error is None
+    # Rows are only sent back for data the worker parsed or normalized itself
+    if raw:
+        assert unpack_source_data(baseline_rows) == baseline_data
+        assert unpack_source_data(current_rows) == current_data
+        assert transform_seconds >= 0
+    else:
+        assert baseline_rows is None and current_rows is None and transform_seconds is None
+    assert passed == worker.comparison_passed(worker.compare_data("term", baseline_data, current_data))
+    assert compare_seconds >= 0
+    # The result crosses the process boundary with marshal
+    assert marshal.loads(marshal.dumps(result)) == result
+
+
+def test_worker_reports_undecodable_and_untransformable_responses(worker, monkeypatch):
+    error = worker.process_entity_cpu("term", None, pack_source_data({}), b'{"results": [', None)[5]
+    assert error not in (None, TRANSFORM_FAILED)
+
+    monkeypatch.setattr(worker, "transform_opensearch_response", lambda response: None)
+    result = worker.process_entity_cpu("term", None, pack_source_data({}), make_response(5, 0, seed=1), None)
+
+    assert result == (None, None, None, None, None, TRANSFORM_FAILED)
+    marshal.dumps(result)
+
+
+def test_cpu_stage_runs_tasks_in_worker_processes():
+    with CpuStage(2) as stage:
+        assert [stage.result(stage.submit(max, (3, 7, 5))) for _ in range(3)] == [7, 7, 7]
+        with pytest.raises(ValueError):
+            stage.result(stage.submit(int, ("not a number",)))
+        stats = stage.get_stats()
+
+    assert stats["tasks"] == 4 and stats["workers"] == 2
+    assert stats["bytes_sent"] > 0 and stats["bytes_received"] > 0
+
+
+def test_run_with_cpu_workers_matches_sequential_run(tmp_path, run_harness):
+    excel_path = write_terms_workbook(tmp_path / "terms.xlsx", TERMS)
+    sequential = run_harness(excel_path, max_workers=1)
+    with_workers = run_harness(excel_path, max_workers=4, cpu_workers=2)
+
+    assert with_workers.unified_comparison_data == sequential.unified_comparison_data
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="the patch must reach the worker processes")
+def test_response_that_fails_to_transform_in_a_worker_is_skipped(tmp_path, run_harness, run_config, monkeypatch):
+    # Without a response cache the raw bodies are decoded and transformed in the workers
+    monkeypatch.setitem(run_config.cache_config, "enabled", False)
+    monkeypatch.setattr(ExcelDrivenRegressionTest, "transform_opensearch_response", lambda self, response: None)
+    excel_path = write_terms_workbook(tmp_path / "terms.xlsx", TERMS[:4])
+
+    harness = run_harness(excel_path, max_workers=2, cpu_workers=1)
+
+    assert harness.unified_comparison_data == []
+    assert harness.cpu_stage.get_stats()["tasks"] == 4
+    assert harness.fingerprint_store.get_stats()["entities"] == 0
@@ -0,0 +1,58 @@
+"""
+Streaming Excel ingestion: row filtering, column lookup and lazy reading
+"""
+
+import openpyxl
+
+from conftest import write_terms_workbook
+from excel_driven_regression_test import ExcelDrivenRegressionTest
+
+
+def make_harness(excel_path):
+    harness = ExcelDrivenRegressionTest.__new__(ExcelDrivenRegressionTest)
+    harness.excel_path = str(excel_path)
+    harness.skipped_entities = []
+    return harness
+
+
+def test_rows_without_name_or_type_are_skipped(tmp_path):
+    excel_path = write_terms_workbook(tmp_path / "terms.xlsx", [
+        ("alpha", "P", "No Hits"), (None, "E", "No Hits"), ("beta", None, ""), ("gamma", "E", None)
+    ])
+    harness = make_harness(excel_path)
+    entities = list(harness.iter_entities_from_excel())
+
+    assert entities == [
+        {"name": "alpha", "type": "P", "current_gdc_response": "No Hits", "row_index": 0},
+        {"name": "gamma", "type": "E", "current_gdc_response": "", "row_index": 3},
+    ]
+    assert (harness.loaded_entity_count, harness.expected_entity_count) == (2, 4)
+
+
+def test_columns_are_found_by_header(tmp_path):
+    excel_path = tmp_path / "terms.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Sheet1"
+    sheet.append(["Notes", "Type", "Name"])
+    sheet.append(["ignored", "E", "alpha"])
+    workbook.save(excel_path)
+
+    entities = list(make_harness(excel_path).iter_entities_from_excel())
+    assert entities == [{"name": "alpha", "type": "E", "current_gdc_response": "", "row_index": 0}]
+
+
+def test_rows_are_read_lazily(tmp_path):
+    excel_path = write_terms_workbook(tmp_path / "terms.xlsx", [(f"term {i}", "P", "") for i in range(1000)])
+    harness = make_harness(excel_path)
+    entities = harness.iter_entities_from_excel()
+
+    assert next(entities)["name"] == "term 0"
+    assert harness.loaded_entity_count == 1
+    entities.close()
+
+
+def test_unreadable_workbook_yields_nothing(tmp_path):
+    excel_path = tmp_path / "terms.xlsx"
+    excel_path.write_bytes(b"not a workbook")
+    assert list(make_harness(excel_path).iter_entities_from_excel()) == []
@@ -0,0 +1,92 @@
+"""
+Excel report engines: openpyxl and xlsxwriter write the same sheets, and split workbooks
+together hold every Test Key sheet once
+"""
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from bench_unified_report import make_comparison_data
+from utils.excel_writer import resolve_engine, write_split_workbooks, write_workbook
+from utils.report_generator import ReportGenerator
+
+pytest.importorskip("xlsxwriter")
+
+
+@pytest.fixture(scope="module")
+def unified_df(tmp_path_factory):
+    report_generator = ReportGenerator(str(tmp_path_factory.mktemp("results")))
+    df = report_generator.build_unified_dataframe(make_comparison_data(20, 8, 0.7, seed=11))
+    return df.sort_values(["Test Key", "OpenSearch Schema", "OpenSearch ID"])
+
+
+def read_sheets(filename):
+    """{sheet name: rows} of a workbook, with the header row first and blank trailing cells dropped"""
+    workbook = openpyxl.load_workbook(filename, read_only=True)
+    sheets = {}
+    for sheet_name in workbook.sheetnames:
+        rows = []
+        for row in workbook[sheet_name].iter_rows(values_only=True):
+            row = list(row)
+            while row and row[-1] is None:
+                row.pop()
+            rows.append(tuple(row))
+        sheets[sheet_name] = rows
+    workbook.close()
+    return sheets
+
+
+def test_engines_write_the_same_sheets(tmp_path, unified_df):
+    extra_sheets = [("Timing Summary", pd.DataFrame({"Metric": ["fetch", "total"], "p50": [1.5, None]}))]
+
+    sheets = {engine: read_sheets(write_workbook(unified_df, str(tmp_path / f"{engine}.xlsx"), engine, extra_sheets))
+              for engine in ("openpyxl", "xlsxwriter")}
+
+    assert sheets["openpyxl"] == sheets["xlsxwriter"]
+    assert list(sheets["openpyxl"]) == list(unified_df["Test Key"].unique()) + ["Timing Summary"]
+    assert sheets["openpyxl"]["Timing Summary"] == [("Metric", "p50"), ("fetch", 1.5), ("total",)]
+
+
+def test_xlsxwriter_keeps_truncated_sheet_names_unique(tmp_path):
+    prefix = "A very long search term that is"
+    df = pd.DataFrame({"Test Key": [f"{prefix} one_P", f"{prefix} two_P", f"{prefix.upper()} three_E"],
+                       "Search Term": ["one", "two", "three"]})
+
+    sheets = read_sheets(write_workbook(df, str(tmp_path / "report.xlsx"), "xlsxwriter"))
+
+    # Names are compared case-insensitively, as Excel does
+    assert list(sheets) == [prefix[:31], f"{prefix[:29]}~2", f"{prefix.upper()[:29]}~3"]
+    assert [rows[1] for rows in sheets.values()] == [("one",), ("two",), ("three",)]
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "xlsxwriter"])
+def test_empty_report_gets_a_placeholder_sheet(tmp_path, engine):
+    df = pd.DataFrame(columns=["Test Key", "Search Term"])
+
+    assert list(read_sheets(write_workbook(df, str(tmp_path / "report.xlsx"), engine))) == ["No Results"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_split_workbooks_hold_every_sheet_once(tmp_path, unified_df, workers):
+    single = read_sheets(write_workbook(unified_df, str(tmp_path / "single.xlsx"), "xlsxwriter"))
+    extra_sheets = [("Timings", pd.DataFrame({"Search Term": ["one"], "Total (ms)": [12.5]}))]
+
+    filenames = write_split_workbooks(unified_df, str(tmp_path / "report"), 3, workers, "xlsxwriter", extra_sheets)
+
+    assert [filename.rsplit("/", 1)[1] for filename in filenames] == \
+        ["report_part01.xlsx", "report_part02.xlsx", "report_part03.xlsx"]
+    parts = [read_sheets(filename) for filename in filenames]
+    assert parts[0].pop("Timings") == [("Search Term", "Total (ms)"), ("one", 12.5)]
+    merged = {}
+    for part in parts:
+        assert not set(part) & set(merged)
+        merged.update(part)
+    assert merged == single
+    assert list(merged) == list(single)
+
+
+def test_unknown_engine_is_rejected():
+    assert resolve_engine("xlsxwriter") == "xlsxwriter"
+    with pytest.raises(ValueError, match="Unknown Excel engine"):
+        resolve_engine("xlwt")
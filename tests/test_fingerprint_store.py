@@ -0,0 +1,129 @@
+"""
+FingerprintStore reuse and prune rules, with items kept on disk instead of in memory
+"""
+
+import json
+import os
+
+from conftest import write_terms_workbook
+from utils.fingerprint_store import FingerprintStore
+
+
+def make_item(term, entity_type="P", ids=("101",)):
+    return {"search_term": term, "entity_type": entity_type,
+            "opensearch_results": {"pep": [{"ID": record_id, "Full_Name": term.upper()} for record_id in ids]},
+            "legacy_results": {"pep": []}}
+
+
+def make_store(tmp_path, **kwargs):
+    return FingerprintStore(str(tmp_path / "fingerprints.json"), **kwargs)
+
+
+def test_unchanged_passing_entity_is_reused(tmp_path):
+    store = make_store(tmp_path)
+    store.record(make_item("alpha"), "b1", "p1", passed=True)
+    store.save()
+
+    warm = make_store(tmp_path)
+    assert warm.get_previous_item("alpha", "P", "b1", "p1") == make_item("alpha")
+    assert warm.get_stats() == {"reused": 1, "retested": 0, "results_changed": 0, "entities": 1}
+
+
+def test_changed_or_failing_entity_is_tested_again(tmp_path):
+    store = make_store(tmp_path)
+    store.record(make_item("alpha"), "b1", "p1", passed=True)
+    store.record(make_item("beta"), "b2", "p2", passed=False)
+    store.save()
+
+    warm = make_store(tmp_path)
+    assert warm.get_previous_item("alpha", "P", "changed", "p1") is None
+    assert warm.get_previous_item("alpha", "P", "b1", "changed") is None
+    assert warm.get_previous_item("alpha", "E", "b1", "p1") is None
+    assert warm.get_previous_item("beta", "P", "b2", "p2") is None
+    assert warm.reused == 0
+
+
+def test_items_stay_on_disk(tmp_path):
+    store = make_store(tmp_path)
+    for i in range(5):
+        store.record(make_item(f"term {i}"), "b", "p", passed=True)
+    store.save()
+
+    with open(store.path, encoding="utf-8") as f:
+        entities = json.load(f)["entities"]
+    assert all("item" not in entry for entry in entities.values())
+    assert all("item" not in entry for entry in make_store(tmp_path)._entries.values())
+    with open(store.items_path, encoding="utf-8") as f:
+        assert [json.loads(line)["key"] for line in f] == [f"P|term {i}" for i in range(5)]
+
+
+def test_save_drops_entities_not_seen_this_run(tmp_path):
+    store = make_store(tmp_path)
+    for term in ("kept", "retested", "removed"):
+        store.record(make_item(term), "b", "p", passed=True)
+    store.save()
+
+    second = make_store(tmp_path)
+    assert second.get_previous_item("kept", "P", "b", "p") is not None
+    second.record(make_item("retested", ids=("102",)), "b", "p", passed=True)
+    second.save()
+
+    third = make_store(tmp_path)
+    assert sorted(third._entries) == ["P|kept", "P|retested"]
+    assert third.get_previous_item("kept", "P", "b", "p") == make_item("kept")
+    assert third.get_previous_item("retested", "P", "b", "p") == make_item("retested", ids=("102",))
+    assert second.results_changed == 1
+
+
+def test_mostly_stale_items_file_is_compacted(tmp_path):
+    store = make_store(tmp_path)
+    for run in range(4):
+        store = make_store(tmp_path)
+        for term in ("alpha", "beta"):
+            store.record(make_item(term, ids=(str(run),)), "b", "p", passed=True)
+        store.save()
+
+    with open(store.items_path, encoding="utf-8") as f:
+        lines = f.readlines()
+    assert len(lines) <= 4
+    warm = make_store(tmp_path)
+    assert warm.get_previous_item("alpha", "P", "b", "p") == make_item("alpha", ids=("3",))
+    assert warm.get_previous_item("beta", "P", "b", "p") == make_item("beta", ids=("3",))
+
+
+def test_damaged_items_file_means_a_retest(tmp_path):
+    store = make_store(tmp_path)
+    store.record(make_item("alpha"), "b", "p", passed=True)
+    store.save()
+    os.remove(store.items_path)
+
+    warm = make_store(tmp_path)
+    assert warm.get_previous_item("alpha", "P", "b", "p") is None
+    warm.record(make_item("beta"), "b", "p", passed=True)
+    warm.record(make_item("alpha"), "b", "p", passed=True)
+
+    # An offset that points at another entity's line is not trusted
+    entry = warm._entries["P|alpha"]
+    entry["item_offset"] = warm._entries["P|beta"]["item_offset"]
+    assert warm.get_previous_item("alpha", "P", "b", "p") is None
+
+
+def test_disabled_store_writes_nothing(tmp_path):
+    store = make_store(tmp_path, enabled=False)
+    store.record(make_item("alpha"), "b", "p", passed=True)
+    store.save()
+
+    assert store.get_previous_item("alpha", "P", "b", "p") is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_changed_only_run_reuses_passing_entities(tmp_path, run_harness, stub_server):
+    # No hits on either side: every entity passes
+    stub_server.hits_per_query = 0
+    excel_path = write_terms_workbook(tmp_path / "terms.xlsx", [(f"term {i}", "P", "") for i in range(6)])
+    first = run_harness(excel_path)
+    changed_only = run_harness(excel_path, changed_only=True)
+
+    assert changed_only.fingerprint_store.get_stats()["reused"] == 6
+    assert changed_only.api_client.get_stats()["requests"] == 0
+    assert changed_only.unified_comparison_data == first.unified_comparison_data
@@ -0,0 +1,99 @@
+"""
+Streamed HTML report: single-page output matches the per-term sections, and the sharded modes
+spread every row over shard pages linked from the index page
+"""
+
+import os
+import re
+
+import pytest
+
+from bench_unified_report import make_comparison_data
+from utils.html_report_generator import HTMLReportGenerator, WRITE_CHUNK_ROWS
+from utils.report_generator import ReportGenerator
+
+ROW_NUMBER = re.compile(r"<td><strong>(\d+)</strong></td>")
+SECTION_TITLE = re.compile(r"<h3>(.*?)</h3>")
+SHARD_LINK = re.compile(r'<a href="([^"]+)">')
+
+
+@pytest.fixture(scope="module")
+def unified_df(tmp_path_factory):
+    report_generator = ReportGenerator(str(tmp_path_factory.mktemp("results")))
+    df = report_generator.build_unified_dataframe(make_comparison_data(25, 10, 0.7, seed=5))
+    return df.sort_values(["Test Key", "OpenSearch Schema", "OpenSearch ID"])
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def shard_pages(index_path):
+    """Shard pages linked from the index page, in link order without repeats"""
+    links = [link for link in SHARD_LINK.findall(read(index_path)) if link.endswith(".html")]
+    return [os.path.join(os.path.dirname(index_path), link) for link in dict.fromkeys(links)]
+
+
+def test_single_page_streams_the_term_sections(tmp_path, unified_df):
+    generator = HTMLReportGenerator("single")
+    filename = generator.generate_unified_comparison_report(unified_df, str(tmp_path / "report.html"),
+                                                            summary_html="<p>timings</p>")
+
+    page = read(filename)
+    sections = "".join(generator.render_term_section(search_term, rows, stats)
+                       for search_term, rows, stats in generator.iter_term_groups(unified_df))
+    assert sections in page
+    assert page.index("<p>timings</p>") > page.index(sections)
+    assert len(ROW_NUMBER.findall(page)) == len(unified_df)
+
+
+def test_large_term_is_numbered_across_write_chunks():
+    rows = [{"Type": "Person", "OpenSearch Name": f"name {i}", "OpenSearch ID": str(i), "OpenSearch Schema": "PEP",
+             "Legacy Name": "", "Legacy ID": "", "Legacy Schema": ""} for i in range(WRITE_CHUNK_ROWS * 2 + 7)]
+
+    section = HTMLReportGenerator().render_term_section("big term", rows)
+
+    assert [int(number) for number in ROW_NUMBER.findall(section)] == list(range(1, len(rows) + 1))
+    assert f"Total: {len(rows)}" in section and "Legacy Only: 0" in section
+
+
+def test_term_mode_writes_one_shard_per_term(tmp_path, unified_df):
+    index_path = HTMLReportGenerator("term").generate_unified_comparison_report(
+        unified_df, str(tmp_path / "report.html"))
+
+    terms = list(unified_df["Search Term"].unique())
+    shards = shard_pages(index_path)
+    assert len(shards) == len(terms)
+    assert sorted(os.listdir(tmp_path / "report_shards")) == [os.path.basename(shard) for shard in shards]
+    for search_term, shard in zip(terms, shards):
+        page = read(shard)
+        assert SECTION_TITLE.findall(page) == [search_term]
+        assert len(ROW_NUMBER.findall(page)) == (unified_df["Search Term"] == search_term).sum()
+        assert '<a href="../report.html">' in page
+
+
+@pytest.mark.parametrize("shard_rows", [1, 17, 10000])
+def test_rows_mode_packs_and_splits_terms(tmp_path, unified_df, shard_rows):
+    index_path = HTMLReportGenerator("rows", shard_rows=shard_rows).generate_unified_comparison_report(
+        unified_df, str(tmp_path / "report.html"))
+
+    shards = shard_pages(index_path)
+    assert len(shards) == len(os.listdir(tmp_path / "report_shards"))
+    numbers_per_term = {}
+    for shard in shards:
+        page = read(shard)
+        assert len(ROW_NUMBER.findall(page)) <= shard_rows
+        # Each section is followed by its rows; continued sections go on numbering where the last one stopped
+        for section in page.split('<div class="search-term-section">')[1:]:
+            search_term = SECTION_TITLE.search(section).group(1).removesuffix(" (continued)")
+            numbers_per_term.setdefault(search_term, []).extend(int(n) for n in ROW_NUMBER.findall(section))
+
+    assert list(numbers_per_term) == list(unified_df["Search Term"].unique())
+    for search_term, numbers in numbers_per_term.items():
+        assert numbers == list(range(1, (unified_df["Search Term"] == search_term).sum() + 1))
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError, match="Unknown HTML report mode"):
+        HTMLReportGenerator("pages")
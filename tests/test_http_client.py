@@ -0,0 +1,69 @@
+"""
+SearchApiClient connection reuse, connect counting and request timings
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from utils.http_client import SearchApiClient
+from utils.stub_server import StubSearchServer
+
+PAYLOAD = {"query": "john doe", "schemas": ["pep"], "limit": 5}
+
+
+@pytest.fixture
+def stub():
+    stub = StubSearchServer().start()
+    yield stub
+    stub.stop()
+
+
+def make_client(stub, pool_size=4):
+    return SearchApiClient({"url": stub.url, "timeout": 5}, {"x-api-key": "test-key"}, pool_size=pool_size)
+
+
+def test_keep_alive_reuses_one_connection(stub):
+    client = make_client(stub)
+    timings = []
+    for _ in range(5):
+        assert client.post(PAYLOAD).json() == stub.search(PAYLOAD)
+        timings.append(client.last_request_timing())
+    client.close()
+
+    assert client.get_stats()["requests"] == 5
+    assert client.connections_opened() == 1
+    assert timings[0]["connect_seconds"] > 0
+    assert [timing["connect_seconds"] for timing in timings[1:]] == [0.0] * 4
+    assert all(timing["status"] == 200 and timing["response_bytes"] > 0 for timing in timings)
+
+
+def test_every_reconnect_is_counted(stub):
+    # An HTTP/1.0 server closes the connection after each response, so every request connects again
+    stub.httpd.RequestHandlerClass.protocol_version = "HTTP/1.0"
+    client = make_client(stub)
+    for _ in range(5):
+        client.post(PAYLOAD)
+    client.close()
+    assert client.connections_opened() == 5
+
+
+def test_pool_bounds_concurrent_connections(stub):
+    stub.latency_ms = 5
+    client = make_client(stub, pool_size=3)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = list(executor.map(lambda _: client.post(PAYLOAD).status_code, range(40)))
+    client.close()
+    assert statuses == [200] * 40
+    assert 1 <= client.connections_opened() <= 3
+
+
+def test_error_status_raises_with_response(stub):
+    stub.error_rate = 1
+    client = make_client(stub)
+    with pytest.raises(requests.exceptions.HTTPError) as error:
+        client.post(PAYLOAD)
+    client.close()
+    assert error.value.response.status_code == 503
+    assert client.last_request_timing()["status"] == 503
@@ -0,0 +1,89 @@
+"""
+IncrementalReportWriter: per-entity sheets and HTML sections, sheet names and partial reports
+"""
+
+import openpyxl
+import pytest
+
+from utils.incremental_report_writer import REPORT_COLUMNS
+from utils.report_generator import ReportGenerator
+from utils.search_record import SearchRecord
+
+
+def make_item(term, opensearch_ids=(), legacy_ids=()):
+    return {
+        "search_term": term,
+        "entity_type": "P",
+        "opensearch_results": {"pep": [SearchRecord(recid=int(i), ID=i, Full_Name=f"OS {i}") for i in opensearch_ids]},
+        "legacy_results": {"pep": [SearchRecord(recid=int(i), ID=i, Full_Name=f"GDC {i}") for i in legacy_ids]},
+    }
+
+
+def read_sheets(excel_filename):
+    workbook = openpyxl.load_workbook(excel_filename, read_only=True)
+    sheets = {sheet.title: [list(row) for row in sheet.iter_rows(values_only=True)] for sheet in workbook.worksheets}
+    workbook.close()
+    return sheets
+
+
+@pytest.fixture
+def report_generator(tmp_path):
+    return ReportGenerator(str(tmp_path))
+
+
+def test_rows_match_the_unified_rows(report_generator):
+    items = [make_item("beta", ["2", "1"], ["1", "3"]), make_item("alpha", ["5"])]
+    with report_generator.open_incremental_report("report") as writer:
+        for item in items:
+            writer.add_item(item)
+        html_filename, excel_filename = writer.html_filename, writer.excel_filename
+
+    sheets = read_sheets(excel_filename)
+    assert list(sheets) == ["beta", "alpha"]
+    for item in items:
+        rows = sorted(report_generator.build_unified_rows(item),
+                      key=lambda row: (str(row["OpenSearch Schema"]), str(row["OpenSearch ID"])))
+        expected = [[row[column] or None for column in REPORT_COLUMNS] for row in rows]
+        assert sheets[item["search_term"]] == [REPORT_COLUMNS] + expected
+    assert (writer.entity_count, writer.total_records, writer.matched_records) == (2, 4, 1)
+
+    with open(html_filename, encoding="utf-8") as f:
+        html = f.read()
+    assert html.index("beta") < html.index("alpha")
+    assert html.rstrip().endswith("</html>")
+
+
+def test_entities_without_rows_get_no_sheet(report_generator):
+    with report_generator.open_incremental_report("report", create_html_report=False) as writer:
+        writer.add_item(make_item("empty"))
+    assert list(read_sheets(writer.excel_filename)) == ["No Results"]
+    assert writer.entity_count == 0
+
+
+def test_truncated_sheet_names_stay_unique(report_generator):
+    prefix = "x" * 31
+    terms = [prefix + " one", prefix + " two", prefix + " three", "Alpha", "alpha", "alpha"]
+    with report_generator.open_incremental_report("report", create_html_report=False) as writer:
+        for i, term in enumerate(terms):
+            writer.add_item(make_item(term, [str(i + 1)]))
+
+    sheets = read_sheets(writer.excel_filename)
+    assert list(sheets) == [prefix, "x" * 29 + "~2", "x" * 29 + "~3", "Alpha", "alpha~2"]
+    # Items with the same search term share their sheet
+    assert [row[3] for row in sheets["alpha~2"][1:]] == ["5", "6"]
+
+
+def test_html_is_readable_before_close(report_generator):
+    writer = report_generator.open_incremental_report("report", create_excel_sheets=False)
+    writer.add_item(make_item("alpha", ["1"]))
+    with open(writer.html_filename, encoding="utf-8") as f:
+        assert "alpha" in f.read()
+    writer.close()
+
+
+def test_interrupted_run_still_saves_the_workbook(report_generator):
+    with pytest.raises(KeyboardInterrupt):
+        with report_generator.open_incremental_report("report") as writer:
+            writer.add_item(make_item("alpha", ["1"]))
+            raise KeyboardInterrupt
+    assert list(read_sheets(writer.excel_filename)) == ["alpha"]
@@ -0,0 +1,102 @@
+"""
+JSON backends: typed and generic decoding give the same transformed results as json.loads
+"""
+
+import json
+import math
+
+import pytest
+
+from bench_json_backend import make_response
+from excel_driven_regression_test import ExcelDrivenRegressionTest
+from utils.json_backend import JsonBackend, is_typed_response, msgspec, orjson, resolve_backend
+from utils.schema_router import SchemaRouter
+
+BACKENDS = [("json", False)]
+if orjson is not None:
+    BACKENDS.append(("orjson", False))
+if msgspec is not None:
+    BACKENDS += [("msgspec", False), ("msgspec", True)]
+
+EDGE_CASE_BODIES = [
+    # Other hit list keys, hits without _source, IDs under other names, nulls and missing fields
+    {"data": [{"_index": "gdc-pep", "recid": 3, "ID": "1011", "Full_Name": "NO SOURCE", "Other_Names": None},
+              {"_index": "gdc-pep", "ID": "1012", "Full_Name": "NO RECID"}]},
+    {"hits": [{"_index": "gdc-watch", "_id": "2021", "_source": {"record_id": "2021", "First_Name": "A",
+                                                                 "Last_Name": "B", "otherNames": "C"}}]},
+    {"results": [{"_index": "gdc-icij", "_id": "8011", "_source": {"recid": 7, "Entity_Name": "ACME",
+                                                                   "Entity_Type": "Company", "RecType": "ICIJ"}},
+                 {"_index": "gdc-sanction", "_source": None, "ID": "5011", "name": "TOP LEVEL"}]},
+    {"results": None},
+    {"results": []},
+    # Shapes the typed decoder does not know are decoded generically
+    {"hits": {"total": 1, "hits": [{"_index": "gdc-pep", "_id": "1", "_source": {"ID": "1"}}]}},
+    [],
+]
+
+
+@pytest.fixture(scope="module")
+def harness():
+    # transform_opensearch_response and the normalizers use no other instance state
+    harness = ExcelDrivenRegressionTest.__new__(ExcelDrivenRegressionTest)
+    harness.schema_router = SchemaRouter()
+    return harness
+
+
+def backend_id(backend):
+    name, typed = backend
+    return f"{name}-typed" if typed else name
+
+
+@pytest.mark.parametrize("backend", BACKENDS, ids=backend_id)
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_synthetic_responses_transform_alike(harness, backend, seed):
+    name, typed = backend
+    body = make_response(200, extra_fields=10, seed=seed)
+
+    decoded = JsonBackend(name).decode_response(body, typed=typed)
+
+    assert is_typed_response(decoded) == typed
+    assert harness.transform_opensearch_response(decoded) == harness.transform_opensearch_response(json.loads(body))
+
+
+@pytest.mark.parametrize("backend", BACKENDS, ids=backend_id)
+@pytest.mark.parametrize("response", EDGE_CASE_BODIES)
+def test_edge_case_responses_transform_alike(harness, backend, response):
+    name, typed = backend
+    body = json.dumps(response).encode("utf-8")
+
+    decoded = JsonBackend(name).decode_response(body, typed=typed)
+
+    assert harness.transform_opensearch_response(decoded) == harness.transform_opensearch_response(response)
+
+
+@pytest.mark.parametrize("backend", BACKENDS, ids=backend_id)
+@pytest.mark.parametrize("wrap", [lambda responses: {"responses": responses}, lambda responses: responses],
+                         ids=["object", "list"])
+def test_batch_responses_transform_alike(harness, backend, wrap):
+    name, typed = backend
+    responses = [json.loads(make_response(20, 3, seed)) for seed in range(3)] + [EDGE_CASE_BODIES[0]]
+
+    decoded = JsonBackend(name).decode_batch_response(json.dumps(wrap(responses)), typed=typed)
+
+    if isinstance(decoded, dict):
+        decoded = decoded["responses"]
+    assert [harness.transform_opensearch_response(response) for response in decoded] == \
+        [harness.transform_opensearch_response(response) for response in responses]
+
+
+@pytest.mark.parametrize("name", [name for name, typed in BACKENDS if not typed])
+def test_input_the_fast_decoder_rejects_falls_back_to_json(name):
+    backend = JsonBackend(name)
+
+    assert math.isnan(backend.loads(b'{"score": NaN}')["score"])
+    with pytest.raises(ValueError):
+        backend.loads(b'{"results": [')
+
+
+def test_backend_resolution():
+    assert resolve_backend("json") == "json"
+    assert resolve_backend("auto") == ("msgspec" if msgspec is not None else "orjson" if orjson is not None else "json")
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        resolve_backend("simplejson")
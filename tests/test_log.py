@@ -0,0 +1,102 @@
+"""
+Leveled logging: configure_logging levels and handlers, and JSON-lines records with extra fields
+"""
+
+import json
+import logging
+
+import pytest
+
+from conftest import write_terms_workbook
+from utils.log import JsonLinesFormatter, configure_logging, get_logger
+
+
+@pytest.fixture(autouse=True)
+def restore_logger():
+    logger = get_logger()
+    handlers, level, propagate = list(logger.handlers), logger.level, logger.propagate
+    yield
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    for handler in handlers:
+        logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = propagate
+
+
+def read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_json_lines_carry_extra_fields(tmp_path):
+    log_file = tmp_path / "run.log"
+    configure_logging("debug", "json", str(log_file))
+
+    get_logger("fetch").info("Fetched %s in %d ms", "alpha", 12, extra={"entity": "alpha", "fetch_ms": 12})
+    try:
+        raise ValueError("bad body")
+    except ValueError:
+        get_logger("fetch").exception("Transform failed")
+
+    first, second = read_lines(log_file)
+    assert {key: first[key] for key in ("level", "logger", "message", "entity", "fetch_ms")} == {
+        "level": "info", "logger": "gdc.fetch", "message": "Fetched alpha in 12 ms", "entity": "alpha", "fetch_ms": 12
+    }
+    assert first["time"].endswith("+00:00")
+    assert second["level"] == "error" and "ValueError: bad body" in second["exception"]
+
+
+@pytest.mark.parametrize("level, shown", [
+    ("debug", ["debug", "info", "warning"]),
+    ("info", ["info", "warning"]),
+    ("quiet", ["warning"]),
+    ("error", []),
+])
+def test_levels(tmp_path, level, shown):
+    log_file = tmp_path / "run.log"
+    logger = configure_logging(level, "json", str(log_file))
+    log = get_logger("regression")
+
+    log.debug("debug")
+    log.info("info")
+    log.warning("warning")
+
+    assert [line["message"] for line in read_lines(log_file)] == shown
+    assert logger.propagate is False
+
+
+def test_configure_replaces_the_previous_handler(tmp_path, capsys):
+    configure_logging("info", "json", str(tmp_path / "first.log"))
+    configure_logging("info")
+    get_logger().info("plain")
+
+    assert len(get_logger().handlers) == 1
+    assert capsys.readouterr().out == "plain\n"
+    assert read_lines(tmp_path / "first.log") == []
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError, match="Unknown log level"):
+        configure_logging("verbose")
+    with pytest.raises(ValueError, match="Unknown log format"):
+        configure_logging("info", "xml")
+
+
+def test_formatter_keeps_non_json_values_readable():
+    record = logging.LogRecord("gdc", logging.INFO, __file__, 1, "done", None, None)
+    value = object()
+    record.payload = value
+
+    assert json.loads(JsonLinesFormatter().format(record))["payload"] == str(value)
+
+
+def test_run_logs_per_entity_records(tmp_path, run_harness):
+    log_file = tmp_path / "run.log"
+    terms = [("alpha", "P", ""), ("beta", "E", "")]
+    run_harness(write_terms_workbook(tmp_path / "terms.xlsx", terms),
+                log_level="info", log_format="json", log_file=str(log_file))
+
+    processed = [line for line in read_lines(log_file) if "opensearch_hits" in line]
+    assert sorted((line["entity"], line["entity_type"]) for line in processed) == [("alpha", "P"), ("beta", "E")]
@@ -0,0 +1,102 @@
+"""
+Pipeline result order, in-flight limit, error propagation and cancellation
+"""
+
+import itertools
+import random
+import threading
+import time
+
+import pytest
+
+from utils.pipeline import Pipeline
+
+
+def pipeline_threads():
+    return [thread for thread in threading.enumerate() if thread.name.startswith("pipeline-")]
+
+
+def wait_for_pipeline_threads(timeout=5.0):
+    """Wait until every pipeline thread has exited, returning the ones still alive"""
+    deadline = time.monotonic() + timeout
+    while pipeline_threads() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return pipeline_threads()
+
+
+def jitter(item):
+    time.sleep(random.random() * 0.005)
+    return item
+
+
+def test_results_in_source_order():
+    pipeline = Pipeline([
+        ("fetch", lambda item: jitter(item * 2), 8),
+        ("compare", lambda item: jitter(item + 1), 3),
+        ("report", jitter, 1),
+    ], queue_size=4)
+    assert list(pipeline.run(range(200))) == [item * 2 + 1 for item in range(200)]
+
+    stats = pipeline.get_stats()
+    assert [stats[name]["items"] for name in ("fetch", "compare", "report")] == [200, 200, 200]
+    assert stats["fetch"]["workers"] == 8
+    assert not wait_for_pipeline_threads()
+
+
+def test_in_flight_limit():
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def enter(item):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        return jitter(item)
+
+    pipeline = Pipeline([("fetch", enter, 8)], queue_size=8, max_in_flight=3)
+    for item in pipeline.run(range(100)):
+        with lock:
+            in_flight[0] -= 1
+    assert in_flight == [0, 3]
+
+
+def test_stage_error_cancels_the_run():
+    consumed = []
+
+    def source():
+        for item in itertools.count():
+            consumed.append(item)
+            yield item
+
+    def fail_on_five(item):
+        if item == 5:
+            raise RuntimeError("stage failed")
+        return item
+
+    pipeline = Pipeline([("fetch", fail_on_five, 2), ("report", jitter, 1)], queue_size=2, max_in_flight=4)
+    results = []
+    with pytest.raises(RuntimeError, match="stage failed"):
+        for item in pipeline.run(source()):
+            results.append(item)
+    assert results == list(range(len(results)))
+    assert len(results) <= 5
+    assert not wait_for_pipeline_threads()
+    # The source stops once the error is seen, bounded by the in-flight window
+    assert len(consumed) <= 5 + 4 + 1
+
+
+def test_source_error_is_raised():
+    def source():
+        yield 1
+        raise ValueError("bad row")
+
+    with pytest.raises(ValueError, match="bad row"):
+        list(Pipeline([("fetch", jitter, 2)]).run(source()))
+    assert not wait_for_pipeline_threads()
+
+
+def test_consumer_stopping_early_cancels_the_run():
+    results = Pipeline([("fetch", jitter, 4)], queue_size=2).run(itertools.count())
+    assert [next(results) for _ in range(3)] == [0, 1, 2]
+    results.close()
+    assert not wait_for_pipeline_threads()
@@ -0,0 +1,124 @@
+"""
+RateLimiter AIMD concurrency, Retry-After pauses, token bucket and backoff delays
+"""
+
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+from utils.rate_limiter import RateLimiter, is_overload_status, retry_after_seconds
+
+
+class FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+def test_overload_in_one_round_decreases_the_limit_once():
+    limiter = RateLimiter(max_concurrency=8)
+    admitted = [limiter.acquire() for _ in range(8)]
+    for admitted_at in admitted:
+        limiter.release(admitted_at, 503)
+
+    assert limiter.concurrency_limit == 4
+    assert limiter.get_stats()["decreases"] == 1
+    assert limiter.errors == 8
+
+    # A request admitted after the decrease reports a new overload
+    limiter.release(limiter.acquire(), 429)
+    assert limiter.concurrency_limit == 2
+    assert (limiter.decreases, limiter.throttled) == (2, 1)
+
+
+def test_limit_grows_additively_and_stays_within_bounds():
+    limiter = RateLimiter(max_concurrency=4, min_concurrency=2)
+    for _ in range(3):
+        limiter.release(limiter.acquire(), None)
+    assert limiter.concurrency_limit == 2
+    assert limiter.min_limit_seen == 2
+
+    # Each success adds 1/limit, i.e. about one slot per limit successful requests
+    for _ in range(2):
+        limiter.release(limiter.acquire(), 200)
+    assert limiter.concurrency_limit == pytest.approx(2 + 1 / 2 + 1 / 2.5)
+    for _ in range(20):
+        limiter.release(limiter.acquire(), 200)
+    assert limiter.concurrency_limit == 4
+
+
+def test_client_errors_leave_the_limit_alone():
+    limiter = RateLimiter(max_concurrency=4)
+    limiter.release(limiter.acquire(), 404)
+
+    assert limiter.concurrency_limit == 4
+    assert limiter.decreases == 0 and limiter.errors == 0
+
+
+def test_acquire_waits_for_a_free_slot():
+    limiter = RateLimiter(max_concurrency=1, adaptive=False)
+    first = limiter.acquire()
+    admitted = threading.Event()
+    thread = threading.Thread(target=lambda: (limiter.acquire(), admitted.set()))
+    thread.start()
+
+    assert not admitted.wait(0.1)
+    limiter.release(first, 200)
+    assert admitted.wait(1)
+    thread.join()
+
+
+def test_retry_after_pauses_every_caller():
+    limiter = RateLimiter(max_concurrency=4, adaptive=False)
+    limiter.release(limiter.acquire(), 429, retry_after=0.2)
+
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+    assert limiter.wait_seconds >= 0.15
+
+
+def test_token_bucket_spaces_requests():
+    limiter = RateLimiter(rate_per_second=20, burst=1)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.release(limiter.acquire(), 200)
+
+    # The first request uses the full bucket, the other four wait 1/20 s each
+    assert time.monotonic() - start >= 0.18
+    assert limiter.enabled
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({}, None),
+    ({"Retry-After": "2.5"}, 2.5),
+    ({"Retry-After": "-3"}, 0.0),
+    ({"Retry-After": "soon"}, None),
+    ({"Retry-After": formatdate(0, usegmt=True)}, 0.0),
+])
+def test_retry_after_header(headers, expected):
+    assert retry_after_seconds(FakeResponse(headers)) == expected
+
+
+def test_retry_after_http_date():
+    seconds = retry_after_seconds(FakeResponse({"Retry-After": formatdate(time.time() + 30, usegmt=True)}))
+    assert 28 <= seconds <= 30
+    assert retry_after_seconds(None) is None
+
+
+def test_backoff_delay_is_jittered_capped_and_honors_retry_after(monkeypatch):
+    limiter = RateLimiter(backoff_base=0.5, backoff_max=3)
+    monkeypatch.setattr("utils.rate_limiter.random.uniform", lambda low, high: high)
+
+    assert [limiter.backoff_delay(attempt) for attempt in range(5)] == [0.5, 1, 2, 3, 3]
+    assert limiter.backoff_delay(0, retry_after=10) == 10
+
+    monkeypatch.setattr("utils.rate_limiter.random.uniform", lambda low, high: low)
+    assert limiter.backoff_delay(4) == 0
+    assert limiter.backoff_delay(4, retry_after=1.5) == 1.5
+
+
+def test_overload_statuses():
+    assert [is_overload_status(status) for status in (None, 200, 404, 429, 500, 503)] == \
+        [True, False, False, True, True, True]
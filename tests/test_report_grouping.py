@@ -0,0 +1,71 @@
+"""
+One-pass grouping of the unified rows must give each Excel sheet and HTML section
+the same rows and counts as filtering the DataFrame per Test Key / search term
+"""
+
+import openpyxl
+import pytest
+
+from bench_unified_report import make_comparison_data
+from utils.excel_writer import _sheet_groups, split_by_test_key, write_workbook
+from utils.html_report_generator import HTMLReportGenerator, ROW_COLUMNS
+from utils.report_generator import ReportGenerator
+
+
+@pytest.fixture(scope="module")
+def unified_df(tmp_path_factory):
+    report_generator = ReportGenerator(str(tmp_path_factory.mktemp("results")))
+    df = report_generator.build_unified_dataframe(make_comparison_data(30, 8, 0.7, seed=3))
+    return df.sort_values(["Test Key", "OpenSearch Schema", "OpenSearch ID"])
+
+
+def test_sheet_groups_match_per_key_filtering(unified_df):
+    groups = list(_sheet_groups(unified_df))
+
+    assert [sheet_name for sheet_name, _, _ in groups] == list(unified_df["Test Key"].unique())
+    for sheet_name, columns, rows in groups:
+        expected = unified_df[unified_df["Test Key"] == sheet_name].drop(columns="Test Key")
+        assert columns == list(expected.columns)
+        assert list(rows) == list(expected.itertuples(index=False, name=None))
+
+
+def test_workbook_sheets_hold_their_test_key_rows(tmp_path, unified_df):
+    filename = write_workbook(unified_df, str(tmp_path / "report.xlsx"))
+
+    workbook = openpyxl.load_workbook(filename, read_only=True)
+    assert workbook.sheetnames == list(unified_df["Test Key"].unique())
+    for sheet_name in workbook.sheetnames:
+        expected = unified_df[unified_df["Test Key"] == sheet_name].drop(columns="Test Key")
+        values = list(workbook[sheet_name].iter_rows(values_only=True))
+        assert list(values[0]) == list(expected.columns)
+        assert [tuple("" if value is None else value for value in row) for row in values[1:]] == \
+            list(expected.itertuples(index=False, name=None))
+    workbook.close()
+
+
+def test_term_groups_match_per_term_filtering(unified_df):
+    groups = list(HTMLReportGenerator().iter_term_groups(unified_df))
+
+    assert [search_term for search_term, _, _ in groups] == list(unified_df["Search Term"].unique())
+    for search_term, rows, stats in groups:
+        term_df = unified_df[unified_df["Search Term"] == search_term]
+        assert rows == term_df[ROW_COLUMNS].to_dict("records")
+        has_opensearch = term_df["OpenSearch ID"] != ""
+        has_legacy = term_df["Legacy ID"] != ""
+        assert stats == {
+            "total": len(term_df),
+            "opensearch": has_opensearch.sum(),
+            "legacy": has_legacy.sum(),
+            "matched": (has_opensearch & has_legacy).sum()
+        }
+
+
+@pytest.mark.parametrize("parts", [1, 3, 7, 100])
+def test_split_keeps_whole_test_keys_in_order(unified_df, parts):
+    chunks = split_by_test_key(unified_df, parts)
+
+    assert 1 <= len(chunks) <= parts
+    assert all(len(chunk) for chunk in chunks)
+    keys = [list(chunk["Test Key"].unique()) for chunk in chunks]
+    assert sum(keys, []) == list(unified_df["Test Key"].unique())
+    assert sum(len(chunk) for chunk in chunks) == len(unified_df)
@@ -0,0 +1,96 @@
+"""
+Parquet report history: runs round-trip through write_run/load with partition pruning,
+and a past run's Excel report can be derived from the history
+"""
+
+import os
+
+import openpyxl
+import pytest
+
+from bench_unified_report import make_comparison_data
+from utils.report_generator import ReportGenerator, UNIFIED_COLUMNS
+from utils.report_history import ReportHistory, RUN_COLUMN, SCHEMA_COLUMN
+
+pytest.importorskip("pyarrow")
+
+SORT_COLUMNS = ["Test Key", "OpenSearch Schema", "OpenSearch ID", "Legacy ID"]
+
+
+def make_run(results_directory, seed):
+    df = ReportGenerator(results_directory).build_unified_dataframe(make_comparison_data(15, 8, 0.7, seed=seed))
+    return df.sort_values(SORT_COLUMNS).reset_index(drop=True)
+
+
+def rows(df):
+    return sorted(df[UNIFIED_COLUMNS].astype(str).values.tolist())
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = ReportHistory(str(tmp_path / "history"))
+    runs = {"20260101_090000": make_run(str(tmp_path / "results"), 1),
+            "20260102_090000": make_run(str(tmp_path / "results"), 2)}
+    for run_timestamp, df in runs.items():
+        history.write_run(df, run_timestamp)
+    return history, runs
+
+
+def test_empty_history(tmp_path):
+    history = ReportHistory(str(tmp_path / "history"))
+
+    assert history.list_runs() == []
+    assert list(history.load(columns=["Test Key"]).columns) == ["Test Key", RUN_COLUMN, SCHEMA_COLUMN]
+
+
+def test_runs_round_trip(history):
+    history, runs = history
+
+    assert history.list_runs() == sorted(runs)
+    loaded = history.load()
+    for run_timestamp, df in runs.items():
+        assert rows(loaded[loaded[RUN_COLUMN] == run_timestamp]) == rows(df)
+
+
+def test_rows_are_partitioned_by_the_system_that_returned_them(tmp_path, history):
+    history, runs = history
+    df = runs["20260101_090000"]
+
+    loaded = history.load(runs=["20260101_090000"])
+    expected = df["OpenSearch Schema"].where(df["OpenSearch Schema"] != "", df["Legacy Schema"])
+    assert sorted(loaded[SCHEMA_COLUMN]) == sorted(expected)
+    partitions = os.listdir(os.path.join(history.directory, f"{RUN_COLUMN}=20260101_090000"))
+    assert sorted(partitions) == sorted(f"{SCHEMA_COLUMN}={schema}" for schema in expected.unique())
+
+
+def test_load_prunes_runs_schemas_and_columns(history):
+    history, runs = history
+    df = runs["20260102_090000"]
+
+    loaded = history.load(runs=["20260102_090000"], schemas=["pep", "Watch"],
+                          columns=["Search Term", "OpenSearch ID", "Legacy ID"])
+
+    assert list(loaded.columns) == ["Search Term", "OpenSearch ID", "Legacy ID", RUN_COLUMN, SCHEMA_COLUMN]
+    assert set(loaded[RUN_COLUMN]) == {"20260102_090000"}
+    schema = df["OpenSearch Schema"].where(df["OpenSearch Schema"] != "", df["Legacy Schema"])
+    expected = df[schema.isin(["PEP", "WATCH"])][["Search Term", "OpenSearch ID", "Legacy ID"]]
+    assert sorted(loaded[expected.columns].values.tolist()) == sorted(expected.values.tolist())
+
+
+def test_export_excel_from_history_matches_the_run(tmp_path, history):
+    history, runs = history
+    report_generator = ReportGenerator(str(tmp_path / "results"), parquet_directory=history.directory)
+    df = runs["20260101_090000"]
+
+    filename = report_generator.export_excel_from_history("20260101_090000")
+
+    workbook = openpyxl.load_workbook(filename, read_only=True)
+    assert workbook.sheetnames == list(df["Test Key"].unique())
+    for sheet_name in workbook.sheetnames:
+        values = list(workbook[sheet_name].iter_rows(values_only=True))
+        expected = df[df["Test Key"] == sheet_name].drop(columns="Test Key")
+        assert list(values[0]) == list(expected.columns)
+        assert sorted(tuple("" if value is None else str(value) for value in row) for row in values[1:]) == \
+            sorted(expected.astype(str).itertuples(index=False, name=None))
+    workbook.close()
+    assert report_generator.export_excel_from_history("20991231_000000") is None
@@ -0,0 +1,134 @@
+"""
+ResponseCache TTL handling in the normal, offline and refresh modes, eviction and the cache mode setting
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from config import config
+from utils.response_cache import ResponseCache
+
+URL = "http://localhost:9200/search"
+PAYLOAD = {"query": "john doe", "limit": 10}
+RESPONSE = {"results": [{"_id": "1", "_source": {"Full_Name": "JOHN DOE"}}]}
+
+
+def age_entry(cache, seconds):
+    """Move the stored_at time of the cached entry back"""
+    path = cache._path_for_key(cache.make_key(URL, PAYLOAD))
+    with open(path, "r", encoding="utf-8") as f:
+        entry = json.load(f)
+    entry["stored_at"] -= seconds
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+
+
+def test_store_and_hit(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    assert cache.get(URL, PAYLOAD) is None
+    cache.put(URL, PAYLOAD, RESPONSE)
+    assert cache.get(URL, PAYLOAD) == RESPONSE
+    assert cache.get(URL, dict(PAYLOAD, limit=20)) is None
+    assert {key: cache.get_stats()[key] for key in ("hits", "misses", "stores")} == {"hits": 1, "misses": 2, "stores": 1}
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl_seconds=60)
+    cache.put(URL, PAYLOAD, RESPONSE)
+    age_entry(cache, 30)
+    assert cache.get(URL, PAYLOAD) == RESPONSE
+    age_entry(cache, 60)
+    assert cache.get(URL, PAYLOAD) is None
+
+
+def test_zero_ttl_never_expires(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl_seconds=0)
+    cache.put(URL, PAYLOAD, RESPONSE)
+    age_entry(cache, 10 * 365 * 86400)
+    assert cache.get(URL, PAYLOAD) == RESPONSE
+
+
+def test_offline_serves_expired_entries_and_stores_nothing(tmp_path):
+    ResponseCache(str(tmp_path), ttl_seconds=60).put(URL, PAYLOAD, RESPONSE)
+    cache = ResponseCache(str(tmp_path), ttl_seconds=60, mode="offline")
+    age_entry(cache, 3600)
+
+    assert cache.offline
+    assert cache.get(URL, PAYLOAD) == RESPONSE
+    other = dict(PAYLOAD, query="jane doe")
+    cache.put(URL, other, RESPONSE)
+    assert cache.get(URL, other) is None
+    assert cache.get_stats()["stores"] == 0
+
+
+def test_refresh_ignores_and_overwrites_entries(tmp_path):
+    ResponseCache(str(tmp_path)).put(URL, PAYLOAD, RESPONSE)
+    cache = ResponseCache(str(tmp_path), mode="refresh")
+    assert cache.get(URL, PAYLOAD) is None
+    cache.put(URL, PAYLOAD, {"results": []})
+    assert ResponseCache(str(tmp_path)).get(URL, PAYLOAD) == {"results": []}
+
+
+def test_disabled_cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache"), mode="offline", enabled=False)
+    assert not cache.offline
+    cache.put(URL, PAYLOAD, RESPONSE)
+    assert cache.get(URL, PAYLOAD) is None
+    assert not (tmp_path / "cache").exists()
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ResponseCache(str(tmp_path), mode="bogus")
+
+
+def fill(cache, count, size=1000):
+    """Store count distinct entries of roughly size bytes each, oldest first"""
+    for i in range(count):
+        cache.put(URL, dict(PAYLOAD, query=f"term {i}"), {"results": [], "padding": "x" * size})
+
+
+def test_eviction_trims_to_the_low_water_mark(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path), max_size_mb=20000 / (1024 * 1024))
+    walks = []
+    iter_entries = cache._iter_entries
+    monkeypatch.setattr(cache, "_iter_entries", lambda: walks.append(1) or iter_entries())
+
+    fill(cache, 40)
+    stats = cache.get_stats()
+    assert stats["size_mb"] * 1024 * 1024 <= cache.max_bytes
+    assert sum(size for _, _, size in iter_entries()) == pytest.approx(stats["size_mb"] * 1024 * 1024)
+    # Each eviction frees about 10% of the cache; trimming to the limit only would walk it
+    # on each of the ~22 stores past the limit
+    assert stats["evictions"] > 0
+    assert len(walks) <= 10
+    # The newest entries are kept
+    assert cache.get(URL, dict(PAYLOAD, query="term 39")) is not None
+    assert cache.get(URL, dict(PAYLOAD, query="term 0")) is None
+
+
+def test_evict_removes_expired_entries(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl_seconds=60)
+    cache.put(URL, PAYLOAD, RESPONSE)
+    path = cache._path_for_key(cache.make_key(URL, PAYLOAD))
+    os.utime(path, (time.time() - 120, time.time() - 120))
+    fill(cache, 2, size=10)
+
+    assert cache.evict() == 1
+    assert not os.path.exists(path)
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_config_rejects_unknown_cache_mode(tmp_path, monkeypatch):
+    excel_path = tmp_path / "terms.xlsx"
+    excel_path.write_bytes(b"")
+    monkeypatch.setattr(config, "excel_file_path", str(excel_path))
+    monkeypatch.setattr(config, "results_directory", str(tmp_path / "results"))
+    monkeypatch.setitem(config.api_config, "api_key", "test-key")
+    monkeypatch.setitem(config.cache_config, "mode", "ofline")
+    assert not config.validate()
+    monkeypatch.setitem(config.cache_config, "mode", "offline")
+    assert config.validate()
@@ -0,0 +1,53 @@
+"""
+SchemaRouter index name, alias and record ID routes
+"""
+
+import pickle
+
+import pytest
+
+from bench_schema_router import CORPUS
+from utils.schema_router import SchemaRouter
+
+
+@pytest.mark.parametrize("index_name, expected", CORPUS)
+def test_corpus_routes(index_name, expected):
+    assert SchemaRouter().route(index_name) == expected
+
+
+def test_exact_route_wins_over_name_tokens():
+    router = SchemaRouter(index_routes={"GDC-Legacy-Watch": "pep"})
+    assert router.describe("gdc-legacy-watch") == ("pep", "route")
+    assert router.route("gdc-legacy-watch") == "pep"
+    assert router.describe("gdc-other-watch") == ("watch", "token")
+
+
+def test_id_prefix_fallback():
+    router = SchemaRouter(id_prefix_routes={"10": "watch", "101": "pep", "8": "icij"})
+    assert router.route(None, "10155") == "pep"
+    assert router.route(None, "10255") == "watch"
+    assert router.route(None, 80001) == "icij"
+    assert router.route("unrelated-index", "10155") == "pep"
+    assert router.route(None, "999") == "watch"
+
+
+def test_default_schema_and_config():
+    router = SchemaRouter.from_config({"default_schema": "soe", "id_prefix_routes": {}})
+    assert router.route(None, "101") == "soe"
+    assert router.describe("unrelated-index") == (None, "none")
+
+
+def test_unknown_schema_is_rejected():
+    with pytest.raises(ValueError):
+        SchemaRouter(index_routes={"gdc-x": "nope"})
+
+
+def test_route_memo_and_pickle():
+    router = SchemaRouter(index_routes={"alias": "col"})
+    for _ in range(3):
+        router.route("gdc-pep-v2")
+    assert router.get_stats() == {"hits": 2, "misses": 1, "cached_indices": 1}
+
+    copy = pickle.loads(pickle.dumps(router))
+    assert copy.route("alias") == "col"
+    assert copy.get_stats()["misses"] == 1
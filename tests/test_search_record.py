@@ -0,0 +1,76 @@
+"""
+SearchRecord / IcijRecord read like the dicts they replace, compare with them, pickle and serialize
+"""
+
+import json
+import pickle
+
+import pytest
+
+from utils.search_record import IcijRecord, SearchRecord, intern_value, record_json_default
+
+RECORD_DICT = {"recid": 7, "ID": "1017", "First_Name": "JOHN", "Last_Name": "DOE", "Full_Name": "JOHN DOE",
+               "Other_Names": "JD", "AltScript": "", "RecType": "PEP"}
+
+
+def test_reads_like_a_dict():
+    record = SearchRecord(**RECORD_DICT)
+
+    assert record["Full_Name"] == "JOHN DOE"
+    assert record.get("ID") == "1017"
+    assert record.get("Entity_Name", "none") == "none"
+    assert "RecType" in record and "Entity_Name" not in record
+    assert list(record.keys()) == list(RECORD_DICT)
+    assert dict(record.items()) == RECORD_DICT
+    assert record.to_dict() == RECORD_DICT
+    with pytest.raises(KeyError):
+        record["Entity_Name"]
+
+
+def test_equality_with_records_and_dicts():
+    record = SearchRecord(**RECORD_DICT)
+
+    assert record == SearchRecord(**RECORD_DICT)
+    assert record == RECORD_DICT and RECORD_DICT == record
+    assert record != SearchRecord(**{**RECORD_DICT, "ID": "1018"})
+    assert record != IcijRecord(**RECORD_DICT)
+    assert record != "JOHN DOE"
+    with pytest.raises(TypeError):
+        hash(record)
+
+
+def test_icij_record_carries_its_extra_fields():
+    record = IcijRecord(recid=8, ID="8011", Full_Name="ACME", Entity_Name="ACME", Entity_Type="Company")
+
+    assert record.RecType == "ICIJ"
+    assert list(record.keys())[-2:] == ["Entity_Name", "Entity_Type"]
+    assert record.get("Entity_Type") == "Company"
+    assert not hasattr(record, "__dict__")
+
+
+@pytest.mark.parametrize("record", [SearchRecord(**RECORD_DICT),
+                                    IcijRecord(recid=8, ID="8011", Entity_Name="ACME", Entity_Type="Company")])
+def test_pickle_round_trip(record):
+    restored = pickle.loads(pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL))
+
+    assert type(restored) is type(record)
+    assert restored == record
+    assert restored.RecType is intern_value("".join(record.RecType))
+
+
+def test_repeated_strings_are_interned():
+    first = SearchRecord(RecType="".join(["P", "EP"]))
+    second = SearchRecord(RecType="".join(["PE", "P"]))
+
+    assert first.RecType is second.RecType
+    assert intern_value(7) == 7
+
+
+def test_json_default_serializes_records_as_dicts():
+    item = {"opensearch_results": {"pep": [SearchRecord(**RECORD_DICT)]}, "other": {1, 2}}
+
+    decoded = json.loads(json.dumps(item, default=record_json_default))
+
+    assert decoded["opensearch_results"]["pep"] == [RECORD_DICT]
+    assert decoded["other"] in ("{1, 2}", "{2, 1}")
+    assert repr(SearchRecord(ID="1")).startswith("SearchRecord(recid=0, ID='1'")
@@ -0,0 +1,102 @@
+"""
+Search API stub: batched payloads, reproducible error draws, recordings and profiles
+"""
+
+import json
+
+import pytest
+import requests
+
+from utils.stub_server import STUB_PROFILES, StubSearchServer, load_recordings, payload_key
+
+
+def query(term, **extra):
+    return {"query": term, "schemas": ["pep", "watch"], "limit": 10, **extra}
+
+
+def test_batch_returns_one_response_per_query():
+    stub = StubSearchServer(hits_per_query=5)
+    queries = [query("alpha"), query("beta"), query("gamma")]
+
+    status, body = stub.handle_payload({"queries": queries})
+
+    assert status == 200
+    assert body == {"responses": [stub.search(single) for single in queries]}
+    assert stub.get_stats()["requests"] == 1 and stub.get_stats()["queries"] == 3
+
+
+def test_synthetic_results_depend_on_query_and_seed_only():
+    first, second = StubSearchServer(hits_per_query=8), StubSearchServer(hits_per_query=8)
+
+    assert first.handle_payload(query("alpha")) == second.handle_payload(query("alpha"))
+    results = first.search(query("alpha"))["results"]
+    assert all(hit["_index"] in ("gdc-pep", "gdc-watch") for hit in results)
+    terms = [f"term {i}" for i in range(10)]
+    assert [StubSearchServer(hits_per_query=8, seed=1).search(query(term)) for term in terms] != \
+        [first.search(query(term)) for term in terms]
+    assert list(StubSearchServer(response_shape="hits").search(query("alpha"))) == ["hits"]
+
+
+def test_error_draws_are_reproducible_per_attempt():
+    def statuses(stub):
+        # Three attempts of each payload, interleaved like retries across worker threads
+        return [stub.handle_payload(query(f"term {i}"))[0] for _ in range(3) for i in range(40)]
+
+    first = statuses(StubSearchServer(error_rate=0.3, throttle_rate=0.2))
+    second = statuses(StubSearchServer(error_rate=0.3, throttle_rate=0.2))
+
+    assert first == second
+    assert {200, 429, 503} == set(first)
+    # A retry draws again instead of repeating the first answer
+    assert first[:40] != first[40:80]
+    assert statuses(StubSearchServer(error_rate=0.3, throttle_rate=0.2, seed=7)) != first
+
+
+def test_throttled_response_sends_retry_after():
+    stub = StubSearchServer(throttle_rate=1, retry_after=2.5).start()
+    try:
+        response = requests.post(stub.url, json=query("alpha"), timeout=5)
+    finally:
+        stub.stop()
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2.5"
+    assert stub.get_stats()["throttled"] == 1
+
+
+def test_recordings_are_replayed(tmp_path):
+    recorded = {"results": [{"_index": "gdc-pep", "_id": "1", "_source": {"ID": "1", "Full_Name": "RECORDED"}}]}
+    recordings = tmp_path / "recordings.jsonl"
+    recordings.write_text(json.dumps({"payload": query("alpha"), "response": recorded}) + "\n\n", encoding="utf-8")
+    cache_entry = tmp_path / "cache" / "ab" / "abcd.json"
+    cache_entry.parent.mkdir(parents=True)
+    cache_entry.write_text(json.dumps({"payload": query("beta"), "response": recorded}), encoding="utf-8")
+
+    assert load_recordings(str(tmp_path / "cache")) == {payload_key(query("beta")): recorded}
+    stub = StubSearchServer(recordings=str(recordings))
+    # Key order of the payload does not matter
+    assert stub.handle_payload(dict(reversed(list(query("alpha").items())))) == (200, recorded)
+    assert stub.handle_payload(query("gamma"))[0] == 200
+    assert (stub.replayed, stub.synthesized) == (1, 1)
+
+
+def test_strict_stub_answers_404_for_unrecorded_payloads(tmp_path):
+    recordings = tmp_path / "recordings.jsonl"
+    recordings.write_text(json.dumps({"payload": query("alpha"), "response": {"results": []}}) + "\n",
+                          encoding="utf-8")
+    stub = StubSearchServer(recordings=str(recordings), strict=True)
+
+    assert stub.handle_payload({"queries": [query("alpha"), query("beta")]})[0] == 404
+    assert stub.handle_payload(query("alpha")) == (200, {"results": []})
+    assert stub.get_stats()["missing"] == 1
+
+
+def test_profiles():
+    stub = StubSearchServer.from_profile("large", latency_ms=0, latency_jitter_ms=0, query_latency_ms=0)
+    assert (stub.hits_per_query, stub.padding_bytes) == (STUB_PROFILES["large"]["hits_per_query"], 2048)
+    assert stub.latency_ms == 0
+
+    with pytest.raises(ValueError, match="Unknown stub profile"):
+        StubSearchServer.from_profile("slow")
+    with pytest.raises(ValueError, match="Unknown response shape"):
+        StubSearchServer(response_shape="items")
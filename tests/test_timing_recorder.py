@@ -0,0 +1,64 @@
+"""
+TimingRecorder rows, nearest-rank percentiles and the per-entity timings of a run
+"""
+
+import pytest
+
+from conftest import write_terms_workbook
+from utils.timing_recorder import TIMING_COLUMNS, TimingRecorder, milliseconds, percentile
+
+
+@pytest.mark.parametrize("q, expected", [(0, 1), (10, 1), (50, 5), (90, 9), (99, 10), (100, 10)])
+def test_nearest_rank_percentile(q, expected):
+    assert percentile(list(range(1, 11)), q) == expected
+
+
+def test_updates_merge_into_one_row_per_entity():
+    timings = TimingRecorder()
+    timings.update("alpha", "P", fetch_ms=12.5, cached=False)
+    timings.update("beta", "E", fetch_ms=3.0)
+    timings.update("alpha", "P", compare_ms=1.5, opensearch_hits=4)
+
+    assert timings.rows() == [
+        {"Search Term": "alpha", "Type": "P", "Fetch ms": 12.5, "Cached": False, "Compare ms": 1.5,
+         "OpenSearch Hits": 4},
+        {"Search Term": "beta", "Type": "E", "Fetch ms": 3.0}
+    ]
+    assert list(timings.to_dataframe().columns) == TIMING_COLUMNS
+    with pytest.raises(KeyError):
+        timings.update("alpha", "P", not_a_column=1)
+
+
+def test_summary_covers_measured_metrics_only():
+    timings = TimingRecorder()
+    for i in range(1, 101):
+        timings.update(f"term {i}", "P", fetch_ms=float(i), response_bytes=None if i % 2 else i * 10)
+
+    summary = timings.summary()
+
+    assert [entry["Metric"] for entry in summary] == ["Fetch ms", "Response Bytes"]
+    assert summary[0] == {"Metric": "Fetch ms", "Count": 100, "p50": 50.0, "p90": 90.0, "p99": 99.0, "Max": 100.0}
+    assert summary[1]["Count"] == 50 and summary[1]["Max"] == 1000
+    assert timings.summary_dataframe().values.tolist()[0] == ["Fetch ms", 100, 50.0, 90.0, 99.0, 100.0]
+    assert [row["Search Term"] for row in timings.slowest(3)] == ["term 100", "term 99", "term 98"]
+
+
+def test_phases_accumulate():
+    timings = TimingRecorder()
+    timings.add_phase("excel", 1.0)
+    timings.add_phase("html", 0.5)
+    timings.add_phase("excel", 0.25)
+
+    assert timings.phases == {"excel": 1.25, "html": 0.5}
+    assert milliseconds(0.0123456) == 12.346
+    assert milliseconds(None) is None
+
+
+def test_run_records_a_timing_row_per_entity(tmp_path, run_harness):
+    terms = [(f"term {i}", "P", "") for i in range(4)]
+    harness = run_harness(write_terms_workbook(tmp_path / "terms.xlsx", terms))
+
+    rows = harness.timings.rows()
+    assert [row["Search Term"] for row in rows] == [name for name, _, _ in terms]
+    assert all(row["Fetch ms"] > 0 and row["Compare ms"] is not None for row in rows)
+    assert {"excel", "html"} <= set(harness.timings.phases)
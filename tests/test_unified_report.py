@@ -0,0 +1,81 @@
+"""
+The columnar unified comparison must produce the same rows as build_unified_rows
+"""
+
+import random
+
+import pandas as pd
+import pytest
+
+from bench_unified_report import make_comparison_data
+from utils.report_generator import ReportGenerator, UNIFIED_COLUMNS
+from utils.search_record import SearchRecord
+
+
+def normalize(df):
+    """Rows as sorted lists of strings, with missing values (None/NaN) distinct from empty strings"""
+    return sorted(df.astype(object).where(df.notna(), "<missing>").astype(str).values.tolist())
+
+
+def loop_rows(report_generator, comparison_data):
+    rows = []
+    for comparison_item in comparison_data:
+        rows.extend(report_generator.build_unified_rows(comparison_item))
+    return pd.DataFrame(rows, columns=UNIFIED_COLUMNS)
+
+
+def drop_ids(comparison_data, share, seed):
+    """Set the ID of some records to None and remove it from others"""
+    rnd = random.Random(seed)
+    for comparison_item in comparison_data:
+        for results_key in ("opensearch_results", "legacy_results"):
+            for records in comparison_item[results_key].values():
+                for record in records:
+                    draw = rnd.random()
+                    if draw < share / 2:
+                        record["ID"] = None
+                    elif draw < share:
+                        del record["ID"]
+    return comparison_data
+
+
+@pytest.fixture
+def report_generator(tmp_path):
+    return ReportGenerator(str(tmp_path))
+
+
+@pytest.mark.parametrize("missing_share, seed", [(0.0, 1), (0.1, 2), (0.5, 3)])
+def test_columnar_rows_match_loop_rows(report_generator, missing_share, seed):
+    comparison_data = drop_ids(make_comparison_data(200, 15, 0.7, seed), missing_share, seed)
+    columnar = report_generator.build_unified_dataframe(comparison_data)
+    assert normalize(columnar) == normalize(loop_rows(report_generator, comparison_data))
+
+
+def test_missing_id_does_not_match_another_source(report_generator):
+    comparison_data = [{
+        "search_term": "term",
+        "entity_type": "P",
+        "opensearch_results": {"pep": [SearchRecord(recid=3, ID="202", Full_Name="OS B")],
+                               "watch": [SearchRecord(recid=1, ID=None, Full_Name="OS NONE")]},
+        "legacy_results": {"pep": [SearchRecord(recid=2, ID="101", Full_Name="LEG A")]},
+    }]
+    columnar = report_generator.build_unified_dataframe(comparison_data)
+    assert normalize(columnar) == normalize(loop_rows(report_generator, comparison_data))
+    assert columnar.loc[columnar["OpenSearch Name"] == "OS NONE", "Legacy Name"].tolist() == [""]
+    assert columnar.loc[columnar["Legacy Name"] == "LEG A", "OpenSearch Name"].tolist() == [""]
+
+
+def test_missing_ids_match_within_a_source(report_generator):
+    comparison_data = [{
+        "search_term": "term",
+        "entity_type": "E",
+        "opensearch_results": {"watch": [{"Full_Name": "OS NO ID"}, {"ID": None, "Full_Name": "OS NONE"}]},
+        "legacy_results": {"watch": [{"ID": None, "Full_Name": "LEG NONE"}], "pep": [{"ID": None, "Full_Name": "LEG PEP"}]},
+    }]
+    columnar = report_generator.build_unified_dataframe(comparison_data)
+    assert normalize(columnar) == normalize(loop_rows(report_generator, comparison_data))
+    assert len(columnar) == 3
+
+
+def test_empty_comparison_data(report_generator):
+    assert report_generator.build_unified_dataframe([]).empty
@@ -0,0 +1,93 @@
+"""
+Virtual HTML report: the columnar payload decodes back to the unified rows with the statuses
+render_row would show, and the page embeds it as plain JSON or gzip+base64
+"""
+
+import base64
+import gzip
+import json
+import re
+
+import pandas as pd
+import pytest
+
+from bench_unified_report import make_comparison_data
+from utils.html_report_generator import HTMLReportGenerator, VIRTUAL_STATUSES
+from utils.report_generator import ReportGenerator
+
+PAYLOAD = re.compile(r'<script id="report-data" type="application/octet-stream" data-encoding="([^"]+)">(.*?)</script>',
+                     re.S)
+STATUS = re.compile(r'class="status-badge [^"]*">([^<]+)</span>')
+
+
+@pytest.fixture(scope="module")
+def unified_df(tmp_path_factory):
+    report_generator = ReportGenerator(str(tmp_path_factory.mktemp("results")))
+    df = report_generator.build_unified_dataframe(make_comparison_data(20, 8, 0.7, seed=7))
+    return df.sort_values(["Test Key", "OpenSearch Schema", "OpenSearch ID"])
+
+
+def decode_rows(payload):
+    """Rebuild (term, type, status, OpenSearch name/ID/schema, legacy name/ID/schema) rows from the payload"""
+    dictionaries, columns = payload["dictionaries"], payload["columns"]
+    return [
+        (dictionaries["term"][columns["term"][i]], dictionaries["type"][columns["type"][i]],
+         dictionaries["status"][columns["status"][i]],
+         columns["osName"][i], columns["osId"][i], dictionaries["schema"][columns["osSchema"][i]],
+         columns["legacyName"][i], columns["legacyId"][i], dictionaries["schema"][columns["legacySchema"][i]])
+        for i in range(payload["count"])
+    ]
+
+
+def embedded_payload(filename):
+    with open(filename, encoding="utf-8") as f:
+        encoding, text = PAYLOAD.search(f.read()).groups()
+    if encoding == "gzip-base64":
+        return encoding, json.loads(gzip.decompress(base64.b64decode(text)))
+    return encoding, json.loads(text.replace("<\\/", "</"))
+
+
+def test_payload_decodes_to_the_unified_rows(unified_df):
+    generator = HTMLReportGenerator("virtual")
+    payload = generator.build_virtual_payload(unified_df)
+
+    assert payload["count"] == len(unified_df)
+    assert payload["dictionaries"]["status"] == VIRTUAL_STATUSES
+    statuses = [STATUS.search(generator.render_row(1, row)).group(1) for row in unified_df.to_dict("records")]
+    expected = [
+        (row["Search Term"], row["Type"], status, row["OpenSearch Name"], row["OpenSearch ID"],
+         row["OpenSearch Schema"], row["Legacy Name"], row["Legacy ID"], row["Legacy Schema"])
+        for row, status in zip(unified_df.to_dict("records"), statuses)
+    ]
+    assert decode_rows(payload) == expected
+
+
+def test_missing_values_become_empty_strings():
+    df = pd.DataFrame([{
+        "Search Term": "term", "Type": "Entity", "OpenSearch Name": None, "OpenSearch ID": None,
+        "OpenSearch Schema": "", "Legacy Name": "Legacy A", "Legacy ID": "7", "Legacy Schema": "PEP"
+    }])
+
+    payload = HTMLReportGenerator("virtual").build_virtual_payload(df)
+
+    assert decode_rows(payload) == [("term", "Entity", "Legacy Only", "", "", "", "Legacy A", "7", "PEP")]
+
+
+@pytest.mark.parametrize("compress_payload, encoding", [(True, "gzip-base64"), (False, "json")])
+def test_page_embeds_the_payload(tmp_path, unified_df, compress_payload, encoding):
+    generator = HTMLReportGenerator("virtual", compress_payload=compress_payload)
+    filename = generator.generate_unified_comparison_report(unified_df, str(tmp_path / "report.html"))
+
+    assert embedded_payload(filename) == (encoding, generator.build_virtual_payload(unified_df))
+
+
+def test_plain_payload_cannot_close_its_script_element(tmp_path):
+    df = pd.DataFrame([{
+        "Search Term": "</script><b>", "Type": "Person", "OpenSearch Name": "a</b>", "OpenSearch ID": "1",
+        "OpenSearch Schema": "PEP", "Legacy Name": "", "Legacy ID": "", "Legacy Schema": ""
+    }])
+    filename = HTMLReportGenerator("virtual", compress_payload=False).generate_unified_comparison_report(
+        df, str(tmp_path / "report.html"))
+
+    encoding, payload = embedded_payload(filename)
+    assert decode_rows(payload)[0][:4] == ("</script><b>", "Person", "OpenSearch Only", "a</b>")
@@ -0,0 +1,145 @@
+"""
+Baseline Cache Module
+Compact binary cache of parsed legacy GDC baselines ("Current GDC respose" column),
+keyed by the Excel file's modification time and a hash of each row's raw response
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+import zlib
+from typing import Dict, Any, Optional, Tuple
+
+CACHE_VERSION = 2
+
+
+class BaselineCache:
+    """
+    Persists normalized baseline records so a warm start skips JSON parsing.
+    Only rows whose raw GDC response hash changed are parsed again.
+    """
+
+    def __init__(self, cache_path: str, excel_path: str, enabled: bool = True):
+        """
+        Initialize the baseline cache and load any existing cache file
+
+        Args:
+            cache_path: Path of the binary cache file
+            excel_path: Excel file whose rows are cached
+            enabled: When False every lookup is a miss and nothing is written
+        """
+        self.cache_path = cache_path
+        self.excel_path = os.path.abspath(excel_path)
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Dict[str, Any], bool]] = {}
+        self._used = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        self.excel_mtime = os.path.getmtime(self.excel_path) if os.path.exists(self.excel_path) else 0.0
+        self.stored_mtime = None
+
+        if self.enabled:
+            self._load()
+
+    @property
+    def excel_unchanged(self) -> bool:
+        """Whether the Excel file has the same mtime as when the cache was written"""
+        return self.stored_mtime == self.excel_mtime
+
+    @staticmethod
+    def row_hash(raw_response: Any) -> str:
+        """Hash a row's raw GDC response cell"""
+        return hashlib.blake2b(str(raw_response).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = pickle.loads(zlib.decompress(f.read()))
+        except Exception as e:
+            print(f"⚠️  Warning: Ignoring unreadable baseline cache {self.cache_path}: {e}")
+            return
+
+        if data.get("version") != CACHE_VERSION or data.get("excel_path") != self.excel_path:
+            return
+
+        self.stored_mtime = data.get("excel_mtime")
+        self._entries = data.get("rows", {})
+
+    def get(self, row_hash: str) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """
+        Look up a parsed baseline
+
+        Args:
+            row_hash: Hash of the row's raw GDC response
+
+        Returns:
+            Tuple of (baseline_data, skipped_as_corrupted) or None on a miss
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(row_hash)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._used.add(row_hash)
+            return entry
+
+    def keep(self, row_hash: str) -> None:
+        """Keep a row's cached parse on save although it was not looked up this run (its entity was reused)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._used.add(row_hash)
+
+    def put(self, row_hash: str, baseline_data: Dict[str, Any], skipped: bool = False) -> None:
+        """
+        Store a parsed baseline
+
+        Args:
+            row_hash: Hash of the row's raw GDC response
+            baseline_data: Normalized baseline records by source
+            skipped: Whether the row was skipped as corrupted JSON
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[row_hash] = (baseline_data, skipped)
+            self._used.add(row_hash)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if anything changed, dropping rows no longer in the Excel file"""
+        if not self.enabled:
+            return
+        with self._lock:
+            stale = set(self._entries) - self._used
+            if not self._dirty and not stale and self.excel_unchanged:
+                return
+            for row_hash in stale:
+                del self._entries[row_hash]
+
+            data = {
+                "version": CACHE_VERSION,
+                "excel_path": self.excel_path,
+                "excel_mtime": self.excel_mtime,
+                "rows": self._entries
+            }
+            try:
+                os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+                tmp_path = f"{self.cache_path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), 1))
+                os.replace(tmp_path, self.cache_path)
+                self.stored_mtime = self.excel_mtime
+                self._dirty = False
+            except OSError as e:
+                print(f"⚠️  Warning: Could not write baseline cache: {e}")
@@ -0,0 +1,165 @@
+"""
+Checkpoint Log Module
+Append-only JSONL log of the entities completed in the current run, so an interrupted run
+can be resumed without re-testing them and its unified report rebuilt from the log
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+
+from .search_record import record_json_default
+
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointLog:
+    """
+    One header line describing the run, then one line per completed entity:
+    {"term", "type", "baseline_hash", "payload_hash", "passed", "completed_at", "item"}.
+    Every line is flushed as soon as it is written; a line cut short by a crash
+    is dropped when the log is resumed.
+    """
+
+    def __init__(self, path: str, excel_path: str, enabled: bool = True):
+        """
+        Initialize the checkpoint log (nothing is read or written until start())
+
+        Args:
+            path: Path of the JSONL log file
+            excel_path: Excel file the run was started from
+            enabled: When False nothing is resumed and nothing is written
+        """
+        self.path = path
+        self.excel_path = os.path.abspath(excel_path)
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._completed: Dict[str, Tuple[str, str, Dict[str, Any], bool]] = {}
+        self.resumed = 0
+        self.written = 0
+
+    @staticmethod
+    def entity_key(term: Any, entity_type: Any) -> str:
+        """Build the log key of an entity"""
+        return f"{entity_type}|{term}"
+
+    def start(self, resume: bool = False) -> int:
+        """
+        Open the log for appending
+
+        Args:
+            resume: Keep the completed entities of the previous run; otherwise start a new log
+
+        Returns:
+            Number of completed entities loaded from the previous run
+        """
+        if not self.enabled:
+            return 0
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        if resume:
+            valid_bytes = self._load()
+            if valid_bytes:
+                self._file = open(self.path, "r+", encoding="utf-8")
+                # Drop a trailing line cut short by the crash before appending
+                self._file.truncate(valid_bytes)
+                self._file.seek(valid_bytes)
+                return len(self._completed)
+
+        self._completed = {}
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._write_line({
+            "checkpoint_version": CHECKPOINT_VERSION,
+            "excel_path": self.excel_path,
+            "started_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
+        return 0
+
+    def _load(self) -> int:
+        """Load completed entities, returning the byte length of the valid prefix (0 = start a new log)"""
+        if not os.path.exists(self.path):
+            print(f"ℹ️  No checkpoint found at {self.path}, starting a new run")
+            return 0
+
+        valid_bytes = 0
+        with open(self.path, "rb") as f:
+            for number, raw_line in enumerate(f):
+                try:
+                    if not raw_line.endswith(b"\n"):
+                        raise ValueError("incomplete line")
+                    entry = json.loads(raw_line)
+                except ValueError:
+                    print(f"⚠️  Warning: Ignoring incomplete checkpoint line {number + 1}")
+                    break
+
+                if number == 0:
+                    if entry.get("checkpoint_version") != CHECKPOINT_VERSION or entry.get("excel_path") != self.excel_path:
+                        print(f"⚠️  Warning: Checkpoint {self.path} belongs to another run, starting a new run")
+                        return 0
+                else:
+                    key = self.entity_key(entry["term"], entry["type"])
+                    self._completed[key] = (entry["baseline_hash"], entry["payload_hash"], entry["item"],
+                                            entry.get("passed", False))
+                valid_bytes += len(raw_line)
+        return valid_bytes
+
+    def _write_line(self, entry: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(entry, default=record_json_default) + "\n")
+        self._file.flush()
+
+    def get_completed_item(self, term: Any, entity_type: Any, baseline_hash: str,
+                           payload_hash: str) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """
+        Look up the unified comparison item of an entity completed before the run was interrupted
+
+        Args:
+            term: Search term
+            entity_type: Entity type (P or E)
+            baseline_hash: Hash of the row's raw GDC response
+            payload_hash: Hash of the search endpoint and payload
+
+        Returns:
+            Tuple of (logged unified comparison item, whether its comparison passed), or None if
+            the entity must be tested (not completed, or its baseline or payload changed since)
+        """
+        with self._lock:
+            completed = self._completed.get(self.entity_key(term, entity_type))
+            if completed is None or completed[:2] != (baseline_hash, payload_hash):
+                return None
+            self.resumed += 1
+            return completed[2], completed[3]
+
+    def append(self, unified_item: Dict[str, Any], baseline_hash: str, payload_hash: str, passed: bool) -> None:
+        """
+        Log a completed entity
+
+        Args:
+            unified_item: Unified comparison item (search_term, entity_type, opensearch_results, legacy_results)
+            baseline_hash: Hash of the row's raw GDC response
+            payload_hash: Hash of the search endpoint and payload
+            passed: Whether the comparison found no missing, new or modified records
+        """
+        if self._file is None:
+            return
+        with self._lock:
+            self._write_line({
+                "term": unified_item["search_term"],
+                "type": unified_item["entity_type"],
+                "baseline_hash": baseline_hash,
+                "payload_hash": payload_hash,
+                "passed": passed,
+                "completed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "item": unified_item
+            })
+            self.written += 1
+
+    def close(self) -> None:
+        """Close the log file (the log is kept so a later --resume can rebuild the report)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
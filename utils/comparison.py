@@ -0,0 +1,152 @@
+"""
+Comparison Module
+Compares the legacy baseline records of an entity with the current OpenSearch records,
+source by source, in a single pass per source
+"""
+
+from datetime import datetime
+from typing import Dict, Any, List, Tuple
+
+from .search_record import SearchRecord
+
+# Fields whose differences mark a matched record as modified
+COMPARED_FIELDS = ("Full_Name", "Other_Names", "First_Name", "Last_Name")
+
+
+def record_values(record: Any) -> Tuple[Any, ...]:
+    """
+    Read the fields the comparison shows, once per record
+
+    Args:
+        record: Normalized record (SearchRecord, or a dict as loaded from JSON)
+
+    Returns:
+        (ID, Full_Name, Other_Names, First_Name, Last_Name, AltScript, otherNames), missing fields read as ""
+    """
+    if isinstance(record, SearchRecord):
+        return (record.ID, record.Full_Name, record.Other_Names, record.First_Name, record.Last_Name,
+                record.AltScript, "")
+    get = record.get
+    return (get("ID", ""), get("Full_Name", ""), get("Other_Names", ""), get("First_Name", ""),
+            get("Last_Name", ""), get("AltScript", ""), get("otherNames", ""))
+
+
+def compared_values(record: Any, values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """The COMPARED_FIELDS of a record; a field missing from a dict compares as None"""
+    if isinstance(record, SearchRecord):
+        return values[1:5]
+    return tuple(record.get(key) for key in COMPARED_FIELDS)
+
+
+def summarize_record(recid: Any, values: Tuple[Any, ...]) -> Dict[str, Any]:
+    """
+    Build the matched/missing/new entry of a record
+
+    Args:
+        recid: Record ID the sides were matched on
+        values: record_values() of the record
+
+    Returns:
+        Entry with Full_Name falling back to "First_Name Last_Name", and Other_Names,
+        otherNames and AltScript joined with "; "
+    """
+    record_id, full_name, other_names, first_name, last_name, alt_script, other_names_alt = values
+    if not full_name and (first_name or last_name):
+        full_name = f"{first_name} {last_name}".strip()
+    if other_names or other_names_alt or alt_script:
+        other_names = "; ".join(filter(None, (other_names, other_names_alt, alt_script)))
+    else:
+        other_names = ""
+    return {
+        "recid": recid,
+        "ID": record_id,
+        "Full_Name": full_name,
+        "Other_Names": other_names,
+        "First_Name": first_name,
+        "Last_Name": last_name,
+        "AltScript": alt_script
+    }
+
+
+def compare_source(baseline_records: List[Any], current_records: List[Any]) -> Dict[str, Any]:
+    """
+    Compare the records of one source by recid
+
+    Args:
+        baseline_records: Legacy GDC records
+        current_records: OpenSearch records
+
+    Returns:
+        Counts, matches (exact or modified, with field changes), missing and new records, and summary counters
+    """
+    # Later duplicates of a recid replace earlier ones, keeping the first one's position
+    baseline_by_id = {record["recid"]: record for record in baseline_records}
+    unmatched = {record["recid"]: record for record in current_records}
+
+    matches = []
+    missing_records = []
+    exact_matches = 0
+    for recid, baseline_record in baseline_by_id.items():
+        baseline_values = record_values(baseline_record)
+        current_record = unmatched.pop(recid, None)
+        if current_record is None:
+            missing_records.append(summarize_record(recid, baseline_values))
+            continue
+
+        match = summarize_record(recid, baseline_values)
+        old_values = compared_values(baseline_record, baseline_values)
+        new_values = compared_values(current_record, record_values(current_record))
+        if old_values == new_values:
+            match["status"] = "exact_match"
+            match["changes"] = {}
+            exact_matches += 1
+        else:
+            match["status"] = "modified"
+            match["changes"] = {
+                key: {"old": old, "new": new}
+                for key, old, new in zip(COMPARED_FIELDS, old_values, new_values)
+                if old != new
+            }
+        matches.append(match)
+
+    # Whatever was not matched is new, in OpenSearch order
+    new_records = [summarize_record(recid, record_values(record)) for recid, record in unmatched.items()]
+
+    return {
+        "baseline_count": len(baseline_records),
+        "current_count": len(current_records),
+        "matches": matches,
+        "missing_records": missing_records,
+        "new_records": new_records,
+        "summary": {
+            "exact_matches": exact_matches,
+            "modified_records": len(matches) - exact_matches,
+            "missing_records": len(missing_records),
+            "new_records": len(new_records)
+        }
+    }
+
+
+def compare_entity(entity_name: Any, baseline_data: Dict[str, List[Any]],
+                   current_data: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """
+    Compare an entity's baseline with its current data
+
+    Args:
+        entity_name: Search term
+        baseline_data: Legacy records by source
+        current_data: OpenSearch records by source
+
+    Returns:
+        Comparison result with one compare_source() entry per source present on either side
+    """
+    sources = list(baseline_data)
+    sources.extend(source for source in current_data if source not in baseline_data)
+    return {
+        "entity_name": entity_name,
+        "test_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "sources": {
+            source: compare_source(baseline_data.get(source, []), current_data.get(source, []))
+            for source in sources
+        }
+    }
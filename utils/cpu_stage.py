@@ -0,0 +1,165 @@
+"""
+CPU Stage Module
+Worker process pool for the CPU-bound part of the pipeline (baseline parsing, response
+normalization and comparison), exchanging records as compact marshal-packed rows
+"""
+
+import marshal
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .search_record import SearchRecord, IcijRecord
+
+# Type codes of packed rows: (type code, values in FIELDS order); plain dicts are packed as-is
+SEARCH_RECORD, ICIJ_RECORD, DICT_RECORD = 0, 1, 2
+
+_search_values = attrgetter(*SearchRecord.FIELDS)
+_icij_values = attrgetter(*IcijRecord.FIELDS)
+
+
+def pack_source_data(source_data: Dict[str, List[Any]]) -> Tuple[Tuple[str, Tuple[Tuple[int, Any], ...]], ...]:
+    """
+    Flatten records by source into nested tuples of plain values that marshal can encode
+
+    Args:
+        source_data: Records by source (SearchRecord, IcijRecord or dict)
+
+    Returns:
+        ((source, ((type code, values), ...)), ...) in source order
+    """
+    packed = []
+    for source, records in source_data.items():
+        rows = []
+        for record in records:
+            record_type = type(record)
+            if record_type is SearchRecord:
+                rows.append((SEARCH_RECORD, _search_values(record)))
+            elif record_type is IcijRecord:
+                rows.append((ICIJ_RECORD, _icij_values(record)))
+            else:
+                rows.append((DICT_RECORD, dict(record)))
+        packed.append((source, tuple(rows)))
+    return tuple(packed)
+
+
+def unpack_source_data(packed: Tuple[Tuple[str, Tuple[Tuple[int, Any], ...]], ...]) -> Dict[str, List[Any]]:
+    """
+    Rebuild the records by source packed by pack_source_data
+
+    Args:
+        packed: Output of pack_source_data
+
+    Returns:
+        Records by source, equal to the data that was packed
+    """
+    source_data = {}
+    for source, rows in packed:
+        records = []
+        for record_type, values in rows:
+            if record_type == SEARCH_RECORD:
+                records.append(SearchRecord(*values))
+            elif record_type == ICIJ_RECORD:
+                records.append(IcijRecord(*values))
+            else:
+                records.append(values)
+        source_data[source] = records
+    return source_data
+
+
+def _run_task(func: Callable[..., Any], data: bytes) -> Tuple[float, bytes]:
+    """Worker side of CpuStage.submit: decode the task, run it and encode its result"""
+    start = time.perf_counter()
+    result = marshal.dumps(func(*marshal.loads(data)))
+    return time.perf_counter() - start, result
+
+
+def _ready() -> bool:
+    """No-op task used to start the worker processes"""
+    return True
+
+
+class CpuStage:
+    """
+    Process pool for pure-Python work that is limited by the GIL in pipeline threads.
+
+    A pipeline stage thread submits a task and waits for its result, so a stage with at
+    least as many threads as processes keeps every process busy. Tasks and results cross
+    the process boundary as marshal-encoded tuples of plain values (strings, numbers,
+    bytes and packed record rows) instead of pickled objects, which keeps them small and
+    cheap to encode on the GIL-bound side.
+    """
+
+    def __init__(self, workers: int, initializer: Optional[Callable[..., Any]] = None, initargs: Tuple[Any, ...] = ()):
+        """
+        Initialize the pool and start its worker processes
+
+        Args:
+            workers: Number of worker processes
+            initializer: Called once in each worker process with initargs
+            initargs: Arguments for initializer (pickled once per worker)
+        """
+        self.workers = max(int(workers), 1)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=initializer, initargs=initargs)
+        self._lock = threading.Lock()
+        self.stats = {"tasks": 0, "busy_seconds": 0.0, "wait_seconds": 0.0, "bytes_sent": 0, "bytes_received": 0}
+
+        # Start the workers now, before the pipeline threads, rather than on the first entity
+        for future in [self._executor.submit(_ready) for _ in range(self.workers)]:
+            future.result()
+
+    def submit(self, func: Callable[..., Any], task: Tuple[Any, ...]) -> Future:
+        """
+        Run func(*task) in a worker process
+
+        Args:
+            func: Module-level function (workers look it up by name)
+            task: Arguments, made of values marshal can encode
+
+        Returns:
+            Future to pass to result()
+        """
+        data = marshal.dumps(task)
+        with self._lock:
+            self.stats["tasks"] += 1
+            self.stats["bytes_sent"] += len(data)
+        return self._executor.submit(_run_task, func, data)
+
+    def result(self, future: Future) -> Any:
+        """
+        Wait for a submitted task
+
+        Args:
+            future: Future returned by submit()
+
+        Returns:
+            The decoded return value of the task
+
+        Raises:
+            Exception: Whatever the task raised in the worker process
+        """
+        wait_start = time.perf_counter()
+        busy_seconds, data = future.result()
+        wait_seconds = time.perf_counter() - wait_start
+        with self._lock:
+            self.stats["busy_seconds"] += busy_seconds
+            self.stats["wait_seconds"] += wait_seconds
+            self.stats["bytes_received"] += len(data)
+        return marshal.loads(data)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Task count, worker busy time, time spent waiting for results and bytes exchanged"""
+        with self._lock:
+            return dict(self.stats, workers=self.workers)
+
+    def close(self) -> None:
+        """Shut the worker processes down, cancelling tasks that have not started"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "CpuStage":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,186 @@
+"""
+Excel Writer Module
+Writes the unified comparison workbook (one sheet per Test Key) with a selectable engine,
+optionally split across several workbooks written in parallel processes
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+
+try:
+    import xlsxwriter  # Optional - faster engine with constant memory
+except ImportError:
+    xlsxwriter = None
+
+EXCEL_ENGINES = ("openpyxl", "xlsxwriter")
+
+
+def resolve_engine(engine: str) -> str:
+    """
+    Validate the engine name, falling back to openpyxl if xlsxwriter is not installed
+
+    Args:
+        engine: "openpyxl" or "xlsxwriter"
+
+    Returns:
+        Engine that will actually be used
+    """
+    if engine not in EXCEL_ENGINES:
+        raise ValueError(f"Unknown Excel engine '{engine}', expected one of {', '.join(EXCEL_ENGINES)}")
+    if engine == "xlsxwriter" and xlsxwriter is None:
+        print("⚠️  Warning: xlsxwriter requested but not installed, falling back to openpyxl")
+        return "openpyxl"
+    return engine
+
+
+def write_workbook(df: pd.DataFrame, excel_filename: str, engine: str = "openpyxl",
+                   extra_sheets: Optional[List[Tuple[str, pd.DataFrame]]] = None) -> str:
+    """
+    Write the unified rows to one workbook with a sheet per Test Key
+
+    Args:
+        df: Sorted unified comparison DataFrame
+        excel_filename: Path of the workbook to write
+        engine: Resolved engine name
+        extra_sheets: (sheet name, DataFrame) pairs written after the Test Key sheets, e.g. timings
+
+    Returns:
+        Path of the workbook
+    """
+    sheets = itertools.chain(_sheet_groups(df), _extra_sheet_groups(extra_sheets or []))
+    if engine == "xlsxwriter":
+        return _write_workbook_xlsxwriter(sheets, excel_filename)
+    return _write_workbook_openpyxl(sheets, excel_filename)
+
+
+def _sheet_groups(df: pd.DataFrame):
+    """Yield (sheet_name, column names, row tuples) per Test Key, without the Test Key column"""
+    columns = [column for column in df.columns if column != 'Test Key']
+    for test_key, entity_df in df.groupby('Test Key', sort=False, dropna=False):
+        # Truncate sheet name to 31 characters (Excel limit)
+        sheet_name = str(test_key)[:31]
+        yield sheet_name, columns, entity_df[columns].itertuples(index=False, name=None)
+
+
+def _extra_sheet_groups(extra_sheets: List[Tuple[str, pd.DataFrame]]):
+    """Yield (sheet_name, column names, row tuples) for whole-DataFrame sheets, missing values left blank"""
+    for sheet_name, sheet_df in extra_sheets:
+        values = sheet_df.astype(object).where(sheet_df.notna(), None)
+        yield sheet_name[:31], list(sheet_df.columns), values.itertuples(index=False, name=None)
+
+
+def _write_workbook_openpyxl(sheets, excel_filename: str) -> str:
+    """
+    Write the workbook with an openpyxl write-only workbook.
+    pd.ExcelWriter looks up every existing sheet on each to_excel call, which makes
+    one-sheet-per-term workbooks quadratic in the number of terms; appending rows
+    to write-only sheets is linear. The header matches pandas' bold bordered style.
+    """
+    workbook = Workbook(write_only=True)
+    header_font = Font(bold=True)
+    thin = Side(style="thin")
+    header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_alignment = Alignment(horizontal="center", vertical="top")
+
+    for sheet_name, columns, rows in sheets:
+        sheet = workbook.create_sheet(title=sheet_name)
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(sheet, value=column)
+            cell.font = header_font
+            cell.border = header_border
+            cell.alignment = header_alignment
+            header.append(cell)
+        sheet.append(header)
+        for values in rows:
+            sheet.append(values)
+
+    if not workbook.worksheets:
+        workbook.create_sheet(title="No Results")
+    workbook.save(excel_filename)
+    return excel_filename
+
+
+def _write_workbook_xlsxwriter(sheets, excel_filename: str) -> str:
+    """
+    Write the workbook with xlsxwriter in constant_memory mode.
+    Rows are written strictly top to bottom (pandas' to_excel emits cells column by column,
+    which constant_memory cannot accept), with the same bold bordered header as pandas.
+    """
+    workbook = xlsxwriter.Workbook(excel_filename, {"constant_memory": True})
+    header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+    used_names = set()
+    try:
+        for sheet_name, columns, rows in sheets:
+            # xlsxwriter rejects duplicate (case-insensitive) sheet names
+            base_name = sheet_name
+            suffix = 2
+            while sheet_name.lower() in used_names:
+                sheet_name = f"{base_name[:31 - len(str(suffix)) - 1]}~{suffix}"
+                suffix += 1
+            used_names.add(sheet_name.lower())
+
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, columns, header_format)
+            for row_number, values in enumerate(rows, start=1):
+                worksheet.write_row(row_number, 0, values)
+        if not used_names:
+            workbook.add_worksheet("No Results")
+    finally:
+        workbook.close()
+    return excel_filename
+
+
+def split_by_test_key(df: pd.DataFrame, parts: int) -> List[pd.DataFrame]:
+    """
+    Split the rows into at most `parts` contiguous chunks of whole Test Keys with similar row counts
+
+    Args:
+        df: Sorted unified comparison DataFrame
+        parts: Number of chunks wanted
+
+    Returns:
+        Non-empty DataFrames in sheet order
+    """
+    sizes = df.groupby('Test Key', sort=False, dropna=False).size()
+    rows_before = sizes.cumsum() - sizes
+    part_of_key = (rows_before * parts // max(len(df), 1)).clip(upper=parts - 1)
+
+    part_numbers = df['Test Key'].map(part_of_key).to_numpy()
+    return [df[part_numbers == part] for part in range(parts) if (part_numbers == part).any()]
+
+
+def write_split_workbooks(df: pd.DataFrame, base_path: str, workbooks: int,
+                          workers: int = 1, engine: str = "openpyxl",
+                          extra_sheets: Optional[List[Tuple[str, pd.DataFrame]]] = None) -> List[str]:
+    """
+    Write the sheets across several workbooks, in parallel processes when workers > 1
+
+    Args:
+        df: Sorted unified comparison DataFrame
+        base_path: Path without extension; parts are named <base_path>_partNN.xlsx
+        workbooks: Number of workbooks to split into
+        workers: Number of worker processes
+        engine: Resolved engine name
+        extra_sheets: Sheets written after the Test Key sheets of the first workbook
+
+    Returns:
+        Paths of the written workbooks in sheet order
+    """
+    chunks = split_by_test_key(df, max(int(workbooks), 1))
+    filenames = [f"{base_path}_part{number:02d}.xlsx" for number in range(1, len(chunks) + 1)]
+    chunk_extra_sheets = [extra_sheets] + [None] * (len(chunks) - 1)
+
+    if workers <= 1 or len(chunks) <= 1:
+        return [write_workbook(chunk, filename, engine, extra)
+                for chunk, filename, extra in zip(chunks, filenames, chunk_extra_sheets)]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        return list(executor.map(write_workbook, chunks, filenames, [engine] * len(chunks), chunk_extra_sheets))
@@ -0,0 +1,237 @@
+"""
+Fingerprint Store Module
+Per-entity fingerprints of the last run (baseline hash, search payload hash, result hash and outcome),
+so a changed-only run can skip entities whose inputs are unchanged and which passed last time
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from .search_record import record_json_default
+
+STORE_VERSION = 2
+
+# Rewrite the items file once it is this many times larger than the items still referenced
+COMPACT_RATIO = 2
+
+
+class FingerprintStore:
+    """
+    JSON store of one fingerprint per (term, type). Only the hashes and outcome are kept in memory;
+    the unified comparison item each entity produced is appended to a JSONL items file next to the
+    store and read back by offset when the entity is reused.
+    An entity is reusable when its baseline hash and payload hash match the stored ones
+    and its stored comparison passed.
+    """
+
+    def __init__(self, path: str, enabled: bool = True):
+        """
+        Initialize the fingerprint store and load any existing store file
+
+        Args:
+            path: Path of the JSON store file; items go to <path without extension>.items.jsonl
+            enabled: When False nothing is reused and nothing is written
+        """
+        self.path = path
+        self.items_path = f"{os.path.splitext(path)[0]}.items.jsonl"
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._items_file = None
+        self._used = set()
+        self._dirty = False
+        self.reused = 0
+        self.retested = 0
+        self.results_changed = 0
+
+        if self.enabled:
+            self._load()
+
+    @staticmethod
+    def entity_key(term: Any, entity_type: Any) -> str:
+        """Build the store key of an entity"""
+        return f"{entity_type}|{term}"
+
+    @staticmethod
+    def hash_value(value: Any) -> str:
+        """Hash a JSON-serializable value independently of dict key order"""
+        canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), default=record_json_default)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"⚠️  Warning: Ignoring unreadable fingerprint store {self.path}: {e}")
+            return
+
+        if data.get("version") == STORE_VERSION:
+            self._entries = data.get("entities", {})
+
+    def _open_items(self):
+        """Open the items file for reading and appending (caller holds the lock)"""
+        if self._items_file is None:
+            os.makedirs(os.path.dirname(self.items_path) or ".", exist_ok=True)
+            self._items_file = open(self.items_path, "a+b")
+        return self._items_file
+
+    def _read_item(self, key: str, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Read an entry's item from the items file (caller holds the lock), None if it is missing or damaged"""
+        if entry.get("item_offset") is None or not os.path.exists(self.items_path):
+            return None
+        try:
+            items_file = self._open_items()
+            items_file.seek(entry["item_offset"])
+            line = json.loads(items_file.read(entry["item_length"]))
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Warning: Could not read fingerprint item of {key}: {e}")
+            return None
+        return line.get("item") if line.get("key") == key else None
+
+    def get_previous_item(self, term: Any, entity_type: Any, baseline_hash: str,
+                          payload_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the previous unified comparison item of an unchanged, previously passing entity
+
+        Args:
+            term: Search term
+            entity_type: Entity type (P or E)
+            baseline_hash: Hash of the row's raw GDC response
+            payload_hash: Hash of the search endpoint and payload
+
+        Returns:
+            The stored unified comparison item, or None if the entity must be tested again
+        """
+        if not self.enabled:
+            return None
+        key = self.entity_key(term, entity_type)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is None or not entry.get("passed")
+                    or entry.get("baseline_hash") != baseline_hash or entry.get("payload_hash") != payload_hash):
+                return None
+            item = self._read_item(key, entry)
+            if item is None:
+                return None
+            self._used.add(key)
+            self.reused += 1
+            return item
+
+    def record(self, unified_item: Dict[str, Any], baseline_hash: str, payload_hash: str, passed: bool) -> None:
+        """
+        Store the fingerprint of a tested entity and append its unified comparison item to the items file
+
+        Args:
+            unified_item: Unified comparison item (search_term, entity_type, opensearch_results, legacy_results)
+            baseline_hash: Hash of the row's raw GDC response
+            payload_hash: Hash of the search endpoint and payload
+            passed: Whether the comparison found no missing, new or modified records
+        """
+        if not self.enabled:
+            return
+        key = self.entity_key(unified_item["search_term"], unified_item["entity_type"])
+        result_hash = self.hash_value(unified_item["opensearch_results"])
+        line = (json.dumps({"key": key, "item": unified_item}, separators=(",", ":"),
+                           default=record_json_default) + "\n").encode("utf-8")
+        with self._lock:
+            try:
+                items_file = self._open_items()
+                items_file.seek(0, os.SEEK_END)
+                item_offset = items_file.tell()
+                items_file.write(line)
+            except OSError as e:
+                print(f"⚠️  Warning: Could not write fingerprint item of {key}: {e}")
+                item_offset = None
+            previous = self._entries.get(key)
+            if previous is not None and previous.get("result_hash") != result_hash:
+                self.results_changed += 1
+            self._entries[key] = {
+                "term": unified_item["search_term"],
+                "type": unified_item["entity_type"],
+                "baseline_hash": baseline_hash,
+                "payload_hash": payload_hash,
+                "result_hash": result_hash,
+                "passed": passed,
+                "tested_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "item_offset": item_offset,
+                "item_length": len(line)
+            }
+            self._used.add(key)
+            self.retested += 1
+            self._dirty = True
+
+    def save(self) -> None:
+        """
+        Write the store if anything changed, dropping entities no longer in the Excel file.
+        Items are already on disk; the items file is only rewritten when mostly stale.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            stale = set(self._entries) - self._used
+            if not self._dirty and not stale:
+                self._close_items()
+                return
+            for key in stale:
+                del self._entries[key]
+
+            try:
+                if self._items_file is not None:
+                    self._items_file.flush()
+                self._compact_items()
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"version": STORE_VERSION, "entities": self._entries}, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                print(f"⚠️  Warning: Could not write fingerprint store: {e}")
+            finally:
+                self._close_items()
+
+    def _compact_items(self) -> None:
+        """
+        Copy the referenced items to a new items file when stale ones take up most of it
+        (caller holds the lock). An entry whose offset no longer matches its line is
+        tested again, so a crash between the two replaces costs a retest, not a wrong result.
+        """
+        if not os.path.exists(self.items_path):
+            return
+        live = [entry for entry in self._entries.values() if entry.get("item_offset") is not None]
+        if os.path.getsize(self.items_path) <= COMPACT_RATIO * sum(entry["item_length"] for entry in live):
+            return
+
+        items_file = self._open_items()
+        tmp_path = f"{self.items_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            for entry in sorted(live, key=lambda entry: entry["item_offset"]):
+                items_file.seek(entry["item_offset"])
+                line = items_file.read(entry["item_length"])
+                entry["item_offset"] = f.tell()
+                f.write(line)
+        self._close_items()
+        os.replace(tmp_path, self.items_path)
+
+    def _close_items(self) -> None:
+        if self._items_file is not None:
+            self._items_file.close()
+            self._items_file = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get reuse statistics for this run"""
+        with self._lock:
+            return {
+                "reused": self.reused,
+                "retested": self.retested,
+                "results_changed": self.results_changed,
+                "entities": len(self._entries)
+            }
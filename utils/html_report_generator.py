@@ -4,15 +4,331 @@ HTML Report Generator Utility
 Generates styled HTML reports from pandas DataFrames for GDC automation testing
 """
 
+import base64
+import gzip
+import io
+import json
 import pandas as pd
 from datetime import datetime
 import os
 
+# Output modes: one page, an index page plus shard pages per term / per N rows,
+# or one page with a JSON payload rendered by a client-side virtualized table
+HTML_MODES = ("single", "term", "rows", "virtual")
+
+# Status codes of the virtual report payload, in the order the page's status filter lists them
+VIRTUAL_STATUSES = ["Present in Both", "OpenSearch Only", "Legacy Only", "Not Present"]
+
+# Rows rendered per write() call when streaming a term section
+WRITE_CHUNK_ROWS = 500
+
+# Report columns read by render_row
+ROW_COLUMNS = [
+    "Search Term", "Type", "OpenSearch Name", "OpenSearch ID", "OpenSearch Schema",
+    "Legacy Name", "Legacy ID", "Legacy Schema"
+]
+
+# Templates are compiled once into bound str.format methods and filled per term / row
+_render_term_header = """
+            <div class="search-term-section">
+                <div class="search-term-header">
+                    <h3>{search_term}</h3>
+                    <div class="term-summary">
+                        <span class="summary-item">Total: {total_records}</span>
+                        <span class="summary-item">OpenSearch: {opensearch_records}</span>
+                        <span class="summary-item">Legacy: {legacy_records}</span>
+                        <span class="summary-item">Matched: {matched_records}</span>
+                        <span class="summary-item">OpenSearch Only: {opensearch_only}</span>
+                        <span class="summary-item">Legacy Only: {legacy_only}</span>
+                    </div>
+                </div>
+                <table class="search-term-table">
+                    <thead>
+                        <tr>
+                            <th>#</th>
+                            <th>Type</th>
+                            <th>Status</th>
+                            <th>OpenSearch Name</th>
+                            <th>OpenSearch ID</th>
+                            <th>OpenSearch Schema</th>
+                            <th>Legacy Name</th>
+                            <th>Legacy ID</th>
+                            <th>Legacy Schema</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+""".format
+
+_render_row = """
+                        <tr>
+                            <td><strong>{row_number}</strong></td>
+                            <td><span class="{type_class}">{type}</span></td>
+                            <td><span class="status-badge {status_class}">{status}</span></td>
+                            <td>{opensearch_name}</td>
+                            <td>{opensearch_id}</td>
+                            <td><span class="schema-badge {opensearch_schema_class}">{opensearch_schema}</span></td>
+                            <td>{legacy_name}</td>
+                            <td>{legacy_id}</td>
+                            <td><span class="schema-badge {legacy_schema_class}">{legacy_schema}</span></td>
+                        </tr>
+""".format
+
+TERM_SECTION_END = """
+                    </tbody>
+                </table>
+            </div>
+"""
+
+INDEX_TABLE_START = """
+            <table class="search-term-table">
+                <thead>
+                    <tr>
+                        <th>#</th>
+                        <th>Search Term</th>
+                        <th>Total</th>
+                        <th>OpenSearch</th>
+                        <th>Legacy</th>
+                        <th>Matched</th>
+                        <th>OpenSearch Only</th>
+                        <th>Legacy Only</th>
+                        <th>Shards</th>
+                    </tr>
+                </thead>
+                <tbody>
+"""
+
+_render_index_row = """
+                    <tr>
+                        <td><strong>{index_number}</strong></td>
+                        <td>{search_term}</td>
+                        <td>{total}</td>
+                        <td>{opensearch}</td>
+                        <td>{legacy}</td>
+                        <td>{matched}</td>
+                        <td>{opensearch_only}</td>
+                        <td>{legacy_only}</td>
+                        <td>{links}</td>
+                    </tr>
+""".format
+
+INDEX_TABLE_END = """
+                </tbody>
+            </table>
+"""
+
+_render_virtual_summary = """
+            <div class="stats">
+                <div class="stat-card"><div class="stat-number">{total_records}</div><div class="stat-label">Total Records</div></div>
+                <div class="stat-card"><div class="stat-number">{both}</div><div class="stat-label">Present in Both</div></div>
+                <div class="stat-card"><div class="stat-number">{opensearch_only}</div><div class="stat-label">OpenSearch Only</div></div>
+                <div class="stat-card"><div class="stat-number">{legacy_only}</div><div class="stat-label">Legacy Only</div></div>
+            </div>
+""".format
+
+VIRTUAL_TABLE_START = """
+            <style>
+                .vt-filters { display: flex; flex-wrap: wrap; gap: 15px; align-items: center; margin: 20px 0 10px 0; }
+                .vt-filters label { font-size: 0.9em; color: #495057; font-weight: 500; }
+                .vt-filters select { margin-left: 6px; padding: 4px 6px; border: 1px solid #dee2e6; border-radius: 4px; }
+                .vt-count { margin-left: auto; color: #6c757d; font-size: 0.9em; }
+                .vt-viewport { height: 70vh; overflow-y: auto; position: relative; border: 1px solid #dee2e6; }
+                .vt-spacer { position: relative; }
+                .vt-table { position: absolute; top: 0; left: 0; table-layout: fixed; }
+                .vt-table td { height: 21px; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+                .vt-head { table-layout: fixed; }
+                .vt-col-num { width: 60px; }
+                .vt-col-badge { width: 110px; }
+            </style>
+            <div class="vt-filters">
+                <label>Status<select id="vt-status"><option value="">All</option></select></label>
+                <label>Schema<select id="vt-schema"><option value="">All</option></select></label>
+                <label>Type<select id="vt-type"><option value="">All</option></select></label>
+                <span class="vt-count" id="vt-count">Loading...</span>
+            </div>
+            <table class="search-term-table vt-head">
+                <colgroup id="vt-cols-head"></colgroup>
+                <thead>
+                    <tr>
+                        <th>#</th>
+                        <th>Search Term</th>
+                        <th>Type</th>
+                        <th>Status</th>
+                        <th>OpenSearch Name</th>
+                        <th>OpenSearch ID</th>
+                        <th>OpenSearch Schema</th>
+                        <th>Legacy Name</th>
+                        <th>Legacy ID</th>
+                        <th>Legacy Schema</th>
+                    </tr>
+                </thead>
+            </table>
+            <div class="vt-viewport" id="vt-viewport">
+                <div class="vt-spacer" id="vt-spacer">
+                    <table class="search-term-table vt-table" id="vt-table">
+                        <colgroup id="vt-cols-body"></colgroup>
+                        <tbody id="vt-body"></tbody>
+                    </table>
+                </div>
+            </div>
+"""
+
+VIRTUAL_TABLE_SCRIPT = """
+            <script>
+            (function () {
+                var ROW_HEIGHT = 42;
+                var OVERSCAN = 10;
+                var WIDTHS = ["60px", "", "90px", "130px", "", "", "110px", "", "", "110px"];
+                var STATUS_CLASSES = ["status-both", "status-opensearch-only", "status-legacy-only", "status-legacy-only"];
+
+                function decodePayload(element) {
+                    if (element.dataset.encoding !== "gzip-base64") {
+                        return Promise.resolve(JSON.parse(element.textContent));
+                    }
+                    var binary = atob(element.textContent.trim());
+                    var bytes = new Uint8Array(binary.length);
+                    for (var i = 0; i < binary.length; i++) {
+                        bytes[i] = binary.charCodeAt(i);
+                    }
+                    var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+                    return new Response(stream).text().then(JSON.parse);
+                }
+
+                function fillSelect(select, labels) {
+                    labels.forEach(function (label, code) {
+                        if (label === "") { return; }
+                        var option = document.createElement("option");
+                        option.value = String(code);
+                        option.textContent = label;
+                        select.appendChild(option);
+                    });
+                }
+
+                function cell(row, text, className, badgeClass) {
+                    var td = row.insertCell();
+                    if (className) { td.className = className; }
+                    if (badgeClass !== undefined) {
+                        var span = document.createElement("span");
+                        span.className = badgeClass;
+                        span.textContent = text;
+                        td.appendChild(span);
+                    } else {
+                        td.textContent = text;
+                    }
+                    td.title = text;
+                }
+
+                function setColumns(colgroup) {
+                    WIDTHS.forEach(function (width) {
+                        var col = document.createElement("col");
+                        if (width) { col.style.width = width; }
+                        colgroup.appendChild(col);
+                    });
+                }
+
+                decodePayload(document.getElementById("report-data")).then(function (payload) {
+                    var dict = payload.dictionaries;
+                    var columns = payload.columns;
+                    var viewport = document.getElementById("vt-viewport");
+                    var spacer = document.getElementById("vt-spacer");
+                    var table = document.getElementById("vt-table");
+                    var body = document.getElementById("vt-body");
+                    var counter = document.getElementById("vt-count");
+                    var statusSelect = document.getElementById("vt-status");
+                    var schemaSelect = document.getElementById("vt-schema");
+                    var typeSelect = document.getElementById("vt-type");
+                    var visible = new Int32Array(0);
+                    var lastStart = -1;
+
+                    setColumns(document.getElementById("vt-cols-head"));
+                    setColumns(document.getElementById("vt-cols-body"));
+                    fillSelect(statusSelect, dict.status);
+                    fillSelect(schemaSelect, dict.schema);
+                    fillSelect(typeSelect, dict.type);
+
+                    function text(value) { return value === "" ? "Not Present" : value; }
+
+                    function applyFilters() {
+                        var status = statusSelect.value === "" ? -1 : Number(statusSelect.value);
+                        var schema = schemaSelect.value === "" ? -1 : Number(schemaSelect.value);
+                        var type = typeSelect.value === "" ? -1 : Number(typeSelect.value);
+                        var matches = new Int32Array(payload.count);
+                        var count = 0;
+                        for (var i = 0; i < payload.count; i++) {
+                            if (status >= 0 && columns.status[i] !== status) { continue; }
+                            if (type >= 0 && columns.type[i] !== type) { continue; }
+                            if (schema >= 0 && columns.osSchema[i] !== schema && columns.legacySchema[i] !== schema) { continue; }
+                            matches[count++] = i;
+                        }
+                        visible = matches.subarray(0, count);
+                        spacer.style.height = (count * ROW_HEIGHT) + "px";
+                        counter.textContent = count + " of " + payload.count + " rows";
+                        viewport.scrollTop = 0;
+                        lastStart = -1;
+                        render();
+                    }
+
+                    function render() {
+                        var first = Math.floor(viewport.scrollTop / ROW_HEIGHT);
+                        var start = Math.max(0, first - OVERSCAN);
+                        if (start === lastStart) { return; }
+                        lastStart = start;
+                        var end = Math.min(visible.length, first + Math.ceil(viewport.clientHeight / ROW_HEIGHT) + OVERSCAN);
+                        var fragment = document.createDocumentFragment();
+                        for (var position = start; position < end; position++) {
+                            var i = visible[position];
+                            var row = document.createElement("tr");
+                            var typeLabel = dict.type[columns.type[i]];
+                            var osSchema = dict.schema[columns.osSchema[i]];
+                            var legacySchema = dict.schema[columns.legacySchema[i]];
+                            row.style.height = ROW_HEIGHT + "px";
+                            cell(row, String(i + 1));
+                            cell(row, dict.term[columns.term[i]]);
+                            cell(row, typeLabel, "", typeLabel === "Person" ? "type-person" : "type-entity");
+                            cell(row, dict.status[columns.status[i]], "", "status-badge " + STATUS_CLASSES[columns.status[i]]);
+                            cell(row, text(columns.osName[i]));
+                            cell(row, text(columns.osId[i]));
+                            cell(row, text(osSchema), "", "schema-badge" + (osSchema ? " schema-" + osSchema.toLowerCase() : ""));
+                            cell(row, text(columns.legacyName[i]));
+                            cell(row, text(columns.legacyId[i]));
+                            cell(row, text(legacySchema), "", "schema-badge" + (legacySchema ? " schema-" + legacySchema.toLowerCase() : ""));
+                            fragment.appendChild(row);
+                        }
+                        body.replaceChildren(fragment);
+                        table.style.transform = "translateY(" + (start * ROW_HEIGHT) + "px)";
+                    }
+
+                    viewport.addEventListener("scroll", function () { window.requestAnimationFrame(render); });
+                    [statusSelect, schemaSelect, typeSelect].forEach(function (select) {
+                        select.addEventListener("change", applyFilters);
+                    });
+                    applyFilters();
+                }).catch(function (error) {
+                    document.getElementById("vt-count").textContent = "Could not load report data: " + error;
+                });
+            })();
+            </script>
+"""
+
+
 class HTMLReportGenerator:
     """Utility class for generating HTML reports from test data"""
     
-    def __init__(self):
-        """Initialize the HTML report generator"""
+    def __init__(self, mode="single", shard_rows=5000, compress_payload=True):
+        """
+        Initialize the HTML report generator
+        
+        Args:
+            mode: "single" for one page, "term" for an index page plus one shard per search term,
+                  "rows" for an index page plus shards of about shard_rows rows,
+                  "virtual" for one page whose rows are rendered client-side from a JSON payload
+            shard_rows: Rows per shard page in "rows" mode
+            compress_payload: Embed the "virtual" payload as gzip+base64 instead of plain JSON
+        """
+        if mode not in HTML_MODES:
+            raise ValueError(f"Unknown HTML report mode '{mode}', expected one of {', '.join(HTML_MODES)}")
+        self.mode = mode
+        self.shard_rows = max(int(shard_rows), 1)
+        self.compress_payload = compress_payload
         self.status_colors = {
             "present_in_both": "#d4edda",
             "opensearch_only": "#cce5ff", 
@@ -31,12 +347,173 @@ class HTMLReportGenerator:
             "media": "#e0f2f1"
         }
     
-    def generate_unified_comparison_report(self, df, filename):
+    def generate_unified_comparison_report(self, df, filename, summary_html=""):
         """
-        Generate HTML report from DataFrame for unified comparison
+        Generate HTML report from DataFrame for unified comparison.
+        Output is streamed to the file term by term; in the sharded modes filename is
+        an index page and the term sections go to shard pages next to it.
+        
+        Args:
+            df: Sorted unified comparison DataFrame
+            filename: Path of the main page
+            summary_html: Optional markup placed at the end of the main page (e.g. request timings)
+        
+        Returns:
+            Path of the main page (the index page in sharded modes)
         """
         try:
-            html_content = f"""
+            if self.mode == "single":
+                with open(filename, 'w', encoding='utf-8') as f:
+                    f.write(self.render_report_header())
+                    for search_term, rows, stats in self.iter_term_groups(df):
+                        self.write_term_section(f, search_term, rows, stats)
+                    f.write(self.render_report_footer(summary_html))
+            elif self.mode == "virtual":
+                self._write_virtual_report(df, filename, summary_html)
+            else:
+                self._write_sharded_report(df, filename, summary_html)
+                
+            print(f"✅ HTML report generated: {filename}")
+            return filename
+                
+        except Exception as e:
+            print(f"❌ Error generating HTML report: {e}")
+            raise
+    
+    def iter_term_groups(self, df):
+        """
+        Yield (search_term, rows, stats) for each search term in order of first appearance.
+        Groups and per-term counts are computed in one pass; row dicts are only built
+        for the term being rendered.
+        """
+        has_opensearch = df['OpenSearch ID'] != ''
+        has_legacy = df['Legacy ID'] != ''
+        term_stats = pd.DataFrame({
+            'Search Term': df['Search Term'],
+            'total': 1,
+            'opensearch': has_opensearch,
+            'legacy': has_legacy,
+            'matched': has_opensearch & has_legacy
+        }).groupby('Search Term', sort=False, dropna=False).sum()
+        
+        term_positions = df.groupby('Search Term', sort=False, dropna=False).indices
+        columns = [column for column in ROW_COLUMNS if column in df.columns]
+        values = [df[column].to_numpy() for column in columns]
+        
+        for search_term, stats in zip(term_stats.index, term_stats.itertuples(index=False)):
+            positions = term_positions[search_term]
+            rows = [dict(zip(columns, row)) for row in zip(*(column_values[positions] for column_values in values))]
+            yield search_term, rows, stats._asdict()
+    
+    def write_term_section(self, f, search_term, rows, stats=None, first_row_number=1):
+        """
+        Stream one search term section to an open file in chunks of rendered rows
+        
+        Args:
+            f: Text file handle to write to
+            search_term: Search term shown in the section header
+            rows: Unified comparison rows for this term
+            stats: Optional precomputed counts (total, opensearch, legacy, matched)
+            first_row_number: Number shown for the first row (for sections split across shards)
+        """
+        f.write(self.render_term_header(search_term, rows, stats))
+        render_row = self.render_row
+        for start in range(0, len(rows), WRITE_CHUNK_ROWS):
+            chunk = rows[start:start + WRITE_CHUNK_ROWS]
+            f.write(''.join(render_row(row_number, row)
+                            for row_number, row in enumerate(chunk, start=first_row_number + start)))
+        f.write(TERM_SECTION_END)
+    
+    def _write_sharded_report(self, df, index_filename, summary_html=""):
+        """
+        Write the index page and the shard pages.
+        "term" mode writes one shard per search term; "rows" mode packs consecutive
+        term sections into shards of about shard_rows rows, splitting large terms.
+        """
+        base_name = os.path.splitext(os.path.basename(index_filename))[0]
+        shard_directory_name = f"{base_name}_shards"
+        shard_directory = os.path.join(os.path.dirname(index_filename), shard_directory_name)
+        os.makedirs(shard_directory, exist_ok=True)
+        
+        index_entries = []
+        shard_number = 0
+        shard_file = None
+        shard_row_count = 0
+        
+        def open_shard():
+            nonlocal shard_number, shard_file, shard_row_count
+            shard_number += 1
+            shard_row_count = 0
+            shard_name = f"shard_{shard_number:05d}.html"
+            shard_file = open(os.path.join(shard_directory, shard_name), 'w', encoding='utf-8')
+            shard_file.write(self.render_report_header(
+                title=f"Shard {shard_number}",
+                nav_html=f'<p><a href="../{os.path.basename(index_filename)}">&larr; Back to index</a></p>'
+            ))
+            return f"{shard_directory_name}/{shard_name}"
+        
+        def close_shard():
+            nonlocal shard_file
+            if shard_file is not None:
+                shard_file.write(self.render_report_footer())
+                shard_file.close()
+                shard_file = None
+        
+        try:
+            for search_term, rows, stats in self.iter_term_groups(df):
+                if self.mode == "term":
+                    close_shard()
+                    index_entries.append((search_term, stats, [open_shard()]))
+                    self.write_term_section(shard_file, search_term, rows, stats)
+                    continue
+                
+                # rows mode: fill the current shard, continuing large terms in the next one
+                links = []
+                start = 0
+                while start < len(rows) or not links:
+                    if shard_file is None or shard_row_count >= self.shard_rows:
+                        close_shard()
+                        links.append(open_shard())
+                    elif not links:
+                        links.append(f"{shard_directory_name}/shard_{shard_number:05d}.html")
+                    take = self.shard_rows - shard_row_count
+                    part = rows[start:start + take]
+                    title = search_term if start == 0 else f"{search_term} (continued)"
+                    self.write_term_section(shard_file, title, part, stats, first_row_number=start + 1)
+                    shard_row_count += len(part)
+                    start += len(part)
+                index_entries.append((search_term, stats, links))
+        finally:
+            close_shard()
+        
+        with open(index_filename, 'w', encoding='utf-8') as f:
+            f.write(self.render_report_header(title=f"Search Terms ({len(index_entries)} terms, {shard_number} shards)"))
+            f.write(INDEX_TABLE_START)
+            for index_number, (search_term, stats, links) in enumerate(index_entries, start=1):
+                f.write(_render_index_row(
+                    index_number=index_number,
+                    search_term=search_term,
+                    total=stats['total'],
+                    opensearch=stats['opensearch'],
+                    legacy=stats['legacy'],
+                    matched=stats['matched'],
+                    opensearch_only=stats['opensearch'] - stats['matched'],
+                    legacy_only=stats['legacy'] - stats['matched'],
+                    links=' '.join(f'<a href="{link}">{os.path.splitext(os.path.basename(link))[0]}</a>'
+                                   for link in links)
+                ))
+            f.write(INDEX_TABLE_END)
+            f.write(self.render_report_footer(summary_html))
+    
+    def render_report_header(self, title="Search Results by Term", nav_html=""):
+        """
+        Render the page head, styles and opening containers of the unified report
+        
+        Args:
+            title: Heading above the term sections
+            nav_html: Optional markup placed before the heading (e.g. a link back to the index)
+        """
+        return f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -99,113 +576,230 @@ class HTMLReportGenerator:
         </div>
         
         <div class="table-container">
-            <h2>Search Results by Term</h2>
+            {nav_html}<h2>{title}</h2>
 """
-            
-            # Generate separate tables for each search term
-            for search_term in df['Search Term'].unique():
-                term_df = df[df['Search Term'] == search_term].copy()
-                
-                # Calculate statistics for this term
-                total_records = len(term_df)
-                opensearch_records = len(term_df[term_df['OpenSearch ID'] != ''])
-                legacy_records = len(term_df[term_df['Legacy ID'] != ''])
-                matched_records = len(term_df[(term_df['OpenSearch ID'] != '') & (term_df['Legacy ID'] != '')])
-                opensearch_only = len(term_df[(term_df['OpenSearch ID'] != '') & (term_df['Legacy ID'] == '')])
-                legacy_only = len(term_df[(term_df['OpenSearch ID'] == '') & (term_df['Legacy ID'] != '')])
-                
-                html_content += f"""
+    
+    def build_virtual_payload(self, df):
+        """
+        Encode the unified rows as compact columnar JSON for the virtualized table.
+        Low-cardinality columns (term, type, schemas) are dictionary-encoded as integer codes
+        and the row status is precomputed with the same rules as render_row.
+        
+        Returns:
+            Payload dictionary with count, dictionaries and columns
+        """
+        def display(column):
+            # Same conversion as render_row: falsy values become ''
+            return [str(value) if value else '' for value in df[column].tolist()]
+        
+        def encode(values):
+            codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+            return codes.tolist(), list(uniques)
+        
+        opensearch_ids = display('OpenSearch ID')
+        legacy_ids = display('Legacy ID')
+        statuses = []
+        for opensearch_id, legacy_id in zip(opensearch_ids, legacy_ids):
+            has_opensearch = bool(opensearch_id) and 'Not Present' not in opensearch_id
+            has_legacy = bool(legacy_id) and 'Not Present' not in legacy_id
+            statuses.append(0 if has_opensearch and has_legacy else 1 if has_opensearch else 2 if has_legacy else 3)
+        
+        term_codes, terms = encode(display('Search Term'))
+        type_codes, types = encode(display('Type'))
+        schema_codes, schemas = encode(display('OpenSearch Schema') + display('Legacy Schema'))
+        
+        return {
+            "count": len(df),
+            "dictionaries": {
+                "term": terms,
+                "type": types,
+                "schema": schemas,
+                "status": VIRTUAL_STATUSES
+            },
+            "columns": {
+                "term": term_codes,
+                "type": type_codes,
+                "status": statuses,
+                "osName": display('OpenSearch Name'),
+                "osId": opensearch_ids,
+                "osSchema": schema_codes[:len(df)],
+                "legacyName": display('Legacy Name'),
+                "legacyId": legacy_ids,
+                "legacySchema": schema_codes[len(df):]
+            }
+        }
+    
+    def _write_virtual_report(self, df, filename, summary_html=""):
+        """
+        Write one page that embeds the rows as a columnar JSON payload (optionally gzip+base64)
+        and renders only the visible rows of the table in the browser
+        """
+        payload = self.build_virtual_payload(df)
+        statuses = payload["columns"]["status"]
+        status_counts = [statuses.count(code) for code in range(len(VIRTUAL_STATUSES))]
+        
+        payload_json = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+        if self.compress_payload:
+            encoding = "gzip-base64"
+            payload_text = base64.b64encode(gzip.compress(payload_json.encode('utf-8'), 6)).decode('ascii')
+        else:
+            encoding = "json"
+            # Keep the payload from closing its script element
+            payload_text = payload_json.replace('</', '<\\/')
+        
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(self.render_report_header(title=f"All Results ({payload['count']} rows, "
+                                                    f"{len(payload['dictionaries']['term'])} terms)"))
+            f.write(_render_virtual_summary(
+                total_records=payload["count"],
+                both=status_counts[0],
+                opensearch_only=status_counts[1],
+                legacy_only=status_counts[2]
+            ))
+            f.write(VIRTUAL_TABLE_START)
+            f.write(f'<script id="report-data" type="application/octet-stream" data-encoding="{encoding}">')
+            f.write(payload_text)
+            f.write('</script>')
+            f.write(VIRTUAL_TABLE_SCRIPT)
+            f.write(self.render_report_footer(summary_html))
+    
+    def render_term_section(self, search_term, rows, stats=None):
+        """
+        Render the summary header and table for one search term
+        
+        Args:
+            search_term: Search term shown in the section header
+            rows: Unified comparison rows (dicts with the report columns) for this term
+            stats: Optional precomputed counts (total, opensearch, legacy, matched); computed from rows if omitted
+        """
+        buffer = io.StringIO()
+        self.write_term_section(buffer, search_term, rows, stats)
+        return buffer.getvalue()
+    
+    def render_term_header(self, search_term, rows, stats=None):
+        """
+        Render the summary header and table head of one search term section
+        """
+        # Calculate statistics for this term
+        if stats is None:
+            stats = {
+                'total': len(rows),
+                'opensearch': sum(1 for row in rows if row['OpenSearch ID'] != ''),
+                'legacy': sum(1 for row in rows if row['Legacy ID'] != ''),
+                'matched': sum(1 for row in rows if row['OpenSearch ID'] != '' and row['Legacy ID'] != '')
+            }
+        opensearch_records = int(stats['opensearch'])
+        legacy_records = int(stats['legacy'])
+        matched_records = int(stats['matched'])
+        
+        return _render_term_header(
+            search_term=search_term,
+            total_records=int(stats['total']),
+            opensearch_records=opensearch_records,
+            legacy_records=legacy_records,
+            matched_records=matched_records,
+            opensearch_only=opensearch_records - matched_records,
+            legacy_only=legacy_records - matched_records
+        )
+    
+    def render_row(self, row_number, row):
+        """
+        Render a single comparison row with type, status and schema badges
+        """
+        type_class = "type-person" if row['Type'] == 'Person' else "type-entity"
+        opensearch_schema_class = f"schema-{row['OpenSearch Schema'].lower()}" if row['OpenSearch Schema'] else ""
+        legacy_schema_class = f"schema-{row['Legacy Schema'].lower()}" if row['Legacy Schema'] else ""
+        
+        # Convert to string and check for "Not Present" text
+        opensearch_name = str(row['OpenSearch Name']) if row['OpenSearch Name'] else ''
+        opensearch_id = str(row['OpenSearch ID']) if row['OpenSearch ID'] else ''
+        opensearch_schema = str(row['OpenSearch Schema']) if row['OpenSearch Schema'] else ''
+        legacy_name = str(row['Legacy Name']) if row['Legacy Name'] else ''
+        legacy_id = str(row['Legacy ID']) if row['Legacy ID'] else ''
+        legacy_schema = str(row['Legacy Schema']) if row['Legacy Schema'] else ''
+        
+        # Check if values indicate presence (not empty and not "Not Present")
+        has_opensearch = opensearch_id and 'Not Present' not in opensearch_id
+        has_legacy = legacy_id and 'Not Present' not in legacy_id
+        
+        if has_opensearch and has_legacy:
+            status = "Present in Both"
+            status_class = "status-both"
+        elif has_opensearch and not has_legacy:
+            status = "OpenSearch Only"
+            status_class = "status-opensearch-only"
+        elif not has_opensearch and has_legacy:
+            status = "Legacy Only"
+            status_class = "status-legacy-only"
+        else:
+            status = "Not Present"
+            status_class = "status-legacy-only"
+        
+        # Keep existing "Not Present" text or set to "Not Present" if empty
+        return _render_row(
+            row_number=row_number,
+            type_class=type_class,
+            type=row['Type'],
+            status_class=status_class,
+            status=status,
+            opensearch_name=opensearch_name or 'Not Present',
+            opensearch_id=opensearch_id or 'Not Present',
+            opensearch_schema_class=opensearch_schema_class,
+            opensearch_schema=opensearch_schema or 'Not Present',
+            legacy_name=legacy_name or 'Not Present',
+            legacy_id=legacy_id or 'Not Present',
+            legacy_schema_class=legacy_schema_class,
+            legacy_schema=legacy_schema or 'Not Present'
+        )
+    
+    def render_timing_section(self, summary, slowest=None, phases=None):
+        """
+        Render the request timing summary of a run
+        
+        Args:
+            summary: Percentile entries with Metric, Count, p50, p90, p99 and Max (see TimingRecorder.summary)
+            slowest: Timing rows of the slowest entities
+            phases: Run phase durations in seconds by name
+        """
+        percentile_columns = [column for column in (summary[0] if summary else {}) if column not in ("Metric", "Count")]
+        phase_items = ''.join(f'<span class="summary-item">{name}: {seconds:.2f}s</span>'
+                              for name, seconds in (phases or {}).items())
+        summary_rows = ''.join(
+            f"<tr><td>{entry['Metric']}</td><td>{entry['Count']}</td>"
+            + ''.join(f"<td>{entry[column]:.1f}</td>" for column in percentile_columns) + "</tr>"
+            for entry in summary
+        )
+        slowest_rows = ''.join(
+            f"<tr><td>{row['Search Term']}</td><td>{row['Type']}</td><td>{row.get('Fetch ms') or 0:.1f}</td>"
+            f"<td>{row.get('TTFB ms') or 0:.1f}</td><td>{row.get('Response Bytes') or 0}</td>"
+            f"<td>{row.get('OpenSearch Hits') or 0}</td><td>{row.get('Legacy Hits') or 0}</td></tr>"
+            for row in slowest or []
+        )
+        return f"""
             <div class="search-term-section">
                 <div class="search-term-header">
-                    <h3>{search_term}</h3>
-                    <div class="term-summary">
-                        <span class="summary-item">Total: {total_records}</span>
-                        <span class="summary-item">OpenSearch: {opensearch_records}</span>
-                        <span class="summary-item">Legacy: {legacy_records}</span>
-                        <span class="summary-item">Matched: {matched_records}</span>
-                        <span class="summary-item">OpenSearch Only: {opensearch_only}</span>
-                        <span class="summary-item">Legacy Only: {legacy_only}</span>
-                    </div>
+                    <h3>Request Timings</h3>
+                    <div class="term-summary">{phase_items}</div>
                 </div>
                 <table class="search-term-table">
-                    <thead>
-                        <tr>
-                            <th>#</th>
-                            <th>Type</th>
-                            <th>Status</th>
-                            <th>OpenSearch Name</th>
-                            <th>OpenSearch ID</th>
-                            <th>OpenSearch Schema</th>
-                            <th>Legacy Name</th>
-                            <th>Legacy ID</th>
-                            <th>Legacy Schema</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-"""
-                
-                # Add rows for this search term
-                row_number = 1
-                for _, row in term_df.iterrows():
-                    type_class = "type-person" if row['Type'] == 'Person' else "type-entity"
-                    opensearch_schema_class = f"schema-{row['OpenSearch Schema'].lower()}" if row['OpenSearch Schema'] else ""
-                    legacy_schema_class = f"schema-{row['Legacy Schema'].lower()}" if row['Legacy Schema'] else ""
-                    
-                    # Convert to string and check for "Not Present" text
-                    opensearch_name = str(row['OpenSearch Name']) if row['OpenSearch Name'] else ''
-                    opensearch_id = str(row['OpenSearch ID']) if row['OpenSearch ID'] else ''
-                    opensearch_schema = str(row['OpenSearch Schema']) if row['OpenSearch Schema'] else ''
-                    legacy_name = str(row['Legacy Name']) if row['Legacy Name'] else ''
-                    legacy_id = str(row['Legacy ID']) if row['Legacy ID'] else ''
-                    legacy_schema = str(row['Legacy Schema']) if row['Legacy Schema'] else ''
-                    
-                    # Check if values indicate presence (not empty and not "Not Present")
-                    has_opensearch = opensearch_id and 'Not Present' not in opensearch_id
-                    has_legacy = legacy_id and 'Not Present' not in legacy_id
-                    
-                    if has_opensearch and has_legacy:
-                        status = "Present in Both"
-                        status_class = "status-both"
-                    elif has_opensearch and not has_legacy:
-                        status = "OpenSearch Only"
-                        status_class = "status-opensearch-only"
-                    elif not has_opensearch and has_legacy:
-                        status = "Legacy Only"
-                        status_class = "status-legacy-only"
-                    else:
-                        status = "Not Present"
-                        status_class = "status-legacy-only"
-                    
-                    # Keep existing "Not Present" text or set to "Not Present" if empty
-                    opensearch_name = opensearch_name if opensearch_name else 'Not Present'
-                    opensearch_id = opensearch_id if opensearch_id else 'Not Present'
-                    opensearch_schema = opensearch_schema if opensearch_schema else 'Not Present'
-                    legacy_name = legacy_name if legacy_name else 'Not Present'
-                    legacy_id = legacy_id if legacy_id else 'Not Present'
-                    legacy_schema = legacy_schema if legacy_schema else 'Not Present'
-                    
-                    html_content += f"""
-                        <tr>
-                            <td><strong>{row_number}</strong></td>
-                            <td><span class="{type_class}">{row['Type']}</span></td>
-                            <td><span class="status-badge {status_class}">{status}</span></td>
-                            <td>{opensearch_name}</td>
-                            <td>{opensearch_id}</td>
-                            <td><span class="schema-badge {opensearch_schema_class}">{opensearch_schema}</span></td>
-                            <td>{legacy_name}</td>
-                            <td>{legacy_id}</td>
-                            <td><span class="schema-badge {legacy_schema_class}">{legacy_schema}</span></td>
-                        </tr>
-"""
-                    row_number += 1
-                
-                html_content += """
-                    </tbody>
+                    <thead><tr><th>Metric</th><th>Count</th>{''.join(f'<th>{column}</th>' for column in percentile_columns)}</tr></thead>
+                    <tbody>{summary_rows}</tbody>
+                </table>
+                <table class="search-term-table">
+                    <thead><tr><th>Slowest Search Term</th><th>Type</th><th>Fetch ms</th><th>TTFB ms</th><th>Response Bytes</th><th>OpenSearch Hits</th><th>Legacy Hits</th></tr></thead>
+                    <tbody>{slowest_rows}</tbody>
                 </table>
             </div>
 """
-            
-            html_content += """
+    
+    def render_report_footer(self, summary_html=""):
+        """
+        Render the closing containers and footer of the unified report
+        
+        Args:
+            summary_html: Optional markup placed after the term sections (e.g. run totals)
+        """
+        return f"""{summary_html}
         </div>
         
         <div class="footer">
@@ -216,15 +810,6 @@ class HTMLReportGenerator:
 </body>
 </html>
 """
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-                
-            print(f"✅ HTML report generated: {filename}")
-                
-        except Exception as e:
-            print(f"❌ Error generating HTML report: {e}")
-            raise
     
     def generate_entity_report(self, entity_name, entity_type, comparison_data, filename):
         """
@@ -0,0 +1,227 @@
+"""
+Pooled HTTP Client Module
+Shared keep-alive client for calls to the OpenSearch search API
+"""
+
+import time
+import threading
+from typing import Dict, Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .rate_limiter import RateLimiter, retry_after_seconds
+
+try:
+    import httpx  # Optional - only needed for HTTP/2
+except ImportError:
+    httpx = None
+
+# Seconds spent opening connections (DNS lookup, TCP connect and TLS handshake) by the current thread
+_connect_timing = threading.local()
+
+
+class _ConnectCounter:
+    """Thread-safe count of connect() calls, i.e. TCP connections opened (including reconnects)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def increment(self) -> None:
+        with self._lock:
+            self.count += 1
+
+
+class _TimedConnectMixin:
+    """Adds the duration of connect() to the calling thread's connect time and counts it"""
+
+    # Set per adapter (see _TimedHTTPAdapter.init_poolmanager)
+    connect_counter: Optional[_ConnectCounter] = None
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timing.seconds = getattr(_connect_timing, "seconds", 0.0) + time.perf_counter() - start
+            if self.connect_counter is not None:
+                self.connect_counter.increment()
+
+
+class _TimedHTTPConnection(_TimedConnectMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled connections measure how long they take to open and count
+    every connect, including urllib3 reconnecting a pooled connection the server closed
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        if not hasattr(self, "connect_counter"):
+            self.connect_counter = _ConnectCounter()
+        counter = {"connect_counter": self.connect_counter}
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type("_CountedHTTPConnectionPool", (_TimedHTTPConnectionPool,), {
+                "ConnectionCls": type("_CountedHTTPConnection", (_TimedHTTPConnection,), counter)
+            }),
+            "https": type("_CountedHTTPSConnectionPool", (_TimedHTTPSConnectionPool,), {
+                "ConnectionCls": type("_CountedHTTPSConnection", (_TimedHTTPSConnection,), counter)
+            })
+        }
+
+
+class SearchApiClient:
+    """
+    Shared client for the OpenSearch search API
+    Reuses TCP/TLS connections across entities and computes headers only once
+    """
+
+    def __init__(self, api_config: Dict[str, Any], headers: Dict[str, str], pool_size: int = None,
+                 rate_limiter: Optional[RateLimiter] = None):
+        """
+        Initialize the API client
+
+        Args:
+            api_config: API settings (url, timeout, pool_size, http2)
+            headers: Request headers including authentication, computed once per run
+            pool_size: Override for the connection pool size
+            rate_limiter: Shared throttle every request waits on and reports its outcome to
+        """
+        self.url = api_config["url"]
+        self.timeout = api_config["timeout"]
+        self.headers = dict(headers)
+        self.pool_size = pool_size or api_config.get("pool_size", 10)
+        self.http2 = bool(api_config.get("http2", False))
+        self.rate_limiter = rate_limiter
+
+        if self.http2 and httpx is None:
+            print("⚠️  Warning: HTTP/2 requested but httpx[http2] is not installed, falling back to HTTP/1.1")
+            self.http2 = False
+
+        if self.http2:
+            self.session = httpx.Client(
+                http2=True,
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.pool_size,
+                                    max_keepalive_connections=self.pool_size)
+            )
+        else:
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+            # Block instead of opening throwaway connections when the pool is exhausted
+            adapter = _TimedHTTPAdapter(pool_maxsize=self.pool_size, pool_block=True)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+        # Request statistics, used to report connection reuse
+        self._lock = threading.Lock()
+        self.request_count = 0
+        self.total_request_time = 0.0
+        self._last_timing = threading.local()
+
+    def post(self, payload: Dict[str, Any], url: str = None):
+        """
+        POST a JSON payload over a pooled connection
+
+        Args:
+            payload: JSON body to send
+            url: Endpoint override (defaults to the configured search URL)
+
+        Returns:
+            The HTTP response, after raise_for_status()
+
+        Raises:
+            requests.exceptions.RequestException: On connection errors or non-2xx status
+        """
+        admitted_at = self.rate_limiter.acquire() if self.rate_limiter is not None else None
+        response = None
+        _connect_timing.seconds = 0.0
+        start = time.perf_counter()
+        try:
+            if self.http2:
+                try:
+                    response = self.session.post(url or self.url, json=payload)
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    raise requests.exceptions.HTTPError(str(e), response=e.response) from e
+                except httpx.HTTPError as e:
+                    raise requests.exceptions.RequestException(str(e)) from e
+            else:
+                response = self.session.post(url or self.url, json=payload, timeout=self.timeout)
+                response.raise_for_status()
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.request_count += 1
+                self.total_request_time += elapsed
+            self._last_timing.value = {
+                "connect_seconds": None if self.http2 else _connect_timing.seconds,
+                # requests sets elapsed when the response headers arrive, before the body is read
+                "ttfb_seconds": None if response is None or self.http2 else response.elapsed.total_seconds(),
+                "request_seconds": elapsed,
+                "response_bytes": len(response.content) if response is not None else 0,
+                "status": response.status_code if response is not None else None
+            }
+            if self.rate_limiter is not None:
+                # No response (connection error, timeout) counts as overload, like a 5xx
+                self.rate_limiter.release(
+                    admitted_at,
+                    status=response.status_code if response is not None else None,
+                    retry_after=retry_after_seconds(response)
+                )
+
+    def last_request_timing(self) -> Dict[str, Any]:
+        """
+        Timing of the calling thread's most recent post()
+
+        Returns:
+            Dict with connect_seconds (DNS + TCP + TLS, 0 on a reused connection, None over HTTP/2),
+            ttfb_seconds (None over HTTP/2), request_seconds, response_bytes and status
+        """
+        return dict(getattr(self._last_timing, "value", {}))
+
+    def connections_opened(self) -> int:
+        """
+        Number of TCP connections opened so far (HTTP/1.1 pools only), counting every connect:
+        a pooled connection the server closed and urllib3 reopened counts again
+        """
+        if self.http2:
+            return 0
+        return sum(adapter.connect_counter.count for adapter in set(self.session.adapters.values())
+                   if isinstance(adapter, _TimedHTTPAdapter))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request and connection reuse statistics"""
+        with self._lock:
+            count = self.request_count
+            total_time = self.total_request_time
+        return {
+            "requests": count,
+            "connections_opened": self.connections_opened(),
+            "avg_request_ms": (total_time / count * 1000) if count else 0.0,
+            "http2": self.http2
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.session.close()
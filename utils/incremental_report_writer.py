@@ -0,0 +1,178 @@
+"""
+Incremental Report Writer Module
+Streams unified comparison rows to Excel and HTML as each entity completes,
+so memory stays constant and a failed or interrupted run still leaves a usable report
+"""
+
+import os
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+REPORT_COLUMNS = [
+    "Search Term", "Type", "OpenSearch Name", "OpenSearch ID", "OpenSearch Schema",
+    "Legacy Name", "Legacy ID", "Legacy Schema"
+]
+
+
+class IncrementalReportWriter:
+    """
+    Appends each entity's unified rows to an openpyxl write-only workbook (one sheet per Test Key)
+    and to an HTML report that is flushed after every entity.
+
+    The HTML file is readable at any point during the run. The workbook is finalized by close(),
+    which also runs when the run fails or is interrupted (use the writer as a context manager).
+    A killed process never reaches close() and leaves no workbook; a --resume run writes a new
+    one from the checkpoint log.
+    """
+
+    def __init__(self, report_generator, report_name: str = "unified_comparison",
+                 create_excel: bool = True, create_html: bool = True, timings=None):
+        """
+        Initialize the writer and open the output files
+
+        Args:
+            report_generator: ReportGenerator used to build rows and locate the results directory
+            report_name: Base name for the report files
+            create_excel: Whether to write the Excel report
+            create_html: Whether to write the HTML report
+            timings: TimingRecorder of the run; its sheets and HTML section are written by close()
+        """
+        self.report_generator = report_generator
+        self.timings = timings
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base_path = os.path.join(report_generator.results_directory, f"{report_name}_{timestamp}")
+
+        self.excel_filename: Optional[str] = f"{base_path}.xlsx" if create_excel else None
+        self.html_filename: Optional[str] = f"{base_path}.html" if create_html else None
+
+        self.workbook = Workbook(write_only=True) if create_excel else None
+        self.sheets: Dict[str, Any] = {}
+        self.sheet_names = set()
+        self.header_font = Font(bold=True)
+
+        self.html_file = None
+        if create_html:
+            self.html_file = open(self.html_filename, "w", encoding="utf-8")
+            self.html_file.write(report_generator.html_generator.render_report_header())
+            self.html_file.flush()
+
+        # Running totals, so nothing but the current entity is kept in memory
+        self.entity_count = 0
+        self.total_records = 0
+        self.opensearch_records = 0
+        self.legacy_records = 0
+        self.matched_records = 0
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            print(f"⚠️  Run stopped early ({exc_type.__name__}) - writing partial report")
+        self.close()
+        return False
+
+    def _append_header(self, sheet, columns) -> None:
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(sheet, value=column)
+            cell.font = self.header_font
+            header.append(cell)
+        sheet.append(header)
+    
+    def _get_sheet(self, test_key: str):
+        """Get or create the sheet for a Test Key"""
+        test_key = str(test_key)
+        sheet = self.sheets.get(test_key)
+        if sheet is None:
+            # Truncate sheet name to 31 characters (Excel limit); Test Keys that only differ
+            # after that (or in case) get a numeric suffix, as in excel_writer
+            sheet_name = base_name = test_key[:31]
+            suffix = 2
+            while sheet_name.lower() in self.sheet_names:
+                sheet_name = f"{base_name[:31 - len(str(suffix)) - 1]}~{suffix}"
+                suffix += 1
+            self.sheet_names.add(sheet_name.lower())
+
+            sheet = self.workbook.create_sheet(title=sheet_name)
+            self._append_header(sheet, REPORT_COLUMNS)
+            self.sheets[test_key] = sheet
+        return sheet
+
+    def add_item(self, comparison_item: Dict[str, Any]) -> None:
+        """
+        Write the unified rows of one completed entity
+
+        Args:
+            comparison_item: Dictionary with search_term, entity_type, opensearch_results and legacy_results
+        """
+        rows = self.report_generator.build_unified_rows(comparison_item)
+        
+        # Like the buffered report, entities without rows get no sheet and no HTML section
+        if not rows:
+            return
+
+        # Same ordering as the buffered report: by OpenSearch Schema, then OpenSearch ID
+        rows.sort(key=lambda row: (str(row["OpenSearch Schema"]), str(row["OpenSearch ID"])))
+
+        if self.workbook is not None:
+            sheet = self._get_sheet(comparison_item["search_term"])
+            for row in rows:
+                sheet.append([row[column] for column in REPORT_COLUMNS])
+
+        if self.html_file is not None:
+            self.report_generator.html_generator.write_term_section(
+                self.html_file, comparison_item["search_term"], rows
+            )
+            self.html_file.flush()
+
+        self.entity_count += 1
+        self.total_records += len(rows)
+        for row in rows:
+            has_opensearch = bool(row["OpenSearch ID"])
+            has_legacy = bool(row["Legacy ID"])
+            self.opensearch_records += has_opensearch
+            self.legacy_records += has_legacy
+            self.matched_records += has_opensearch and has_legacy
+
+    def close(self) -> None:
+        """Finalize the HTML report and save the workbook"""
+        if self.closed:
+            return
+        self.closed = True
+
+        if self.html_file is not None:
+            summary_html = f"""
+            <div class="summary">
+                <h2>Run Summary ({self.entity_count} entities)</h2>
+                <div class="stats">
+                    <div class="stat-card"><div class="stat-number">{self.total_records}</div><div class="stat-label">Total Records</div></div>
+                    <div class="stat-card"><div class="stat-number">{self.opensearch_records}</div><div class="stat-label">OpenSearch Records</div></div>
+                    <div class="stat-card"><div class="stat-number">{self.legacy_records}</div><div class="stat-label">Legacy GDC Records</div></div>
+                    <div class="stat-card"><div class="stat-number">{self.matched_records}</div><div class="stat-label">Matched Records</div></div>
+                </div>
+            </div>
+"""
+            summary_html += self.report_generator.timing_html(self.timings)
+            self.html_file.write(self.report_generator.html_generator.render_report_footer(summary_html))
+            self.html_file.close()
+
+        if self.workbook is not None:
+            if not self.sheets:
+                self.workbook.create_sheet(title="No Results")
+            for sheet_name, sheet_df in self.report_generator.timing_sheets(self.timings) or []:
+                sheet = self.workbook.create_sheet(title=sheet_name)
+                self._append_header(sheet, list(sheet_df.columns))
+                for values in sheet_df.astype(object).where(sheet_df.notna(), None).itertuples(index=False, name=None):
+                    sheet.append(values)
+            self.workbook.save(self.excel_filename)
+
+        self.report_generator.print_summary_counts(
+            self.excel_filename, self.html_filename, self.total_records,
+            self.opensearch_records, self.legacy_records, self.matched_records
+        )
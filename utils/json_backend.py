@@ -0,0 +1,171 @@
+"""
+JSON Backend Module
+Pluggable JSON decoding for API responses and GDC baselines (msgspec, orjson or the stdlib),
+with typed decoding of search responses straight into the fields the harness normalizes
+"""
+
+import json
+from typing import Any, List, Union
+
+try:
+    import msgspec  # Optional - fast decoder with typed decoding into structs
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson  # Optional - fast generic decoder
+except ImportError:
+    orjson = None
+
+JSON_BACKENDS = ("auto", "msgspec", "orjson", "json")
+
+# Marks a typed field that was missing from the JSON (dict.get default semantics)
+UNSET = msgspec.UNSET if msgspec is not None else object()
+
+if msgspec is not None:
+    class SearchSource(msgspec.Struct):
+        """
+        The _source fields read by normalize_api_record and determine_record_source.
+        Every other field is skipped while decoding. Fields whose presence matters
+        default to UNSET, the rest to the default the dict-based code passes to get().
+        """
+        recid: Any = UNSET
+        record_id: Any = UNSET
+        ID: Any = UNSET
+        First_Name: Any = ""
+        Last_Name: Any = ""
+        Full_Name: Any = ""
+        Other_Names: Any = UNSET
+        otherNames: Any = ""
+        AltScript: Any = ""
+        RecType: Any = ""
+        name: Any = ""
+        Entity_Name: Any = ""
+        Entity_Type: Any = ""
+        index: Any = msgspec.field(default="", name="_index")
+
+    class SearchHit(SearchSource):
+        """A search hit; without a _source object its own fields are the record"""
+        id: Any = msgspec.field(default=UNSET, name="_id")
+        source: Union[SearchSource, None] = msgspec.field(default=UNSET, name="_source")
+
+    class SearchResponse(msgspec.Struct):
+        """Search response with the hit list under results, data or hits"""
+        results: Union[List[SearchHit], None] = UNSET
+        data: Union[List[SearchHit], None] = UNSET
+        hits: Union[List[SearchHit], None] = UNSET
+
+    class BatchResponse(msgspec.Struct):
+        """Batched search response"""
+        responses: List[SearchResponse]
+
+    _search_decoder = msgspec.json.Decoder(SearchResponse)
+    _batch_decoder = msgspec.json.Decoder(Union[BatchResponse, List[SearchResponse]])
+    _generic_decoder = msgspec.json.Decoder()
+
+
+def resolve_backend(backend: str) -> str:
+    """
+    Validate the backend name, falling back to the stdlib decoder if the requested one is not installed
+
+    Args:
+        backend: "auto" (fastest installed), "msgspec", "orjson" or "json"
+
+    Returns:
+        Backend that will actually be used
+    """
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{backend}', expected one of {', '.join(JSON_BACKENDS)}")
+    installed = {"msgspec": msgspec is not None, "orjson": orjson is not None, "json": True}
+    if backend == "auto":
+        return next(name for name, available in installed.items() if available)
+    if not installed[backend]:
+        print(f"⚠️  Warning: JSON backend {backend} requested but not installed, falling back to json")
+        return "json"
+    return backend
+
+
+def is_typed_response(value: Any) -> bool:
+    """Whether value is a SearchResponse produced by typed decoding"""
+    return msgspec is not None and isinstance(value, SearchResponse)
+
+
+class JsonBackend:
+    """
+    JSON decoder with a selectable implementation.
+
+    Every backend returns the same Python objects as json.loads. Input the fast decoder
+    rejects (e.g. NaN literals or non-UTF-8 bytes) is retried with the stdlib. Decoding
+    errors are raised as ValueError.
+    """
+
+    def __init__(self, backend: str = "auto"):
+        """
+        Initialize the JSON backend
+
+        Args:
+            backend: "auto", "msgspec", "orjson" or "json"
+        """
+        self.name = resolve_backend(backend)
+
+    @property
+    def typed(self) -> bool:
+        """Whether search responses can be decoded into SearchResponse structs"""
+        return self.name == "msgspec"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document into dicts and lists
+
+        Args:
+            data: JSON text or UTF-8 bytes
+
+        Returns:
+            Decoded value
+        """
+        if self.name != "json":
+            try:
+                return _generic_decoder.decode(data) if self.name == "msgspec" else orjson.loads(data)
+            except ValueError:
+                pass
+        return json.loads(data)
+
+    def decode_response(self, data: Union[bytes, str], typed: bool = True) -> Any:
+        """
+        Decode a search response
+
+        Args:
+            data: Response body
+            typed: Decode into a SearchResponse if the backend supports it (only the fields
+                normalization reads are decoded, so the raw response is not kept)
+
+        Returns:
+            SearchResponse, or the generic decoded value if typed decoding is off or the body
+            does not have the expected shape
+        """
+        if typed and self.typed:
+            try:
+                return _search_decoder.decode(data)
+            except ValueError:
+                pass
+        return self.loads(data)
+
+    def decode_batch_response(self, data: Union[bytes, str], typed: bool = True) -> Any:
+        """
+        Decode a batched search response
+
+        Args:
+            data: Response body ({"responses": [...]} or a bare list)
+            typed: Decode into a list of SearchResponse if the backend supports it
+
+        Returns:
+            List of SearchResponse, or the generic decoded value if typed decoding is off
+            or the body does not have the expected shape
+        """
+        if typed and self.typed:
+            try:
+                decoded = _batch_decoder.decode(data)
+                return decoded.responses if isinstance(decoded, BatchResponse) else decoded
+            except ValueError:
+                pass
+        return self.loads(data)
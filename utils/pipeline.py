@@ -0,0 +1,166 @@
+"""
+Pipeline Module
+Bounded-queue producer/consumer pipeline with per-stage worker threads
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+_SENTINEL = object()
+_POLL_INTERVAL = 0.1
+
+
+class Pipeline:
+    """
+    Runs items from a source through a chain of stages.
+
+    Each stage has its own worker threads and reads from a bounded queue, so a slow
+    stage blocks the stages before it (backpressure). At most max_in_flight items are
+    inside the pipeline at once, and results are yielded in source order.
+    """
+
+    def __init__(self, stages: List[Tuple[str, Callable[[Any], Any], int]], queue_size: int = 8,
+                 max_in_flight: int = 0):
+        """
+        Initialize the pipeline
+
+        Args:
+            stages: List of (name, function, worker_count); each function maps one item to the next stage's input
+            queue_size: Capacity of the queue in front of each stage
+            max_in_flight: Maximum items between the source and the consumer (0 = derived from queue sizes)
+        """
+        self.stages = [(name, func, max(int(workers), 1)) for name, func, workers in stages]
+        self.queue_size = max(int(queue_size), 1)
+        self.max_in_flight = max_in_flight or self.queue_size * (len(self.stages) + 1) + sum(
+            workers for _, _, workers in self.stages)
+
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, float]] = {
+            name: {"items": 0, "busy_seconds": 0.0, "workers": workers} for name, _, workers in self.stages
+        }
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """
+        Run the pipeline over the source
+
+        Args:
+            source: Iterable of input items, consumed on a background thread
+
+        Yields:
+            Output of the last stage for each input item, in source order
+
+        Raises:
+            Exception: The first exception raised by the source or any stage
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        window = threading.Semaphore(self.max_in_flight)
+        cancel = threading.Event()
+        errors = []
+        remaining_workers = [workers for _, _, workers in self.stages]
+
+        def fail(exc):
+            with self._lock:
+                if not errors:
+                    errors.append(exc)
+            cancel.set()
+
+        def feed():
+            try:
+                for seq, item in enumerate(source):
+                    while not window.acquire(timeout=_POLL_INTERVAL):
+                        if cancel.is_set():
+                            return
+                    if not self._put(queues[0], (seq, item), cancel):
+                        return
+            except Exception as e:
+                fail(e)
+            finally:
+                for _ in range(self.stages[0][2]):
+                    self._put(queues[0], _SENTINEL, cancel)
+
+        def work(index):
+            name, func, _ = self.stages[index]
+            in_queue, out_queue = queues[index], queues[index + 1]
+            try:
+                while True:
+                    entry = self._get(in_queue, cancel)
+                    if entry is _SENTINEL:
+                        break
+                    seq, item = entry
+                    start = time.perf_counter()
+                    try:
+                        result = func(item)
+                    except Exception as e:
+                        fail(e)
+                        break
+                    with self._lock:
+                        self.stats[name]["items"] += 1
+                        self.stats[name]["busy_seconds"] += time.perf_counter() - start
+                    if not self._put(out_queue, (seq, result), cancel):
+                        break
+            finally:
+                # The last worker of a stage tells the next stage that no more items are coming
+                with self._lock:
+                    remaining_workers[index] -= 1
+                    last_worker = remaining_workers[index] == 0
+                if last_worker:
+                    downstream = self.stages[index + 1][2] if index + 1 < len(self.stages) else 1
+                    for _ in range(downstream):
+                        self._put(out_queue, _SENTINEL, cancel)
+
+        threads = [threading.Thread(target=feed, name="pipeline-source", daemon=True)]
+        for index, (name, _, workers) in enumerate(self.stages):
+            threads.extend(
+                threading.Thread(target=work, args=(index,), name=f"pipeline-{name}-{n}", daemon=True)
+                for n in range(workers)
+            )
+        for thread in threads:
+            thread.start()
+
+        # Reorder results so the consumer sees them in source order
+        next_seq = 0
+        buffered = {}
+        try:
+            while True:
+                entry = self._get(queues[-1], cancel)
+                if entry is _SENTINEL:
+                    break
+                seq, result = entry
+                buffered[seq] = result
+                while next_seq in buffered:
+                    yield buffered.pop(next_seq)
+                    next_seq += 1
+                    window.release()
+        finally:
+            cancel.set()
+
+        if errors:
+            raise errors[0]
+
+    @staticmethod
+    def _put(q: queue.Queue, entry: Any, cancel: threading.Event) -> bool:
+        """Put with backpressure, giving up if the pipeline is cancelled"""
+        while True:
+            try:
+                q.put(entry, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                if cancel.is_set():
+                    return False
+
+    @staticmethod
+    def _get(q: queue.Queue, cancel: threading.Event) -> Any:
+        """Get the next entry, returning the sentinel if the pipeline is cancelled"""
+        while True:
+            try:
+                return q.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                if cancel.is_set():
+                    return _SENTINEL
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get items processed and busy time per stage"""
+        with self._lock:
+            return {name: dict(values) for name, values in self.stats.items()}
@@ -0,0 +1,196 @@
+"""
+Rate Limiter Module
+Client-side throttle shared by every API call: a token bucket for requests per second,
+an AIMD concurrency limit that backs off on 429/5xx responses, and jittered exponential
+retry delays that honor Retry-After
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+
+
+def is_overload_status(status: Optional[int]) -> bool:
+    """Whether a response status (None = connection error or timeout) means the service is overloaded"""
+    return status is None or status == 429 or status >= 500
+
+
+def retry_after_seconds(response: Any) -> Optional[float]:
+    """
+    Read the Retry-After header of a response
+
+    Args:
+        response: requests or httpx response (or None)
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        # HTTP-date form, e.g. "Wed, 21 Oct 2026 07:28:00 GMT"
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Shared throttle for API requests.
+
+    acquire() blocks until a token is available (rate_per_second, with bursts up to burst),
+    fewer than the current concurrency limit requests are in flight, and any Retry-After
+    pause has passed. release() feeds the outcome back: the concurrency limit grows by one
+    per limit successful requests and is halved on an overload response, at most once per
+    round of requests (additive increase, multiplicative decrease).
+    """
+
+    def __init__(self, rate_per_second: float = 0, burst: int = 0, max_concurrency: int = 0,
+                 adaptive: bool = True, min_concurrency: int = 1, decrease_factor: float = 0.5,
+                 backoff_base: float = 1.0, backoff_max: float = 30.0):
+        """
+        Initialize the rate limiter
+
+        Args:
+            rate_per_second: Sustained request rate (0 = unlimited)
+            burst: Bucket size, i.e. requests allowed back to back (0 = one second's worth)
+            max_concurrency: Upper bound for requests in flight (0 = unlimited)
+            adaptive: Adapt the concurrency limit to overload responses (AIMD)
+            min_concurrency: Lower bound for the adaptive concurrency limit
+            decrease_factor: Factor applied to the concurrency limit on an overload response
+            backoff_base: Retry delay before the first retry, doubled on every further attempt
+            backoff_max: Upper bound for a single retry delay
+        """
+        self.rate_per_second = max(float(rate_per_second), 0.0)
+        self.burst = max(int(burst) or int(self.rate_per_second + 0.999), 1)
+        self.max_concurrency = max(int(max_concurrency), 0)
+        self.adaptive = adaptive and self.max_concurrency > 0
+        self.min_concurrency = max(min(int(min_concurrency), self.max_concurrency or 1), 1)
+        self.decrease_factor = decrease_factor
+        self.backoff_base = max(float(backoff_base), 0.0)
+        self.backoff_max = max(float(backoff_max), self.backoff_base)
+
+        self._condition = threading.Condition()
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._in_flight = 0
+        self.concurrency_limit = float(self.max_concurrency or 0)
+
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.decreases = 0
+        self.min_limit_seen = self.concurrency_limit
+        self.wait_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the limiter ever delays a request"""
+        return self.rate_per_second > 0 or self.max_concurrency > 1
+
+    def _refill(self, now: float) -> None:
+        if self.rate_per_second > 0:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate_per_second)
+        self._refilled_at = now
+
+    def acquire(self) -> float:
+        """
+        Wait for permission to send one request
+
+        Returns:
+            Time the request was admitted, to be passed back to release()
+        """
+        start = time.monotonic()
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                wait = None
+                if not self.max_concurrency or self._in_flight < int(self.concurrency_limit):
+                    self._refill(now)
+                    if now < self._paused_until:
+                        wait = self._paused_until - now
+                    elif self.rate_per_second > 0 and self._tokens < 1:
+                        wait = (1 - self._tokens) / self.rate_per_second
+                    else:
+                        if self.rate_per_second > 0:
+                            self._tokens -= 1
+                        self._in_flight += 1
+                        self.requests += 1
+                        self.wait_seconds += now - start
+                        return now
+                # Woken early by release() when a slot frees up or the limit changes
+                self._condition.wait(wait)
+
+    def release(self, admitted_at: float, status: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        """
+        Report the outcome of a request admitted by acquire()
+
+        Args:
+            admitted_at: Value returned by acquire()
+            status: HTTP status code, or None if no response was received
+            retry_after: Retry-After delay sent with the response, if any
+        """
+        with self._condition:
+            now = time.monotonic()
+            self._in_flight -= 1
+
+            if retry_after:
+                # Every caller waits out the service's requested pause, not just the one that got the 429
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+            if is_overload_status(status):
+                if status == 429:
+                    self.throttled += 1
+                else:
+                    self.errors += 1
+                # Requests already in flight at the last decrease report the same overload; count it once
+                if self.adaptive and admitted_at >= self._last_decrease:
+                    self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit * self.decrease_factor)
+                    self.min_limit_seen = min(self.min_limit_seen, self.concurrency_limit)
+                    self._last_decrease = now
+                    self.decreases += 1
+            elif self.adaptive and status is not None and status < 400:
+                self.concurrency_limit = min(self.max_concurrency, self.concurrency_limit + 1 / self.concurrency_limit)
+
+            self._condition.notify_all()
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay before retrying a failed request: exponential backoff with full jitter
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            retry_after: Retry-After delay sent by the service, which is always honored
+
+        Returns:
+            Seconds to wait before the next attempt
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get throttling statistics"""
+        with self._condition:
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "errors": self.errors,
+                "decreases": self.decreases,
+                "concurrency_limit": self.concurrency_limit,
+                "min_concurrency_limit": self.min_limit_seen,
+                "wait_seconds": self.wait_seconds
+            }
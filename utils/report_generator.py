@@ -4,10 +4,25 @@ Handles Excel and HTML report generation for GDC automation testing
 """
 
 import os
+import time
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Any, Tuple, Optional
 from .html_report_generator import HTMLReportGenerator
+from .incremental_report_writer import IncrementalReportWriter
+from .excel_writer import resolve_engine, write_workbook, write_split_workbooks
+from .report_history import ReportHistory
+from .timing_recorder import TimingRecorder
+
+# Columns of the unified comparison report
+UNIFIED_COLUMNS = [
+    "Test Key", "Search Term", "Type", "OpenSearch Name", "OpenSearch ID", "OpenSearch Schema",
+    "Legacy Name", "Legacy ID", "Legacy Schema"
+]
+
+# Name fields tried in order when a record has no Full_Name (ICIJ records use Entity_Name/name)
+NAME_FALLBACK_FIELDS = ["Full_Name", "Entity_Name", "name", "First_Name", "Last_Name"]
 
 
 class ReportGenerator:
@@ -16,15 +31,33 @@ class ReportGenerator:
     Can be used by any test case that provides comparison data
     """
     
-    def __init__(self, results_directory: str):
+    def __init__(self, results_directory: str, columnar: bool = True,
+                 html_mode: str = "single", html_shard_rows: int = 5000,
+                 html_compress_payload: bool = True, parquet_directory: Optional[str] = None,
+                 excel_engine: str = "openpyxl", excel_workbooks: int = 1, excel_workers: int = 1):
         """
         Initialize the report generator
         
         Args:
             results_directory: Path to directory where reports will be saved
+            columnar: Build the unified comparison with vectorized DataFrame merges
+                      instead of per-record Python loops
+            html_mode: "single" page, an index page plus shards per "term" or per "rows",
+                       or "virtual" (client-side rendered table)
+            html_shard_rows: Rows per shard page in "rows" mode
+            html_compress_payload: Embed the "virtual" mode payload as gzip+base64 instead of plain JSON
+            parquet_directory: Root of the Parquet report history (default: <results_directory>/history)
+            excel_engine: Workbook engine, "openpyxl" or "xlsxwriter" (constant memory)
+            excel_workbooks: Split the Excel report across this many workbooks
+            excel_workers: Processes writing the split workbooks in parallel
         """
         self.results_directory = results_directory
-        self.html_generator = HTMLReportGenerator()
+        self.columnar = columnar
+        self.html_generator = HTMLReportGenerator(html_mode, html_shard_rows, html_compress_payload)
+        self.history = ReportHistory(parquet_directory or os.path.join(results_directory, "history"))
+        self.excel_engine = resolve_engine(excel_engine)
+        self.excel_workbooks = max(int(excel_workbooks), 1)
+        self.excel_workers = max(int(excel_workers), 1)
         
         # Ensure results directory exists
         os.makedirs(results_directory, exist_ok=True)
@@ -33,7 +66,9 @@ class ReportGenerator:
                                          comparison_data: List[Dict[str, Any]], 
                                          report_name: str = "unified_comparison",
                                          create_excel_sheets: bool = True,
-                                         create_html_report: bool = True) -> Tuple[Optional[str], Optional[str]]:
+                                         create_html_report: bool = True,
+                                         create_parquet: bool = False,
+                                         timings: Optional[TimingRecorder] = None) -> Tuple[Optional[str], Optional[str]]:
         """
         Generate unified comparison reports (Excel and HTML) with the specified format:
         Test Key, Search Term, Type, OpenSearch Name, OpenSearch ID, OpenSearch Schema, Legacy Name, Legacy ID, Legacy Schema
@@ -43,6 +78,9 @@ class ReportGenerator:
             report_name: Base name for the report files
             create_excel_sheets: Whether to create Excel report with separate sheets
             create_html_report: Whether to create HTML report
+            create_parquet: Whether to append the run to the Parquet report history
+            timings: Per-entity request timings to add to the reports (a Timings sheet and section);
+                     the duration of each report phase is recorded into it
             
         Returns:
             Tuple of (excel_filename, html_filename) or (None, None) if no data
@@ -52,147 +90,349 @@ class ReportGenerator:
             return None, None
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        phase_start = time.perf_counter()
         
         # Create unified comparison data
-        unified_data = []
-        
-        for comparison_item in comparison_data:
-            search_term = comparison_item['search_term']
-            entity_type = comparison_item['entity_type']
-            test_key = search_term  # Remove _E and _P suffixes if needed
-            type_label = "Person" if entity_type == "P" else "Entity"
+        if self.columnar:
+            df = self.build_unified_dataframe(comparison_data)
+        else:
+            unified_data = []
             
-            # Get OpenSearch results
-            opensearch_results = comparison_item.get('opensearch_results', {})
-            # Get Legacy GDC results
-            legacy_results = comparison_item.get('legacy_results', {})
+            for comparison_item in comparison_data:
+                unified_data.extend(self.build_unified_rows(comparison_item))
             
-            # Process each source
-            all_sources = set(opensearch_results.keys()) | set(legacy_results.keys())
-            
-            for source in all_sources:
-                opensearch_records = opensearch_results.get(source, [])
-                legacy_records = legacy_results.get(source, [])
-                
-                # Create lookup for matching records
-                legacy_by_id = {record.get("ID", ""): record for record in legacy_records}
-                
-                # Process OpenSearch records
-                for opensearch_record in opensearch_records:
-                    opensearch_id = opensearch_record.get("ID", "")
-                    # For ICIJ records, try multiple name fields
-                    opensearch_name = (opensearch_record.get("Full_Name", "") or 
-                                     opensearch_record.get("Entity_Name", "") or 
-                                     opensearch_record.get("name", "") or
-                                     opensearch_record.get("First_Name", "") or
-                                     opensearch_record.get("Last_Name", ""))
-                    opensearch_schema = source.upper()
-                    
-                    # Find matching legacy record
-                    legacy_record = legacy_by_id.get(opensearch_id)
-                    if legacy_record:
-                        # For ICIJ records, try multiple name fields
-                        legacy_name = (legacy_record.get("Full_Name", "") or 
-                                     legacy_record.get("Entity_Name", "") or 
-                                     legacy_record.get("name", "") or
-                                     legacy_record.get("First_Name", "") or
-                                     legacy_record.get("Last_Name", ""))
-                        legacy_id = legacy_record.get("ID", "")
-                        legacy_schema = source.upper()
-                    else:
-                        legacy_name = ""
-                        legacy_id = ""
-                        legacy_schema = ""
-                    
-                    unified_data.append({
-                        "Test Key": test_key,
-                        "Search Term": search_term,
-                        "Type": type_label,
-                        "OpenSearch Name": opensearch_name,
-                        "OpenSearch ID": opensearch_id,
-                        "OpenSearch Schema": opensearch_schema,
-                        "Legacy Name": legacy_name,
-                        "Legacy ID": legacy_id,
-                        "Legacy Schema": legacy_schema
-                    })
-                
-                # Process legacy-only records (not found in OpenSearch)
-                opensearch_ids = {record.get("ID", "") for record in opensearch_records}
-                for legacy_record in legacy_records:
-                    legacy_id = legacy_record.get("ID", "")
-                    if legacy_id not in opensearch_ids:
-                        # For ICIJ records, try multiple name fields
-                        legacy_name = (legacy_record.get("Full_Name", "") or 
-                                     legacy_record.get("Entity_Name", "") or 
-                                     legacy_record.get("name", "") or
-                                     legacy_record.get("First_Name", "") or
-                                     legacy_record.get("Last_Name", ""))
-                        legacy_schema = source.upper()
-                        
-                        unified_data.append({
-                            "Test Key": test_key,
-                            "Search Term": search_term,
-                            "Type": type_label,
-                            "OpenSearch Name": "",
-                            "OpenSearch ID": "",
-                            "OpenSearch Schema": "",
-                            "Legacy Name": legacy_name,
-                            "Legacy ID": legacy_id,
-                            "Legacy Schema": legacy_schema
-                        })
-        
-        # Create DataFrame
-        df = pd.DataFrame(unified_data)
+            # Create DataFrame
+            df = pd.DataFrame(unified_data, columns=UNIFIED_COLUMNS)
         
         # Sort by Test Key, then by OpenSearch Schema, then by OpenSearch ID
         df = df.sort_values(['Test Key', 'OpenSearch Schema', 'OpenSearch ID'])
+        phase_start = self._record_phase(timings, "build report rows", phase_start)
         
         excel_filename = None
         html_filename = None
         
+        # Append the run to the Parquet history
+        if create_parquet:
+            run_directory = self.history.write_run(df, timestamp)
+            if run_directory:
+                print(f"✅ Parquet history written: {run_directory}")
+            phase_start = self._record_phase(timings, "parquet", phase_start)
+        
         # Generate Excel report with separate sheets for each entity
         if create_excel_sheets:
             excel_filename = os.path.join(self.results_directory, f"{report_name}_{timestamp}.xlsx")
-            
-            # Group data by Test Key (entity name) and create separate sheets
-            with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
-                for test_key in df['Test Key'].unique():
-                    entity_df = df[df['Test Key'] == test_key].copy()
-                    
-                    # Remove 'Test Key' column since it's now the sheet name
-                    entity_df = entity_df.drop(columns=['Test Key'])
-                    
-                    # Truncate sheet name to 31 characters (Excel limit)
-                    sheet_name = test_key[:31] if len(test_key) > 31 else test_key
-                    
-                    # Write to sheet
-                    entity_df.to_excel(writer, sheet_name=sheet_name, index=False)
+            excel_filename = self.write_excel_report(df, excel_filename, self.timing_sheets(timings))
+            phase_start = self._record_phase(timings, "excel", phase_start)
         
         # Generate HTML report
         if create_html_report:
             html_filename = os.path.join(self.results_directory, f"{report_name}_{timestamp}.html")
-            self.html_generator.generate_unified_comparison_report(df, html_filename)
+            self.html_generator.generate_unified_comparison_report(df, html_filename, self.timing_html(timings))
+            self._record_phase(timings, "html", phase_start)
         
         # Print summary
-        self._print_report_summary(df, excel_filename, html_filename, unified_data)
+        self._print_report_summary(df, excel_filename, html_filename)
         
         return excel_filename, html_filename
     
+    def write_excel_report(self, df: pd.DataFrame, excel_filename: str,
+                           extra_sheets: Optional[List[Tuple[str, pd.DataFrame]]] = None) -> str:
+        """
+        Write the unified rows to a workbook with one sheet per Test Key,
+        or split across several workbooks when excel_workbooks > 1
+        
+        Args:
+            df: Sorted unified comparison DataFrame
+            excel_filename: Path of the workbook to write
+            extra_sheets: (sheet name, DataFrame) pairs added after the Test Key sheets (first workbook only)
+            
+        Returns:
+            Path of the (first) workbook written
+        """
+        if self.excel_workbooks == 1:
+            return write_workbook(df, excel_filename, self.excel_engine, extra_sheets)
+        
+        filenames = write_split_workbooks(df, os.path.splitext(excel_filename)[0], self.excel_workbooks,
+                                          self.excel_workers, self.excel_engine, extra_sheets)
+        print(f"📁 Excel report split into {len(filenames)} workbooks:")
+        for filename in filenames:
+            print(f"  {filename}")
+        return filenames[0]
+    
+    @staticmethod
+    def timing_sheets(timings: Optional[TimingRecorder]) -> Optional[List[Tuple[str, pd.DataFrame]]]:
+        """Timing Summary and Timings sheets for the Excel report (None without timings)"""
+        if timings is None or not timings.rows():
+            return None
+        return [("Timing Summary", timings.summary_dataframe()), ("Timings", timings.to_dataframe())]
+    
+    def timing_html(self, timings: Optional[TimingRecorder]) -> str:
+        """Request timing section for the HTML report (empty without timings)"""
+        if timings is None or not timings.rows():
+            return ""
+        return self.html_generator.render_timing_section(timings.summary(), timings.slowest(10), timings.phases)
+    
+    @staticmethod
+    def _record_phase(timings: Optional[TimingRecorder], name: str, phase_start: float) -> float:
+        """Record the time since phase_start as a report phase and return the start of the next phase"""
+        now = time.perf_counter()
+        if timings is not None:
+            timings.add_phase(name, now - phase_start)
+        return now
+    
+    def export_excel_from_history(self, run_timestamp: str,
+                                  report_name: str = "unified_comparison") -> Optional[str]:
+        """
+        Derive the per-entity Excel report of a past run from the Parquet history
+        
+        Args:
+            run_timestamp: Run to export (see ReportHistory.list_runs)
+            report_name: Base name for the workbook
+            
+        Returns:
+            Path of the workbook, or None if the run has no rows
+        """
+        df = self.history.load(runs=[run_timestamp], columns=UNIFIED_COLUMNS)
+        if df.empty:
+            print(f"❌ No Parquet history found for run {run_timestamp}")
+            return None
+        
+        df = df[UNIFIED_COLUMNS].sort_values(['Test Key', 'OpenSearch Schema', 'OpenSearch ID'])
+        excel_filename = os.path.join(self.results_directory, f"{report_name}_{run_timestamp}.xlsx")
+        excel_filename = self.write_excel_report(df, excel_filename)
+        print(f"✅ Excel report generated: {excel_filename}")
+        return excel_filename
+    
+    def build_unified_dataframe(self, comparison_data: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Columnar equivalent of build_unified_rows over all comparison items.
+        Flattens every OpenSearch and legacy record once into column arrays, encodes
+        (comparison item, source, ID) as one integer key and derives present-in-both,
+        OpenSearch-only and legacy-only rows with vectorized index lookups.
+        
+        Args:
+            comparison_data: List of comparison data dictionaries
+            
+        Returns:
+            DataFrame with the unified report columns (unsorted)
+        """
+        opensearch = self._flatten_records(comparison_data, 'opensearch_results')
+        legacy = self._flatten_records(comparison_data, 'legacy_results')
+        opensearch_count = len(opensearch['ID'])
+        
+        # One int64 join key per record, factorized over both sides so equal IDs share a code.
+        # Missing IDs (None/NaN) get a code of their own: the default -1 sentinel would collide
+        # with the last ID of the previous source and match unrelated records
+        id_codes, id_values = pd.factorize(np.concatenate([opensearch['ID'], legacy['ID']]), use_na_sentinel=False)
+        source_codes, source_values = pd.factorize(np.concatenate([opensearch['source'], legacy['source']]))
+        keys = (np.concatenate([opensearch['item'], legacy['item']]) * max(len(source_values), 1)
+                + source_codes) * max(len(id_values), 1) + id_codes
+        opensearch_keys, legacy_keys = keys[:opensearch_count], keys[opensearch_count:]
+        
+        # OpenSearch rows, matched against the last legacy record per key (dict lookup semantics)
+        legacy_index = pd.Index(legacy_keys)
+        last_legacy = pd.Series(np.arange(len(legacy_keys)), index=legacy_index)
+        last_legacy = last_legacy[~legacy_index.duplicated(keep='last')]
+        match_positions = last_legacy.index.get_indexer(opensearch_keys)
+        matched = match_positions >= 0
+        matched_names = None
+        if len(legacy_keys):
+            legacy_rows = last_legacy.to_numpy()[np.where(matched, match_positions, 0)]
+            matched_names = legacy['Name'][legacy_rows]
+        
+        # Legacy-only rows: legacy records whose key is not among the OpenSearch keys
+        legacy_only = ~legacy_index.isin(opensearch_keys)
+        legacy_only_count = int(legacy_only.sum())
+        
+        def blank(count):
+            return np.full(count, "", dtype=object)
+        
+        def where_matched(values):
+            return np.where(matched, values, "") if matched_names is not None else blank(opensearch_count)
+        
+        items = np.concatenate([opensearch['item'], legacy['item'][legacy_only]])
+        search_terms = np.array([comparison_item['search_term'] for comparison_item in comparison_data] or [""], dtype=object)
+        type_labels = np.array(["Person" if comparison_item['entity_type'] == "P" else "Entity"
+                                for comparison_item in comparison_data] or [""], dtype=object)
+        search_term_column = search_terms[items]
+        
+        return pd.DataFrame({
+            "Test Key": search_term_column,  # Remove _E and _P suffixes if needed
+            "Search Term": search_term_column,
+            "Type": type_labels[items],
+            "OpenSearch Name": np.concatenate([opensearch['Name'], blank(legacy_only_count)]),
+            "OpenSearch ID": np.concatenate([opensearch['ID'], blank(legacy_only_count)]),
+            "OpenSearch Schema": np.concatenate([opensearch['Schema'], blank(legacy_only_count)]),
+            "Legacy Name": np.concatenate([where_matched(matched_names), legacy['Name'][legacy_only]]),
+            "Legacy ID": np.concatenate([where_matched(opensearch['ID']), legacy['ID'][legacy_only]]),
+            "Legacy Schema": np.concatenate([where_matched(opensearch['Schema']), legacy['Schema'][legacy_only]])
+        }, columns=UNIFIED_COLUMNS)
+    
+    @staticmethod
+    def _flatten_records(comparison_data: List[Dict[str, Any]], results_key: str) -> Dict[str, np.ndarray]:
+        """
+        Flatten one side of every comparison item into column arrays:
+        item (comparison item index), source, Schema, ID and Name
+        """
+        records = []
+        group_items = []
+        group_sources = []
+        group_sizes = []
+        for item_index, comparison_item in enumerate(comparison_data):
+            for source, source_records in comparison_item.get(results_key, {}).items():
+                records.extend(source_records)
+                group_items.append(item_index)
+                group_sources.append(source)
+                group_sizes.append(len(source_records))
+        
+        # Per-record item and source columns, expanded from one entry per (item, source) group
+        group_sources = np.array(group_sources, dtype=object)
+        return {
+            'item': np.repeat(np.array(group_items, dtype=np.int64), group_sizes),
+            'source': np.repeat(group_sources, group_sizes),
+            'Schema': np.repeat(np.array([source.upper() for source in group_sources], dtype=object), group_sizes),
+            'ID': np.array([record.get("ID", "") for record in records], dtype=object),
+            'Name': ReportGenerator._coalesce_names(records)
+        }
+    
+    @staticmethod
+    def _coalesce_names(records: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Vectorized name fallback chain: first truthy value of NAME_FALLBACK_FIELDS,
+        else the last field's value. Later fields are only read for records still unnamed.
+        """
+        names = np.array([record.get(NAME_FALLBACK_FIELDS[0], "") for record in records], dtype=object)
+        pending = np.flatnonzero(~names.astype(bool))
+        for field in NAME_FALLBACK_FIELDS[1:]:
+            if not pending.size:
+                break
+            values = np.array([records[index].get(field, "") for index in pending], dtype=object)
+            names[pending] = values
+            pending = pending[~values.astype(bool)]
+        return names
+    
+    def build_unified_rows(self, comparison_item: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build the unified report rows for one comparison item:
+        one row per OpenSearch record (matched by ID against legacy) plus one row per legacy-only record
+        
+        Args:
+            comparison_item: Dictionary with search_term, entity_type, opensearch_results and legacy_results
+            
+        Returns:
+            List of row dictionaries with the report columns
+        """
+        unified_data = []
+        
+        search_term = comparison_item['search_term']
+        entity_type = comparison_item['entity_type']
+        test_key = search_term  # Remove _E and _P suffixes if needed
+        type_label = "Person" if entity_type == "P" else "Entity"
+        
+        # Get OpenSearch results
+        opensearch_results = comparison_item.get('opensearch_results', {})
+        # Get Legacy GDC results
+        legacy_results = comparison_item.get('legacy_results', {})
+        
+        # Process each source
+        all_sources = set(opensearch_results.keys()) | set(legacy_results.keys())
+        
+        for source in all_sources:
+            opensearch_records = opensearch_results.get(source, [])
+            legacy_records = legacy_results.get(source, [])
+            
+            # Create lookup for matching records
+            legacy_by_id = {record.get("ID", ""): record for record in legacy_records}
+            
+            # Process OpenSearch records
+            for opensearch_record in opensearch_records:
+                opensearch_id = opensearch_record.get("ID", "")
+                # For ICIJ records, try multiple name fields
+                opensearch_name = (opensearch_record.get("Full_Name", "") or 
+                                 opensearch_record.get("Entity_Name", "") or 
+                                 opensearch_record.get("name", "") or
+                                 opensearch_record.get("First_Name", "") or
+                                 opensearch_record.get("Last_Name", ""))
+                opensearch_schema = source.upper()
+                
+                # Find matching legacy record
+                legacy_record = legacy_by_id.get(opensearch_id)
+                if legacy_record:
+                    # For ICIJ records, try multiple name fields
+                    legacy_name = (legacy_record.get("Full_Name", "") or 
+                                 legacy_record.get("Entity_Name", "") or 
+                                 legacy_record.get("name", "") or
+                                 legacy_record.get("First_Name", "") or
+                                 legacy_record.get("Last_Name", ""))
+                    legacy_id = legacy_record.get("ID", "")
+                    legacy_schema = source.upper()
+                else:
+                    legacy_name = ""
+                    legacy_id = ""
+                    legacy_schema = ""
+                
+                unified_data.append({
+                    "Test Key": test_key,
+                    "Search Term": search_term,
+                    "Type": type_label,
+                    "OpenSearch Name": opensearch_name,
+                    "OpenSearch ID": opensearch_id,
+                    "OpenSearch Schema": opensearch_schema,
+                    "Legacy Name": legacy_name,
+                    "Legacy ID": legacy_id,
+                    "Legacy Schema": legacy_schema
+                })
+            
+            # Process legacy-only records (not found in OpenSearch)
+            opensearch_ids = {record.get("ID", "") for record in opensearch_records}
+            for legacy_record in legacy_records:
+                legacy_id = legacy_record.get("ID", "")
+                if legacy_id not in opensearch_ids:
+                    # For ICIJ records, try multiple name fields
+                    legacy_name = (legacy_record.get("Full_Name", "") or 
+                                 legacy_record.get("Entity_Name", "") or 
+                                 legacy_record.get("name", "") or
+                                 legacy_record.get("First_Name", "") or
+                                 legacy_record.get("Last_Name", ""))
+                    legacy_schema = source.upper()
+                    
+                    unified_data.append({
+                        "Test Key": test_key,
+                        "Search Term": search_term,
+                        "Type": type_label,
+                        "OpenSearch Name": "",
+                        "OpenSearch ID": "",
+                        "OpenSearch Schema": "",
+                        "Legacy Name": legacy_name,
+                        "Legacy ID": legacy_id,
+                        "Legacy Schema": legacy_schema
+                    })
+        
+        return unified_data
+    
     def _print_report_summary(self, df: pd.DataFrame, excel_filename: Optional[str], 
-                            html_filename: Optional[str], unified_data: List[Dict]) -> None:
+                            html_filename: Optional[str]) -> None:
         """Print summary statistics for the generated reports"""
         
+        # Print summary statistics
+        has_opensearch = df['OpenSearch ID'].fillna('').astype(bool)
+        has_legacy = df['Legacy ID'].fillna('').astype(bool)
+        
+        self.print_summary_counts(excel_filename, html_filename, len(df),
+                                  int(has_opensearch.sum()), int(has_legacy.sum()),
+                                  int((has_opensearch & has_legacy).sum()))
+    
+    def print_summary_counts(self, excel_filename: Optional[str], html_filename: Optional[str],
+                             total_records: int, total_opensearch_records: int,
+                             total_legacy_records: int, matched_records: int) -> None:
+        """Print report locations and summary statistics from precomputed counts"""
+        
         if excel_filename:
             print(f"\n✅ Excel report generated: {excel_filename}")
         if html_filename:
             print(f"✅ HTML report generated: {html_filename}")
         
-        print(f"📊 Total comparison records: {len(unified_data)}")
-        
-        # Print summary statistics
-        total_opensearch_records = len([r for r in unified_data if r['OpenSearch ID']])
-        total_legacy_records = len([r for r in unified_data if r['Legacy ID']])
-        matched_records = len([r for r in unified_data if r['OpenSearch ID'] and r['Legacy ID']])
+        print(f"📊 Total comparison records: {total_records}")
         
         print(f"📈 Summary Statistics:")
         print(f"  OpenSearch records: {total_opensearch_records}")
@@ -201,6 +441,25 @@ class ReportGenerator:
         print(f"  OpenSearch-only records: {total_opensearch_records - matched_records}")
         print(f"  Legacy-only records: {total_legacy_records - matched_records}")
     
+    def open_incremental_report(self, 
+                                report_name: str = "unified_comparison",
+                                create_excel_sheets: bool = True,
+                                create_html_report: bool = True,
+                                timings: Optional[TimingRecorder] = None) -> IncrementalReportWriter:
+        """
+        Open a writer that appends each entity's rows to the reports as soon as it completes
+        
+        Args:
+            report_name: Base name for the report files
+            create_excel_sheets: Whether to create Excel report with separate sheets
+            create_html_report: Whether to create HTML report
+            timings: Request timings of the run, added to the reports when the writer is closed
+            
+        Returns:
+            IncrementalReportWriter - call add_item() per entity and close() at the end
+        """
+        return IncrementalReportWriter(self, report_name, create_excel_sheets, create_html_report, timings)
+    
     def generate_entity_specific_report(self, 
                                       entity_name: str,
                                       comparison_data: Dict[str, Any],
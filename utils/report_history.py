@@ -0,0 +1,119 @@
+"""
+Report History Module
+Columnar Parquet history of unified comparison reports, partitioned by run timestamp and schema,
+so comparison results can be queried across runs without opening any workbooks
+"""
+
+import os
+from typing import List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa  # Optional - only needed for Parquet history
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Hive-style partition columns: <directory>/run=<timestamp>/schema=<SCHEMA>/part-0.parquet
+RUN_COLUMN = "run"
+SCHEMA_COLUMN = "schema"
+
+
+class ReportHistory:
+    """
+    Writes each run's unified comparison DataFrame as a partitioned Parquet dataset
+    and loads history back with partition pruning on run and schema.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the report history
+
+        Args:
+            directory: Root directory of the Parquet dataset
+        """
+        self.directory = directory
+
+    @property
+    def available(self) -> bool:
+        """Whether pyarrow is installed"""
+        return pa is not None
+
+    def write_run(self, df: pd.DataFrame, run_timestamp: str) -> Optional[str]:
+        """
+        Write one run's unified rows, one file per schema
+
+        Args:
+            df: Unified comparison DataFrame (report columns)
+            run_timestamp: Run identifier, e.g. the report file timestamp
+
+        Returns:
+            Directory of the run partition, or None if pyarrow is not installed
+        """
+        if not self.available:
+            print("⚠️  Warning: Parquet history requested but pyarrow is not installed, skipping")
+            return None
+
+        # Rows are partitioned by whichever system returned them (legacy-only rows have no OpenSearch schema)
+        schema = df["OpenSearch Schema"].where(df["OpenSearch Schema"] != "", df["Legacy Schema"])
+        table = pa.Table.from_pandas(
+            df.assign(**{SCHEMA_COLUMN: schema.replace("", "NONE")}).fillna("").astype(str),
+            preserve_index=False
+        )
+
+        run_directory = os.path.join(self.directory, f"{RUN_COLUMN}={run_timestamp}")
+        for schema_value in pc.unique(table[SCHEMA_COLUMN]).to_pylist():
+            partition = table.filter(pc.equal(table[SCHEMA_COLUMN], schema_value)).drop_columns([SCHEMA_COLUMN])
+            partition_directory = os.path.join(run_directory, f"{SCHEMA_COLUMN}={schema_value}")
+            os.makedirs(partition_directory, exist_ok=True)
+            pq.write_table(partition, os.path.join(partition_directory, "part-0.parquet"), compression="zstd")
+
+        return run_directory
+
+    def list_runs(self) -> List[str]:
+        """List the run timestamps in the history, oldest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        prefix = f"{RUN_COLUMN}="
+        return sorted(name[len(prefix):] for name in os.listdir(self.directory) if name.startswith(prefix))
+
+    def load(self, runs: Optional[List[str]] = None, schemas: Optional[List[str]] = None,
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load unified rows from the history
+
+        Args:
+            runs: Run timestamps to load (None = all runs)
+            schemas: Schemas to load, e.g. ["WATCH", "PEP"] (None = all schemas)
+            columns: Report columns to read (None = all); run and schema are always included
+
+        Returns:
+            DataFrame of the selected rows with run and schema columns
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not self.available:
+            raise ImportError("pyarrow is required to load Parquet report history (pip install pyarrow)")
+        if not self.list_runs():
+            return pd.DataFrame(columns=(columns or []) + [RUN_COLUMN, SCHEMA_COLUMN])
+
+        dataset = ds.dataset(
+            self.directory, format="parquet",
+            partitioning=ds.partitioning(pa.schema([(RUN_COLUMN, pa.string()), (SCHEMA_COLUMN, pa.string())]),
+                                         flavor="hive")
+        )
+
+        # Filters on partition columns skip whole directories instead of reading them
+        expression = None
+        if runs is not None:
+            expression = ds.field(RUN_COLUMN).isin(runs)
+        if schemas is not None:
+            schema_filter = ds.field(SCHEMA_COLUMN).isin([schema.upper() for schema in schemas])
+            expression = schema_filter if expression is None else expression & schema_filter
+
+        selected = None if columns is None else list(columns) + [RUN_COLUMN, SCHEMA_COLUMN]
+        return dataset.to_table(columns=selected, filter=expression).to_pandas()
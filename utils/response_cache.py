@@ -0,0 +1,205 @@
+"""
+Response Cache Module
+Content-addressed on-disk cache of raw OpenSearch API responses, keyed by endpoint URL and payload
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+# Eviction trims the cache to this share of max_size_mb, so a full cache is walked
+# once per ~10% of growth instead of on every store
+EVICT_LOW_WATER = 0.9
+
+
+class ResponseCache:
+    """
+    On-disk cache of API responses with TTL and size-based eviction
+
+    Modes:
+        normal  - serve fresh entries from disk, fetch and store on a miss
+        offline - serve any stored entry (even if expired), never call the API
+        refresh - always call the API and overwrite stored entries
+    """
+
+    MODES = ("normal", "offline", "refresh")
+
+    def __init__(self, directory: str, ttl_seconds: float = 86400, max_size_mb: float = 512,
+                 mode: str = "normal", enabled: bool = True):
+        """
+        Initialize the response cache
+
+        Args:
+            directory: Directory where cached responses are stored
+            ttl_seconds: Age after which an entry is considered stale (0 = never expires)
+            max_size_mb: Maximum total size of the cache before the oldest entries are evicted
+            mode: One of normal, offline or refresh
+            enabled: When False every lookup is a miss and nothing is stored
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown cache mode '{mode}', expected one of {', '.join(self.MODES)}")
+
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.mode = mode
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._size_bytes = 0
+
+        if self.enabled:
+            os.makedirs(self.directory, exist_ok=True)
+            self._size_bytes = sum(size for _, _, size in self._iter_entries())
+
+    @property
+    def offline(self) -> bool:
+        """Whether the API must not be called"""
+        return self.enabled and self.mode == "offline"
+
+    @staticmethod
+    def make_key(url: str, payload: Dict[str, Any]) -> str:
+        """Build the cache key from the endpoint URL and the full search payload"""
+        canonical = json.dumps({"url": url, "payload": payload}, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path_for_key(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _iter_entries(self):
+        """Yield (path, mtime, size) for every stored entry"""
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_mtime, stat.st_size
+
+    def get(self, url: str, payload: Dict[str, Any]) -> Optional[Any]:
+        """
+        Look up the stored API response for a request
+
+        Args:
+            url: Endpoint URL the payload is sent to
+            payload: Full search payload
+
+        Returns:
+            The raw API response, or None on a miss
+        """
+        if not self.enabled or self.mode == "refresh":
+            return None
+
+        path = self._path_for_key(self.make_key(url, payload))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        expired = self.ttl_seconds and time.time() - entry.get("stored_at", 0) > self.ttl_seconds
+        if expired and self.mode != "offline":
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return entry["response"]
+
+    def put(self, url: str, payload: Dict[str, Any], response: Any) -> None:
+        """
+        Store an API response, evicting old entries if the cache grows too large
+
+        Args:
+            url: Endpoint URL the payload was sent to
+            payload: Full search payload
+            response: Raw API response (already decoded from JSON)
+        """
+        if not self.enabled or self.mode == "offline":
+            return
+
+        path = self._path_for_key(self.make_key(url, payload))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps({
+            "url": url,
+            "payload": payload,
+            "stored_at": time.time(),
+            "response": response
+        }).encode("utf-8")
+
+        # Write atomically so concurrent readers never see a partial entry
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not write response cache entry: {e}")
+            return
+
+        with self._lock:
+            self.stores += 1
+            self._size_bytes += len(data) - previous_size
+            # Writers that crossed the limit together evict once; the others see the reduced size
+            if self._size_bytes > self.max_bytes:
+                self._evict_locked()
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then the oldest entries until the cache is down to
+        EVICT_LOW_WATER of max_size_mb
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._evict_locked()
+
+    def _evict_locked(self) -> int:
+        """evict() for a caller holding the lock"""
+        now = time.time()
+        entries = sorted(self._iter_entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * EVICT_LOW_WATER
+        removed = 0
+
+        for path, mtime, size in entries:
+            expired = self.ttl_seconds and now - mtime > self.ttl_seconds
+            if not expired and total <= target:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        self._size_bytes = total
+        self.evictions += removed
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics"""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "size_mb": self._size_bytes / (1024 * 1024)
+            }
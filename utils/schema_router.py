@@ -0,0 +1,146 @@
+"""
+Schema Router Module
+Maps a hit's OpenSearch index name (or, failing that, its record ID prefix) to the source
+schema it is reported under, with routing tables compiled once from config
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+# Schemas an index can route to; for index names with no exact route and no unambiguous
+# name token, the first schema contained in the name wins (the previous if/elif order)
+ROUTE_SCHEMAS = ("pep", "watch", "sanction", "icij", "mex", "soe", "rights", "col", "media", "ofac")
+
+# Record ID prefixes of the legacy GDC sources, used when the index name gives no schema
+DEFAULT_ID_PREFIX_ROUTES = {"101": "pep", "202": "watch", "901": "soe", "307": "rights", "801": "icij"}
+
+DEFAULT_SCHEMA = "watch"
+
+_TOKEN_SEPARATOR = re.compile(r"[^a-z0-9]+")
+
+# Trie node key holding the schema of the prefix that ends at the node
+_END = ""
+
+
+class SchemaRouter:
+    """
+    Resolves the schema of a search hit.
+
+    Index names resolve, in order, by:
+      1. An exact (case-insensitive) entry in index_routes, which holds index names and aliases
+      2. A single schema named by a token of the index name (split on anything but letters
+         and digits, plural "s" allowed), e.g. gdc-soe-watchlist -> soe, gdc_sanctions_v2 -> sanction
+      3. The first schema of ROUTE_SCHEMAS contained in the name
+    The result per distinct index name is memoized. When the index name gives no schema, the
+    longest matching record ID prefix in id_prefix_routes decides, and then default_schema.
+    """
+
+    def __init__(self, index_routes: Optional[Dict[str, str]] = None, id_prefix_routes: Optional[Dict[str, str]] = None,
+                 default_schema: str = DEFAULT_SCHEMA, cache_size: int = 4096):
+        """
+        Compile the routing tables
+
+        Args:
+            index_routes: Index name or alias -> schema
+            id_prefix_routes: Record ID prefix -> schema (None = DEFAULT_ID_PREFIX_ROUTES)
+            default_schema: Schema of hits that match no route
+            cache_size: Distinct index names whose route is memoized
+        """
+        self.index_routes = {str(name).lower(): schema for name, schema in (index_routes or {}).items()}
+        self.id_prefix_routes = dict(DEFAULT_ID_PREFIX_ROUTES if id_prefix_routes is None else id_prefix_routes)
+        self.default_schema = default_schema
+        self.cache_size = cache_size
+        for schema in list(self.index_routes.values()) + list(self.id_prefix_routes.values()) + [default_schema]:
+            if schema not in ROUTE_SCHEMAS:
+                raise ValueError(f"Unknown schema '{schema}', expected one of {', '.join(ROUTE_SCHEMAS)}")
+
+        self._tokens = {schema: schema for schema in ROUTE_SCHEMAS}
+        self._tokens.update({schema + "s": schema for schema in ROUTE_SCHEMAS if not schema.endswith("s")})
+        self._id_trie: Dict[str, Any] = {}
+        for prefix, schema in self.id_prefix_routes.items():
+            node = self._id_trie
+            for char in str(prefix):
+                node = node.setdefault(char, {})
+            node[_END] = schema
+        self.route_index = lru_cache(maxsize=cache_size)(self._resolve_index)
+
+    @classmethod
+    def from_config(cls, test_config: Dict[str, Any]) -> "SchemaRouter":
+        """
+        Build the router from the test section of the config
+
+        Args:
+            test_config: config.test_config (index_routes, id_prefix_routes, default_schema)
+
+        Returns:
+            Compiled router
+        """
+        return cls(test_config.get("index_routes"), test_config.get("id_prefix_routes"),
+                   test_config.get("default_schema", DEFAULT_SCHEMA))
+
+    def __reduce__(self):
+        # Rebuilt from its tables in worker processes; the memo is not carried over
+        return type(self), (self.index_routes, self.id_prefix_routes, self.default_schema, self.cache_size)
+
+    def _resolve_index(self, index_name: Any) -> Optional[str]:
+        """Uncached route_index"""
+        return None if index_name is None else self.describe(index_name)[0]
+
+    def route_id(self, record_id: Any) -> Optional[str]:
+        """
+        Schema of the longest ID prefix route matching record_id
+
+        Args:
+            record_id: Record ID (non-strings are matched on their str())
+
+        Returns:
+            Schema, or None if no prefix matches
+        """
+        if type(record_id) is not str:
+            record_id = str(record_id)
+        node = self._id_trie
+        schema = None
+        for char in record_id:
+            node = node.get(char)
+            if node is None:
+                break
+            schema = node.get(_END, schema)
+        return schema
+
+    def route(self, index_name: Any, record_id: Any = "") -> str:
+        """
+        Schema of a hit
+
+        Args:
+            index_name: The hit's _index (None if it has none)
+            record_id: The hit's ID, used when the index name gives no schema
+
+        Returns:
+            Schema name (default_schema if nothing matches)
+        """
+        return self.route_index(index_name) or self.route_id(record_id) or self.default_schema
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index route memo hits, misses and size"""
+        info = self.route_index.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "cached_indices": info.currsize}
+
+    def describe(self, index_name: Any) -> Tuple[Optional[str], str]:
+        """
+        Explain how an index name routes (for checking a corpus of index names)
+
+        Args:
+            index_name: Index name
+
+        Returns:
+            (schema or None, "route", "token", "substring" or "none")
+        """
+        name = str(index_name).lower()
+        if name in self.index_routes:
+            return self.index_routes[name], "route"
+        named = {self._tokens[token] for token in _TOKEN_SEPARATOR.split(name) if token in self._tokens}
+        if len(named) == 1:
+            return named.pop(), "token"
+        schema = next((schema for schema in ROUTE_SCHEMAS if schema in name), None)
+        return schema, "substring" if schema else "none"
@@ -0,0 +1,105 @@
+"""
+Search Record Module
+Compact slotted record shared by normalized OpenSearch hits and legacy GDC baseline records,
+readable like the dicts it replaces (get, [], in, keys, items)
+"""
+
+import sys
+from typing import Any, Dict, Iterator, Tuple
+
+
+def intern_value(value: Any) -> Any:
+    """Intern a string that repeats across many records (RecType, schema names); other values pass through"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class SearchRecord:
+    """
+    Normalized search hit.
+
+    Uses __slots__ instead of a per-record dict, and interns the repeated RecType strings.
+    Reads go through the dict-style methods, so report and comparison code can take either
+    records or the plain dicts loaded back from the checkpoint log and fingerprint store.
+    Unknown keys behave like missing dict keys.
+    """
+
+    FIELDS: Tuple[str, ...] = ("recid", "ID", "First_Name", "Last_Name", "Full_Name", "Other_Names", "AltScript", "RecType")
+    _FIELD_SET = frozenset(FIELDS)
+    __slots__ = FIELDS
+
+    def __init__(self, recid: Any = 0, ID: Any = "", First_Name: Any = "", Last_Name: Any = "", Full_Name: Any = "",
+                 Other_Names: Any = "", AltScript: Any = "", RecType: Any = ""):
+        self.recid = recid
+        self.ID = ID
+        self.First_Name = First_Name
+        self.Last_Name = Last_Name
+        self.Full_Name = Full_Name
+        self.Other_Names = Other_Names
+        self.AltScript = AltScript
+        self.RecType = intern_value(RecType)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Field value, or default if the record has no such field"""
+        return getattr(self, key) if key in self._FIELD_SET else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._FIELD_SET
+
+    def keys(self) -> Tuple[str, ...]:
+        """Field names, in the order of the dict this record replaces"""
+        return self.FIELDS
+
+    def values(self) -> Tuple[Any, ...]:
+        """Field values in FIELDS order"""
+        return tuple(getattr(self, key) for key in self.FIELDS)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """(field, value) pairs in FIELDS order"""
+        return zip(self.FIELDS, self.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with the same keys and order as the dict this record replaces"""
+        return dict(self.items())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SearchRecord):
+            return self.FIELDS == other.FIELDS and self.values() == other.values()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{key}={value!r}' for key, value in self.items())})"
+
+    def __reduce__(self):
+        # Positional values pickle smaller and faster than the default slot-state dict
+        return type(self), self.values()
+
+
+class IcijRecord(SearchRecord):
+    """Normalized ICIJ hit, which also carries Entity_Name and Entity_Type"""
+
+    FIELDS = SearchRecord.FIELDS + ("Entity_Name", "Entity_Type")
+    _FIELD_SET = frozenset(FIELDS)
+    __slots__ = ("Entity_Name", "Entity_Type")
+
+    def __init__(self, recid: Any = 0, ID: Any = "", First_Name: Any = "", Last_Name: Any = "", Full_Name: Any = "",
+                 Other_Names: Any = "", AltScript: Any = "", RecType: Any = "ICIJ", Entity_Name: Any = "",
+                 Entity_Type: Any = ""):
+        super().__init__(recid, ID, First_Name, Last_Name, Full_Name, Other_Names, AltScript, RecType)
+        self.Entity_Name = Entity_Name
+        self.Entity_Type = intern_value(Entity_Type)
+
+
+def record_json_default(value: Any) -> Any:
+    """json.dumps default= hook: records become plain dicts, anything else falls back to str()"""
+    if isinstance(value, SearchRecord):
+        return value.to_dict()
+    return str(value)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Local OpenSearch Search API Stub
+Serves recorded responses keyed by payload, or deterministic synthetic search results,
+so the framework can run (and be benchmarked) offline. Understands both the single-query
+payload and the batched {"queries": [...]} payload. Latency, injected errors and response
+size are configurable per run, and every random choice is derived from the payload and its
+attempt number, so a run is reproducible regardless of thread scheduling.
+
+Recordings are read from a response cache directory (see utils/response_cache.py) or a JSONL
+file with one {"payload": {...}, "response": {...}} object per line.
+
+Usage:
+    python utils/stub_server.py --port 8080
+    python utils/stub_server.py --port 8080 --recordings .cache/responses --profile flaky
+    OPENSEARCH_API_URL=http://127.0.0.1:8080/search python testcases/excel_driven_regression_test.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, Optional, Tuple
+
+# Index names and ID prefixes used when generating synthetic hits
+STUB_INDICES = {
+    "pep": ("gdc-pep", "101"),
+    "watch": ("gdc-watch", "202"),
+    "soe": ("gdc-soe", "901"),
+    "rights": ("gdc-rights", "307"),
+    "icij": ("gdc-icij", "801"),
+    "sanction": ("gdc-sanction", "501"),
+    "mex": ("gdc-mex", "601"),
+    "col": ("gdc-col", "701")
+}
+
+# Top-level keys transform_opensearch_response accepts for the hit list
+RESPONSE_SHAPES = ("results", "data", "hits")
+
+# Named profiles: latency, error rate and response size settings passed to StubSearchServer
+STUB_PROFILES = {
+    "instant": {},
+    "realistic": {"latency_ms": 120, "latency_jitter_ms": 80, "query_latency_ms": 15},
+    "flaky": {"latency_ms": 120, "latency_jitter_ms": 80, "query_latency_ms": 15,
+              "error_rate": 0.05, "throttle_rate": 0.05},
+    "large": {"latency_ms": 200, "latency_jitter_ms": 100, "query_latency_ms": 40,
+              "hits_per_query": 100, "padding_bytes": 2048}
+}
+
+
+def payload_key(payload: Dict[str, Any]) -> str:
+    """Canonical key of a single-query payload (the endpoint URL is ignored)"""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
+def load_recordings(path: str) -> Dict[str, Any]:
+    """
+    Load recorded API responses
+
+    Args:
+        path: Response cache directory, or JSONL file of {"payload", "response"} objects
+
+    Returns:
+        Recorded responses keyed by payload_key()
+    """
+    recordings = {}
+    if os.path.isdir(path):
+        for root, _, files in os.walk(path):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(root, name), "r", encoding="utf-8") as f:
+                        entry = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                recordings[payload_key(entry["payload"])] = entry["response"]
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    recordings[payload_key(entry["payload"])] = entry["response"]
+    return recordings
+
+
+class StubSearchServer:
+    """
+    In-process stand-in for the OpenSearch search API
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, hits_per_query: int = 10,
+                 recordings: Optional[str] = None, strict: bool = False, response_shape: str = "results",
+                 latency_ms: float = 0, latency_jitter_ms: float = 0, query_latency_ms: float = 0,
+                 error_rate: float = 0, throttle_rate: float = 0, retry_after: float = 1,
+                 padding_bytes: int = 0, seed: int = 0):
+        """
+        Initialize the stub server
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            hits_per_query: Maximum number of synthetic hits returned per query
+            recordings: Response cache directory or JSONL file of recorded responses to replay
+            strict: Answer 404 for payloads without a recording instead of synthesizing a response
+            response_shape: Top-level key of synthetic hit lists (results, data or hits)
+            latency_ms: Base latency of every request
+            latency_jitter_ms: Extra latency drawn uniformly between 0 and this value
+            query_latency_ms: Extra latency per query, so batched requests take longer
+            error_rate: Fraction of requests answered with 503
+            throttle_rate: Fraction of requests answered with 429 + Retry-After
+            retry_after: Retry-After seconds sent with 429 responses (0 = no header)
+            padding_bytes: Size of a filler field added to every synthetic hit
+            seed: Changes every latency, error and synthetic hit draw
+        """
+        if response_shape not in RESPONSE_SHAPES:
+            raise ValueError(f"Unknown response shape '{response_shape}', expected one of {', '.join(RESPONSE_SHAPES)}")
+
+        self.hits_per_query = hits_per_query
+        self.recordings = load_recordings(recordings) if recordings else {}
+        self.strict = strict
+        self.response_shape = response_shape
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.query_latency_ms = query_latency_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.padding_bytes = padding_bytes
+        self.seed = seed
+
+        self.request_count = 0
+        self.query_count = 0
+        self.replayed = 0
+        self.synthesized = 0
+        self.missing = 0
+        self.errors = 0
+        self.throttled = 0
+        self._attempts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """Search endpoint URL served by this stub"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/search"
+
+    @classmethod
+    def from_profile(cls, profile: str, **overrides: Any) -> "StubSearchServer":
+        """Create a stub with the settings of a named STUB_PROFILES entry, updated by overrides"""
+        if profile not in STUB_PROFILES:
+            raise ValueError(f"Unknown stub profile '{profile}', expected one of {', '.join(STUB_PROFILES)}")
+        return cls(**{**STUB_PROFILES[profile], **overrides})
+
+    def search(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Replay the recorded response of a single-query payload, or build a deterministic one (None = strict miss)"""
+        recorded = self.recordings.get(payload_key(payload))
+        if recorded is not None:
+            with self._lock:
+                self.replayed += 1
+            return recorded
+        if self.strict:
+            with self._lock:
+                self.missing += 1
+            return None
+
+        query = str(payload.get("query", ""))
+        limit = int(payload.get("limit", self.hits_per_query))
+        seed = int(hashlib.sha256(f"{self.seed}|{query}".encode("utf-8")).hexdigest()[:16], 16)
+        rnd = random.Random(seed)
+
+        schemas = [s for s in payload.get("schemas", STUB_INDICES) if s in STUB_INDICES]
+        hits = []
+        for i in range(min(rnd.randint(0, self.hits_per_query), limit)):
+            schema = rnd.choice(schemas) if schemas else "watch"
+            index_name, id_prefix = STUB_INDICES[schema]
+            record_id = f"{id_prefix}{rnd.randint(0, 99999999):08d}"
+            hits.append({
+                "_index": index_name,
+                "_id": record_id,
+                "_source": {
+                    "recid": rnd.randint(1, 9999999),
+                    "ID": record_id,
+                    "Full_Name": f"{query.upper()} {i + 1}",
+                    "Other_Names": "",
+                    "RecType": "ICIJ" if schema == "icij" else ""
+                }
+            })
+            if self.padding_bytes:
+                hits[-1]["_source"]["Notes"] = "x" * self.padding_bytes
+        with self._lock:
+            self.synthesized += 1
+        return {self.response_shape: hits}
+
+    def handle_payload(self, payload: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Dispatch a single or batched payload, applying the latency and error profile
+
+        Returns:
+            (HTTP status, response body)
+        """
+        queries = payload["queries"] if "queries" in payload else [payload]
+        key = payload_key(payload)
+        with self._lock:
+            self.request_count += 1
+            self.query_count += len(queries)
+            attempt = self._attempts.get(key, 0)
+            self._attempts[key] = attempt + 1
+
+        # Seeded by payload and attempt number, so retries of a request see the same sequence every run
+        rnd = random.Random(f"{self.seed}|{attempt}|{key}")
+        delay_ms = self.latency_ms + rnd.uniform(0, self.latency_jitter_ms) + self.query_latency_ms * len(queries)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        draw = rnd.random()
+        if draw < self.throttle_rate:
+            with self._lock:
+                self.throttled += 1
+            return 429, {"message": "Too Many Requests"}
+        if draw < self.throttle_rate + self.error_rate:
+            with self._lock:
+                self.errors += 1
+            return 503, {"message": "Service Unavailable"}
+
+        responses = [self.search(query) for query in queries]
+        if any(response is None for response in responses):
+            return 404, {"message": "No recorded response for payload"}
+        if "queries" in payload:
+            return 200, {"responses": responses}
+        return 200, responses[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request, replay and injected error counts"""
+        with self._lock:
+            return {
+                "requests": self.request_count,
+                "queries": self.query_count,
+                "replayed": self.replayed,
+                "synthesized": self.synthesized,
+                "missing": self.missing,
+                "errors": self.errors,
+                "throttled": self.throttled
+            }
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections open between requests like the real API (Content-Length is always sent);
+            # without Nagle, the separately written headers and body do not wait on a delayed ACK
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError:
+                    self.send_error(400, "Invalid JSON payload")
+                    return
+                status, response = stub.handle_payload(payload)
+                body = json.dumps(response).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if status == 429 and stub.retry_after:
+                    self.send_header("Retry-After", f"{stub.retry_after:g}")
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self) -> "StubSearchServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut down the server"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stub for the OpenSearch search API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--profile", choices=list(STUB_PROFILES), default="instant",
+                        help="Named latency / error / response size profile (options below override it)")
+    parser.add_argument("--hits", type=int, help="Maximum synthetic hits per query")
+    parser.add_argument("--recordings", help="Response cache directory or JSONL file of responses to replay")
+    parser.add_argument("--strict", action="store_true", help="Answer 404 for payloads without a recording")
+    parser.add_argument("--shape", choices=RESPONSE_SHAPES, help="Top-level key of synthetic hit lists")
+    parser.add_argument("--latency-ms", type=float, help="Base latency per request")
+    parser.add_argument("--jitter-ms", type=float, help="Maximum extra random latency per request")
+    parser.add_argument("--query-latency-ms", type=float, help="Extra latency per query in a request")
+    parser.add_argument("--error-rate", type=float, help="Fraction of requests answered with 503")
+    parser.add_argument("--throttle-rate", type=float, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, help="Retry-After seconds sent with 429 responses")
+    parser.add_argument("--padding-bytes", type=int, help="Filler bytes added to every synthetic hit")
+    parser.add_argument("--seed", type=int, help="Seed for latency, error and synthetic hit draws")
+    args = parser.parse_args()
+
+    overrides = {
+        "hits_per_query": args.hits, "recordings": args.recordings, "strict": args.strict or None,
+        "response_shape": args.shape, "latency_ms": args.latency_ms, "latency_jitter_ms": args.jitter_ms,
+        "query_latency_ms": args.query_latency_ms, "error_rate": args.error_rate,
+        "throttle_rate": args.throttle_rate, "retry_after": args.retry_after,
+        "padding_bytes": args.padding_bytes, "seed": args.seed
+    }
+    stub = StubSearchServer.from_profile(args.profile, host=args.host, port=args.port,
+                                         **{name: value for name, value in overrides.items() if value is not None})
+    print(f"🧪 Stub search API listening on {stub.url} (profile: {args.profile}, "
+          f"{len(stub.recordings)} recorded responses, Ctrl+C to stop)")
+    try:
+        stub.httpd.serve_forever()
+    except KeyboardInterrupt:
+        stub.httpd.server_close()
+        print(f"📊 Stub stats: {stub.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
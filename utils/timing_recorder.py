@@ -0,0 +1,138 @@
+"""
+Timing Recorder Module
+Collects per-entity latency measurements (connect, time to first byte, request, fetch,
+transform, compare, payload size, hit counts) and report phase durations, and summarizes
+them as p50/p90/p99 percentiles
+"""
+
+import math
+import threading
+from typing import Dict, Any, List, Optional
+
+import pandas as pd
+
+# Per-entity timing row columns, in report order
+TIMING_COLUMNS = [
+    "Search Term", "Type", "Cached", "Attempts", "Batch Size", "Connect ms", "TTFB ms", "Request ms",
+    "Fetch ms", "Transform ms", "Compare ms", "Response Bytes", "OpenSearch Hits", "Legacy Hits"
+]
+
+# Columns summarized with percentiles
+SUMMARY_METRICS = [
+    "Fetch ms", "Connect ms", "TTFB ms", "Request ms", "Transform ms", "Compare ms",
+    "Response Bytes", "OpenSearch Hits", "Legacy Hits"
+]
+
+PERCENTILES = (50, 90, 99)
+
+# update() keyword -> column, e.g. ttfb_ms -> "TTFB ms"
+FIELD_COLUMNS = {column.lower().replace(" ", "_"): column for column in TIMING_COLUMNS}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of an ascending list
+
+    Args:
+        sorted_values: Non-empty list sorted ascending
+        q: Percentile between 0 and 100
+
+    Returns:
+        Smallest value with at least q percent of the values at or below it
+    """
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class TimingRecorder:
+    """
+    Thread-safe collector of one timing row per entity, filled in by the fetch and compare
+    stages as they run, plus the durations of the report phases
+    """
+
+    def __init__(self):
+        """Initialize an empty recorder"""
+        self._lock = threading.Lock()
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self.phases: Dict[str, float] = {}
+
+    def update(self, term: Any, entity_type: Any, **fields: Any) -> None:
+        """
+        Merge measurements into an entity's timing row
+
+        Args:
+            term: Search term
+            entity_type: Entity type (P or E)
+            **fields: Values keyed by TIMING_COLUMNS name with spaces as underscores,
+                e.g. fetch_ms=12.5, response_bytes=2048
+        """
+        key = f"{entity_type}|{term}"
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = {"Search Term": term, "Type": entity_type}
+            for name, value in fields.items():
+                row[FIELD_COLUMNS[name]] = value
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        """Record the duration of a run phase, e.g. the Excel or HTML report"""
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Timing rows in the order entities were first measured"""
+        with self._lock:
+            return [dict(row) for row in self._rows.values()]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Timing rows as a DataFrame with TIMING_COLUMNS"""
+        return pd.DataFrame(self.rows(), columns=TIMING_COLUMNS)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Percentile summary of every measured metric
+
+        Returns:
+            One dict per metric with Metric, Count, p50, p90, p99 and Max (metrics without values are left out)
+        """
+        rows = self.rows()
+        summary = []
+        for metric in SUMMARY_METRICS:
+            values = sorted(row[metric] for row in rows if row.get(metric) is not None)
+            if not values:
+                continue
+            entry = {"Metric": metric, "Count": len(values)}
+            for q in PERCENTILES:
+                entry[f"p{q}"] = percentile(values, q)
+            entry["Max"] = values[-1]
+            summary.append(entry)
+        return summary
+
+    def summary_dataframe(self) -> pd.DataFrame:
+        """Percentile summary as a DataFrame"""
+        return pd.DataFrame(self.summary(), columns=["Metric", "Count"] + [f"p{q}" for q in PERCENTILES] + ["Max"])
+
+    def slowest(self, count: int = 5, metric: str = "Fetch ms") -> List[Dict[str, Any]]:
+        """The count entities with the highest value of metric"""
+        rows = [row for row in self.rows() if row.get(metric) is not None]
+        return sorted(rows, key=lambda row: row[metric], reverse=True)[:count]
+
+    def print_summary(self) -> None:
+        """Print the percentile table, the slowest entities and the report phases"""
+        summary = self.summary()
+        if summary:
+            print(f"\n⏱️  Timings over {len(self.rows())} entities:")
+            print(f"   {'Metric':<16} {'Count':>6} " + " ".join(f"{'p' + str(q):>9}" for q in PERCENTILES) + f" {'Max':>9}")
+            for entry in summary:
+                print(f"   {entry['Metric']:<16} {entry['Count']:>6} "
+                      + " ".join(f"{entry['p' + str(q)]:>9.1f}" for q in PERCENTILES) + f" {entry['Max']:>9.1f}")
+            slowest = self.slowest()
+            if slowest:
+                print("   Slowest fetches: " + ", ".join(f"{row['Search Term']} ({row['Fetch ms']:.0f} ms)" for row in slowest))
+        if self.phases:
+            print("   Run phases: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.phases.items()))
+
+
+def milliseconds(seconds: Optional[float]) -> Optional[float]:
+    """Convert seconds to rounded milliseconds (None stays None)"""
+    return None if seconds is None else round(seconds * 1000, 3)